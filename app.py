@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from flask import Flask, request, jsonify, send_from_directory, make_response
+from flask import Flask, request, jsonify, send_from_directory, make_response, Response, stream_with_context
 from flask_cors import CORS
 import os
 import traceback
@@ -11,22 +11,64 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import json
 import uuid
+import importlib
+import queue
 from dotenv import load_dotenv
 
 # Load environment variables from env.local file
 load_dotenv('env.local')
 
-from url_extractor import OptimizedNewsExtractor
-from nongbuxx_generator import NongbuxxGenerator
-from x_publisher import XPublisher
-from scheduler_service import get_scheduler
-from x_crawler import get_crawler
+from content_cache import get_content_cache, get_extraction_cache, get_generation_dedup_index, normalize_url
+from job_executor import get_job_executor, JobQueueFullError
+from job_store import get_job_store
+from single_flight import get_generation_flight
+from generator_pool import get_generator_pool
+from http_client import get_http_client
+from browser_pool import get_browser_pool_stats
+from llm_gateway import get_llm_gateway
+from completion_cache import get_completion_cache_stats
 import asyncio
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 무거운 선택 의존성(tweepy, APScheduler, LLM SDK, selenium)은 해당 기능이 처음 사용될 때 로드
+# gunicorn --preload 와 WARM_START=true 를 함께 쓰면 마스터에서 미리 로드해 워커가 공유
+WARM_START_MODULES = (
+    'anthropic',
+    'openai',
+    'nongbuxx_generator',
+    'url_extractor',
+    'x_publisher',
+    'x_crawler',
+    'scheduler_service',
+)
+
+def get_scheduler():
+    """X 크롤러 스케줄러 (APScheduler는 첫 사용 시 로드)"""
+    from scheduler_service import get_scheduler as load_scheduler
+    return load_scheduler()
+
+def get_crawler():
+    """X 크롤러 (tweepy / LLM SDK는 첫 사용 시 로드)"""
+    from x_crawler import get_crawler as load_crawler
+    return load_crawler()
+
+def warm_up():
+    """
+    무거운 모듈 미리 로드 (gunicorn --preload 마스터에서 한 번만 실행)
+    
+    모듈 import만 수행하고 스레드를 시작하는 객체(스케줄러, 작업 실행기 등)는 만들지 않는다.
+    """
+    start_time = time.time()
+    for module_name in WARM_START_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            logger.warning(f"⚠️ 사전 로드 실패 ({module_name}): {e}")
+    logger.info(f"🔥 사전 로드 완료: {len(WARM_START_MODULES)}개 모듈 ({time.time() - start_time:.2f}초)")
+
 # Initialize Flask app (API only - no static file serving)
 app = Flask(__name__)
 
@@ -50,56 +92,113 @@ app.config['UPLOAD_FOLDER'] = 'uploads'
 os.makedirs('uploads', exist_ok=True)
 os.makedirs('generated_content', exist_ok=True)
 
-# Store active jobs in memory (for production, use Redis or database)
-active_jobs = {}
+# 작업 상태 저장소 (워커 공유 SQLite, 완료 작업은 보존 기간 후 자동 정리)
+job_store = get_job_store()
 
-# 🚀 성능 최적화: 메모리 캐싱 시스템
-content_cache = {}  # URL별 생성된 콘텐츠 캐싱
-cache_expiry = {}   # 캐시 만료 시간 관리
+# 🚀 성능 최적화: API 키별로 초기화된 생성기 재사용 (SDK 클라이언트 연결 유지)
+generator_pool = get_generator_pool()
 
-# 캐싱 헬퍼 함수들
-def normalize_url(url):
-    """URL 정규화 (캐싱 키 생성용)"""
-    import re
-    # 쿼리 파라미터 제거, 슬래시 정규화
-    url = re.sub(r'\?.*$', '', url)
-    url = url.rstrip('/')
-    return url.lower()
+# 🚀 성능 최적화: URL별 생성된 콘텐츠 캐시 (프로세스 내 LRU + 워커 공유 디스크 저장소)
+content_cache = get_content_cache()
 
+# 🔥 워밍 스타트: gunicorn --preload 마스터에서 무거운 모듈을 미리 로드
+if os.getenv('WARM_START', 'False').lower() == 'true':
+    warm_up()
+
+# 캐싱 헬퍼 함수들
 def get_cache_key(url, content_type):
     """캐시 키 생성"""
     return f"{normalize_url(url)}:{content_type}"
 
-def is_cache_valid(cache_key):
-    """캐시 유효성 확인 (30분 유효)"""
-    if cache_key not in cache_expiry:
-        return False
-    return time.time() < cache_expiry[cache_key]
-
 def get_cached_content(url, content_type):
-    """캐시된 콘텐츠 조회"""
-    cache_key = get_cache_key(url, content_type)
-    if cache_key in content_cache and is_cache_valid(cache_key):
+    """캐시된 콘텐츠 조회 (만료 여부는 조회 시점에 확인)"""
+    cached = content_cache.get(get_cache_key(url, content_type))
+    if cached is not None:
         logger.info(f"🚀 캐시 히트: {url} (타입: {content_type})")
-        return content_cache[cache_key]
-    return None
+    return cached
 
 def set_cached_content(url, content_type, content):
     """콘텐츠 캐싱"""
-    cache_key = get_cache_key(url, content_type)
-    content_cache[cache_key] = content
-    cache_expiry[cache_key] = time.time() + 1800  # 30분 후 만료
-    logger.info(f"💾 캐시 저장: {url} (타입: {content_type})")
+    if content_cache.set(get_cache_key(url, content_type), content):
+        logger.info(f"💾 캐시 저장: {url} (타입: {content_type})")
 
 def cleanup_expired_cache():
     """만료된 캐시 정리"""
-    current_time = time.time()
-    expired_keys = [k for k, exp_time in cache_expiry.items() if current_time > exp_time]
-    for key in expired_keys:
-        content_cache.pop(key, None)
-        cache_expiry.pop(key, None)
-    if expired_keys:
-        logger.info(f"🧹 만료된 캐시 {len(expired_keys)}개 정리 완료")
+    expired_count = content_cache.purge_expired()
+    if expired_count:
+        logger.info(f"🧹 만료된 캐시 {expired_count}개 정리 완료")
+
+# 작업 상태 헬퍼 함수들 (요청 스레드와 백그라운드 작업 스레드가 함께 접근)
+STAGE_PROGRESS = {
+    'queued': 0,
+    'extracting': 25,
+    'converting': 50,
+    'saving': 90
+}
+
+def create_job(job_id, **fields):
+    """작업 등록 (대기 상태로 시작)"""
+    job_store.create(job_id, {
+        'status': 'in_progress',
+        'stage': 'queued',
+        'started_at': datetime.now().isoformat(),
+        'progress': 0,
+        'url_progress': {},
+        **fields
+    })
+
+def update_job(job_id, **fields):
+    """작업 정보 갱신"""
+    job_store.update(job_id, **fields)
+
+def get_job_snapshot(job_id):
+    """작업 정보 조회 (결과 본문은 저장된 파일에서 채워서 반환)"""
+    return job_store.get(job_id)
+
+def make_progress_callback(job_id):
+    """생성기 진행 상황 이벤트를 작업 저장소에 반영하는 콜백 생성"""
+    def on_progress(event, url, **info):
+        def apply(job):
+            url_progress = job.setdefault('url_progress', {})
+            if event == 'start':
+                url_progress[url] = 'started'
+            elif event == 'complete':
+                url_progress[url] = 'completed' if info.get('success') else 'failed'
+            elif info.get('stage'):
+                stage = info['stage']
+                url_progress[url] = stage
+                # 단일 작업은 단계별 진행률, 배치는 완료 URL 수 기준 진행률 사용
+                if job.get('type') != 'batch':
+                    job['stage'] = stage
+                    job['progress'] = max(job['progress'], STAGE_PROGRESS.get(stage, 0))
+        job_store.mutate(job_id, apply)
+    return on_progress
+
+def job_queue_full_response(job_id, error):
+    """작업 대기열 초과 시 등록한 작업을 지우고 503 응답 반환"""
+    job_store.delete(job_id)
+    logger.warning(f"⚠️ 작업 대기열 초과로 거절: {job_id}")
+    return jsonify({
+        'success': False,
+        'error': str(error),
+        'code': 'JOB_QUEUE_FULL'
+    }), 503
+
+def submit_background_job(job_id, job_fn, params):
+    """작업을 백그라운드 워커 풀에 제출하고 202 응답 반환"""
+    try:
+        get_job_executor().submit(job_id, job_fn, params)
+    except JobQueueFullError as e:
+        return job_queue_full_response(job_id, e)
+    
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': 'in_progress',
+        'status_url': f'/api/status/{job_id}',
+        'results_url': f'/api/jobs/{job_id}/results',
+        'message': '작업이 등록되었습니다. 상태 API로 진행 상황을 확인하세요.'
+    }), 202
 
 
 # 기본 라우트들
@@ -277,8 +376,16 @@ def generate_content():
         "api_key": "sk-...",         // required: user's API key
         "filename": "custom_name",    // optional
         "save_intermediate": true,    // optional
-        "content_type": "standard"    // optional: 'standard' or 'blog'
+        "content_type": "standard",   // optional: 'standard' or 'blog'
+        "async": false,               // optional: true면 job_id를 즉시 반환(202)하고 백그라운드에서 처리
+        "stream": false               // optional: true면 생성 중인 텍스트를 Server-Sent Events 로 전송
     }
+    
+    Stream Events ("stream": true):
+        start  - {"job_id"}
+        delta  - {"text"} (모델 응답을 줄 단위로 정리한 미리보기, 도착 순서대로)
+        result - 스트리밍하지 않을 때의 응답 본문과 동일 ({"success", "job_id", "data", ...})
+        error  - {"success": false, "job_id", "error", "code"}
     """
     if request.method == 'OPTIONS':
         response = jsonify({})
@@ -361,129 +468,265 @@ def generate_content():
         
         # 작업 ID 생성
         job_id = str(uuid.uuid4())
-        active_jobs[job_id] = {
-            'status': 'processing',
-            'url': url,
-            'content_type': content_type,
-            'started_at': datetime.now().isoformat(),
-            'progress': 0
-        }
+        create_job(job_id, url=url, content_type=content_type)
         
         logger.info(f"Starting content generation for URL: {url} (Job ID: {job_id}, Type: {content_type})")
         
         # 🚀 캐시 확인 (즉시 응답 가능)
         cached_result = get_cached_content(url, content_type)
         if cached_result:
-            active_jobs[job_id].update({
-                'status': 'completed',
-                'progress': 100,
-                'completed_at': datetime.now().isoformat(),
-                'cached': True
-            })
-            return jsonify({
+            update_job(
+                job_id,
+                status='completed',
+                stage='completed',
+                progress=100,
+                completed_at=datetime.now().isoformat(),
+                cached=True,
+                data=cached_result
+            )
+            payload = {
                 'success': True,
                 'job_id': job_id,
                 'data': cached_result,
                 'cached': True,
                 'message': '캐시된 결과를 즉시 반환했습니다.'
-            })
-        
-        # NONGBUXX 생성기 초기화 (사용자 제공 API 키 사용)
-        generator = NongbuxxGenerator(
-            api_provider=api_provider,
-            api_key=api_key,
-            save_intermediate=save_intermediate
-        )
+            }
+            if data.get('stream', False):
+                return sse_response(iter([
+                    format_sse_event('start', {'job_id': job_id}),
+                    format_sse_event('result', payload)
+                ]))
+            return jsonify(payload)
+        
+        params = {
+            'url': url,
+            'api_provider': api_provider,
+            'api_key': api_key,
+            'filename': custom_filename,
+            'save_intermediate': save_intermediate,
+            'content_type': content_type
+        }
         
-        # 진행 상황 업데이트
-        active_jobs[job_id]['progress'] = 25
-        active_jobs[job_id]['status'] = 'extracting'
+        # 비동기 모드: 작업을 워커 풀에 넘기고 즉시 응답
+        if data.get('async', False):
+            return submit_background_job(job_id, run_generate_job, params)
         
-        # 콘텐츠 생성 (콘텐츠 타입 전달)
-        result = generator.generate_content(url, custom_filename, content_type)
+        # 스트리밍 모드: 비동기 모드와 같은 워커 풀에서 생성하고, 생성 중인 텍스트를 SSE 로 전송
+        if data.get('stream', False):
+            events = queue.Queue()
+            try:
+                get_job_executor().submit(job_id, run_stream_job, params, events)
+            except JobQueueFullError as e:
+                return job_queue_full_response(job_id, e)
+            return sse_response(stream_job_events(job_id, events))
         
-        # 정리
-        generator.cleanup()
+        payload, status_code = run_generate_job(job_id, params)
+        return jsonify(payload), status_code
+            
+    except Exception as e:
+        logger.error(f"Content generation error: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': 'Internal server error',
+            'code': 'INTERNAL_ERROR'
+        }), 500
+
+def run_generate_job(job_id, params):
+    """
+    단일 URL 콘텐츠 생성 작업 실행 (요청 스레드 또는 백그라운드 워커에서 호출)
+    
+    같은 URL/콘텐츠 타입의 생성이 이미 진행 중이면 새로 생성하지 않고 그 결과를 공유받는다.
+    
+    Returns:
+        tuple: (응답 payload, HTTP 상태 코드)
+    """
+    url = params['url']
+    content_type = params['content_type']
+    
+    def lookup_cached():
+        # 다른 워커가 같은 요청을 완료했는지 공유 캐시에서 확인
+        cached = get_cached_content(url, content_type)
+        return {'success': True, 'data': cached} if cached else None
+    
+    try:
+        outcome, coalesced = get_generation_flight().do(
+            get_cache_key(url, content_type),
+            lambda: _generate_single_content(job_id, params),
+            lookup=lookup_cached,
+            on_wait=lambda: update_job(job_id, stage='waiting', progress=10),
+            # 실패(잘못된 API 키, 사용량 초과 등)는 요청자마다 다를 수 있으므로 성공 결과만 공유
+            is_shareable=lambda outcome: outcome['success']
+        )
         
-        if result['success']:
-            # 생성된 파일 읽기
-            with open(result['output_file'], 'r', encoding='utf-8') as f:
-                content = f.read()
+        if outcome['success']:
+            response_data = outcome['data']
             
             # 작업 완료 처리
-            active_jobs[job_id].update({
-                'status': 'completed',
-                'progress': 100,
-                'completed_at': datetime.now().isoformat(),
-                'output_file': str(result['output_file']),
-                'title': result['title'],
-                'content_type': result['content_type']
-            })
-            
-            logger.info(f"Content generation completed for job {job_id} (Type: {content_type})")
+            update_job(
+                job_id,
+                status='completed',
+                stage='completed',
+                progress=100,
+                completed_at=datetime.now().isoformat(),
+                output_file=response_data['output_file'],
+                title=response_data['title'],
+                content_type=response_data['content_type'],
+                url_progress={url: 'completed'},
+                coalesced=coalesced,
+                data=response_data
+            )
             
-            # 🚀 결과 캐싱 저장
-            response_data = {
-                'title': result['title'],
-                'content': content,
-                'output_file': str(result['output_file']),
-                'timestamp': result['timestamp'],
-                'url': url,
-                'api_provider': api_provider,
-                'content_type': result['content_type']
-            }
-            set_cached_content(url, content_type, response_data)
+            logger.info(f"Content generation completed for job {job_id} (Type: {content_type}, coalesced: {coalesced})")
             
-            return jsonify({
+            return {
                 'success': True,
                 'job_id': job_id,
                 'data': response_data,
-                'cached': False
-            })
+                'cached': False,
+                'coalesced': coalesced
+            }, 200
+        
+        # 에러 메시지에 따라 적절한 HTTP 상태 코드 반환
+        error_msg = outcome['error']
+        if '차단' in error_msg or '403' in error_msg:
+            # 웹사이트에서 접근을 차단한 경우
+            error_code, status_code = 'ACCESS_BLOCKED', 403
+        elif '찾을 수 없습니다' in error_msg or '404' in error_msg:
+            # 페이지를 찾을 수 없는 경우
+            error_code, status_code = 'PAGE_NOT_FOUND', 404
         else:
-            # 작업 실패 처리
-            active_jobs[job_id].update({
-                'status': 'failed',
-                'error': result['error'],
-                'completed_at': datetime.now().isoformat()
-            })
-            
-            logger.error(f"Content generation failed for job {job_id}: {result['error']}")
-            
-            # 에러 메시지에 따라 적절한 HTTP 상태 코드 반환
-            error_msg = result['error']
-            if '차단' in error_msg or '403' in error_msg:
-                # 웹사이트에서 접근을 차단한 경우
-                return jsonify({
-                    'success': False,
-                    'job_id': job_id,
-                    'error': error_msg,
-                    'code': 'ACCESS_BLOCKED'
-                }), 403
-            elif '찾을 수 없습니다' in error_msg or '404' in error_msg:
-                # 페이지를 찾을 수 없는 경우
-                return jsonify({
-                    'success': False,
-                    'job_id': job_id,
-                    'error': error_msg,
-                    'code': 'PAGE_NOT_FOUND'
-                }), 404
-            else:
-                # 기타 오류
-                return jsonify({
-                    'success': False,
-                    'job_id': job_id,
-                    'error': error_msg,
-                    'code': 'GENERATION_FAILED'
-            }), 500
-            
+            # 기타 오류
+            error_code, status_code = 'GENERATION_FAILED', 500
+        
+        # 작업 실패 처리
+        update_job(
+            job_id,
+            status='failed',
+            stage='failed',
+            error=error_msg,
+            code=error_code,
+            url_progress={url: 'failed'},
+            completed_at=datetime.now().isoformat()
+        )
+        
+        logger.error(f"Content generation failed for job {job_id}: {error_msg}")
+        
+        return {
+            'success': False,
+            'job_id': job_id,
+            'error': error_msg,
+            'code': error_code
+        }, status_code
+        
     except Exception as e:
-        logger.error(f"Content generation error: {str(e)}")
-        return jsonify({
+        logger.error(f"Content generation error (Job ID: {job_id}): {str(e)}")
+        update_job(
+            job_id,
+            status='failed',
+            stage='failed',
+            error='Internal server error',
+            code='INTERNAL_ERROR',
+            completed_at=datetime.now().isoformat()
+        )
+        return {
             'success': False,
+            'job_id': job_id,
             'error': 'Internal server error',
             'code': 'INTERNAL_ERROR'
-        }), 500
+        }, 500
+
+def run_stream_job(job_id, params, events):
+    """
+    스트리밍 요청의 단일 URL 콘텐츠 생성 (백그라운드 워커 풀에서 실행)
+    
+    모델 응답은 줄 단위로 정리해 delta 이벤트로, 마지막에는 run_generate_job 의 응답 payload
+    (정리가 끝난 최종 콘텐츠)를 result/error 이벤트로 events 큐에 넣는다.
+    """
+    def on_delta(text):
+        events.put(('delta', {'text': text}))
+    
+    try:
+        payload, _ = run_generate_job(job_id, {**params, 'on_delta': on_delta})
+    except Exception as e:
+        logger.error(f"Content stream error (Job ID: {job_id}): {str(e)}")
+        payload = {
+            'success': False,
+            'job_id': job_id,
+            'error': 'Internal server error',
+            'code': 'INTERNAL_ERROR'
+        }
+    events.put(('result' if payload['success'] else 'error', payload))
+
+def stream_job_events(job_id, events):
+    """
+    run_stream_job 이 넣는 이벤트를 SSE 로 전달 (제너레이터)
+    
+    클라이언트 연결이 끊겨도 생성은 끝까지 진행되어 결과가 캐시된다.
+    """
+    yield format_sse_event('start', {'job_id': job_id})
+    while True:
+        try:
+            event, payload = events.get(timeout=15)
+        except queue.Empty:
+            # 작업 대기/응답 대기 중 프록시가 연결을 끊지 않도록 주석 이벤트 전송
+            yield ": keep-alive\n\n"
+            continue
+        yield format_sse_event(event, payload)
+        if event != 'delta':
+            break
+
+def _generate_single_content(job_id, params):
+    """
+    실제 콘텐츠 생성 + 결과 캐싱 (요청 병합 시 대표 요청에서만 실행)
+    
+    Returns:
+        dict: {'success': True, 'data': 응답 데이터} 또는 {'success': False, 'error': 메시지}
+    """
+    url = params['url']
+    content_type = params['content_type']
+    
+    # NONGBUXX 생성기 대여 (같은 API 키로 초기화된 생성기 재사용)
+    with generator_pool.lease(
+        api_provider=params['api_provider'],
+        api_key=params['api_key'],
+        save_intermediate=params['save_intermediate']
+    ) as generator:
+        generator.progress_callback = make_progress_callback(job_id)
+        
+        # 진행 상황 업데이트
+        update_job(job_id, stage='extracting', progress=10)
+        
+        # 콘텐츠 생성 (콘텐츠 타입 전달, 스트리밍 요청이면 모델 응답을 on_delta 로 전달)
+        on_delta = params.get('on_delta')
+        if on_delta and generator.converter is not None:
+            with generator.converter.streaming(on_delta):
+                result = generator.generate_content(url, params.get('filename'), content_type)
+        else:
+            result = generator.generate_content(url, params.get('filename'), content_type)
+    
+    if not result['success']:
+        return {'success': False, 'error': result['error']}
+    
+    # 생성된 파일 읽기
+    with open(result['output_file'], 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # 🚀 결과 캐싱 저장
+    response_data = {
+        'title': result['title'],
+        'content': content,
+        'output_file': str(result['output_file']),
+        'timestamp': result['timestamp'],
+        'url': url,
+        'api_provider': params['api_provider'],
+        'content_type': result['content_type']
+    }
+    if result.get('deduplicated_from'):
+        # 다른 URL로 생성된 같은 기사의 결과를 재사용한 경우
+        response_data['deduplicated_from'] = result['deduplicated_from']
+    set_cached_content(url, content_type, response_data)
+    
+    return {'success': True, 'data': response_data}
 
 @app.route('/api/publish/x', methods=['POST', 'OPTIONS'])
 def publish_to_x():
@@ -516,7 +759,8 @@ def publish_to_x():
         # 옵션 파라미터
         publish_as_thread = data.get('publish_as_thread', False)
         
-        # X Publisher 초기화
+        # X Publisher 초기화 (tweepy는 첫 사용 시 로드)
+        from x_publisher import XPublisher
         publisher = XPublisher(
             consumer_key=consumer_key,
             consumer_secret=consumer_secret,
@@ -588,7 +832,8 @@ def validate_x_credentials():
                     'code': 'MISSING_FIELD'
                 }), 400
         
-        # X Publisher 초기화
+        # X Publisher 초기화 (tweepy는 첫 사용 시 로드)
+        from x_publisher import XPublisher
         publisher = XPublisher(
             consumer_key=data['consumer_key'],
             consumer_secret=data['consumer_secret'],
@@ -629,36 +874,75 @@ def validate_x_credentials():
 
 @app.route('/api/status/<job_id>', methods=['GET'])
 def get_job_status(job_id):
-    """작업 상태 조회"""
-    if job_id not in active_jobs:
+    """작업 상태 조회 (단계, URL별 진행 상황, 완료 시 결과 포함)"""
+    job_info = get_job_snapshot(job_id)
+    if job_info is None:
         return jsonify({
             'success': False,
             'error': 'Job not found',
             'code': 'JOB_NOT_FOUND'
         }), 404
     
-    job_info = active_jobs[job_id]
-    return jsonify({
+    response = {
         'success': True,
         'job_id': job_id,
         'status': job_info['status'],
+        'stage': job_info.get('stage'),
         'progress': job_info['progress'],
         'started_at': job_info['started_at'],
         'completed_at': job_info.get('completed_at'),
-        'error': job_info.get('error')
+        'error': job_info.get('error'),
+        'url_progress': job_info.get('url_progress', {})
+    }
+    if job_info.get('type') == 'batch':
+        response['completed_count'] = job_info.get('completed_count', 0)
+        response['total_count'] = job_info.get('total_count', len(job_info.get('urls', [])))
+    if job_info.get('code'):
+        response['code'] = job_info['code']
+    if job_info['status'] == 'completed' and 'data' in job_info:
+        response['data'] = job_info['data']
+    
+    return jsonify(response)
+
+@app.route('/api/jobs/<job_id>/results', methods=['GET'])
+def get_job_results(job_id):
+    """작업의 현재까지 완료된 결과 조회 (배치 작업 진행 중 부분 결과 포함)"""
+    job_info = get_job_snapshot(job_id)
+    if job_info is None:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found',
+            'code': 'JOB_NOT_FOUND'
+        }), 404
+    
+    if job_info.get('type') == 'batch':
+        results = sorted(job_info.get('partial_results', []), key=lambda r: r['index'])
+        total_count = job_info.get('total_count', len(job_info.get('urls', [])))
+    else:
+        results = [job_info['data']] if 'data' in job_info else []
+        total_count = 1
+    
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': job_info['status'],
+        'progress': job_info['progress'],
+        'completed_count': len(results),
+        'total_count': total_count,
+        'results': results
     })
 
 @app.route('/api/download/<job_id>', methods=['GET'])
 def download_file(job_id):
     """생성된 파일 다운로드"""
-    if job_id not in active_jobs:
+    job_info = get_job_snapshot(job_id)
+    if job_info is None:
         return jsonify({
             'success': False,
             'error': 'Job not found',
             'code': 'JOB_NOT_FOUND'
         }), 404
     
-    job_info = active_jobs[job_id]
     
     if job_info['status'] != 'completed':
         return jsonify({
@@ -682,6 +966,78 @@ def download_file(job_id):
         mimetype='text/markdown'
     )
 
+def parse_batch_request(data):
+    """
+    배치 생성 요청 검증 및 파라미터 추출 (/api/batch-generate, /api/batch-generate/stream 공용)
+    
+    Returns:
+        tuple: (params, None) 또는 검증 실패 시 (None, (에러 응답, HTTP 상태 코드))
+    """
+    if not data or 'urls' not in data:
+        logger.error(f"[BATCH-GENERATE] URLs 누락")
+        return None, (jsonify({
+            'success': False,
+            'error': 'URLs are required',
+            'code': 'MISSING_URLS'
+        }), 400)
+    
+    # API 키 검증
+    if 'api_provider' not in data or 'api_key' not in data:
+        logger.error(f"[BATCH-GENERATE] API 자격 증명 누락")
+        return None, (jsonify({
+            'success': False,
+            'error': 'API provider and API key are required',
+            'code': 'MISSING_API_CREDENTIALS'
+        }), 400)
+    
+    urls = data['urls']
+    api_provider = data['api_provider']
+    api_key = data['api_key']
+    save_intermediate = data.get('save_intermediate', False)  # 성능 최적화: 기본값 False
+    content_type = data.get('content_type', 'standard')  # 기본값은 'standard'
+    selected_formats = data.get('selected_formats', None)  # 완성형 블로그 형식
+    wordpress_type = data.get('wordpress_type', 'text')  # 워드프레스 형식 (text/html)
+    
+    if not isinstance(urls, list) or len(urls) == 0:
+        return None, (jsonify({
+            'success': False,
+            'error': 'URLs must be a non-empty list',
+            'code': 'INVALID_URLS'
+        }), 400)
+    
+    # URL 개수 제한으로 타임아웃 방지
+    if len(urls) > 50:
+        return None, (jsonify({
+            'success': False,
+            'error': 'Maximum 50 URLs allowed per batch to prevent timeout',
+            'code': 'TOO_MANY_URLS'
+        }), 400)
+    
+    if api_provider not in ['anthropic', 'openai', 'perplexity']:
+        return None, (jsonify({
+            'success': False,
+            'error': 'API provider must be anthropic, openai, or perplexity',
+            'code': 'INVALID_API_PROVIDER'
+        }), 400)
+    
+    # 콘텐츠 타입 검증
+    if content_type not in ['standard', 'blog', 'enhanced_blog', 'threads', 'x']:
+        return None, (jsonify({
+            'success': False,
+            'error': 'Content type must be standard, blog, enhanced_blog, threads, or x',
+            'code': 'INVALID_CONTENT_TYPE'
+        }), 400)
+    
+    return {
+        'urls': urls,
+        'api_provider': api_provider,
+        'api_key': api_key,
+        'save_intermediate': save_intermediate,
+        'content_type': content_type,
+        'selected_formats': selected_formats,
+        'wordpress_type': wordpress_type
+    }, None
+
 @app.route('/api/batch-generate', methods=['POST', 'OPTIONS'])
 def batch_generate():
     """
@@ -693,8 +1049,11 @@ def batch_generate():
         "api_provider": "anthropic",  // required: anthropic or openai
         "api_key": "sk-...",         // required: user's API key
         "save_intermediate": false,   // optional
-        "content_type": "standard"    // optional: 'standard' or 'blog'
+        "content_type": "standard",   // optional: 'standard' or 'blog'
+        "async": false                // optional: true면 job_id를 즉시 반환(202)하고 백그라운드에서 처리
     }
+    
+    URL별 결과를 완료 즉시 받으려면 /api/batch-generate/stream 을 사용한다.
     """
     if request.method == 'OPTIONS':
         response = jsonify({})
@@ -706,228 +1065,458 @@ def batch_generate():
     try:
         data = request.get_json()
         
-        if not data or 'urls' not in data:
-            logger.error(f"[BATCH-GENERATE] URLs 누락")
-            return jsonify({
-                'success': False,
-                'error': 'URLs are required',
-                'code': 'MISSING_URLS'
-            }), 400
+        params, error_response = parse_batch_request(data)
+        if error_response:
+            return error_response
         
-        # API 키 검증
-        if 'api_provider' not in data or 'api_key' not in data:
-            logger.error(f"[BATCH-GENERATE] API 자격 증명 누락")
-            return jsonify({
-                'success': False,
-                'error': 'API provider and API key are required',
-                'code': 'MISSING_API_CREDENTIALS'
-            }), 400
+        urls = params['urls']
+        content_type = params['content_type']
         
-        urls = data['urls']
-        api_provider = data['api_provider']
-        api_key = data['api_key']
-        save_intermediate = data.get('save_intermediate', False)  # 성능 최적화: 기본값 False
-        content_type = data.get('content_type', 'standard')  # 기본값은 'standard'
-        selected_formats = data.get('selected_formats', None)  # 완성형 블로그 형식
-        wordpress_type = data.get('wordpress_type', 'text')  # 워드프레스 형식 (text/html)
+        # 배치 작업 ID 생성
+        batch_job_id = str(uuid.uuid4())
+        create_job(
+            batch_job_id,
+            type='batch',
+            urls=urls,
+            content_type=content_type,
+            partial_results=[],
+            completed_count=0,
+            total_count=len(urls)
+        )
         
-        if not isinstance(urls, list) or len(urls) == 0:
-            return jsonify({
-                'success': False,
-                'error': 'URLs must be a non-empty list',
-                'code': 'INVALID_URLS'
-            }), 400
+        logger.info(f"Starting batch generation for {len(urls)} URLs (Job ID: {batch_job_id}, Type: {content_type})")
         
-        # URL 개수 제한으로 타임아웃 방지
-        if len(urls) > 50:
-            return jsonify({
-                'success': False,
-                'error': 'Maximum 50 URLs allowed per batch to prevent timeout',
-                'code': 'TOO_MANY_URLS'
-            }), 400
+        # 비동기 모드: 작업을 워커 풀에 넘기고 즉시 응답
+        if data.get('async', False):
+            return submit_background_job(batch_job_id, run_batch_job, params)
         
-        if api_provider not in ['anthropic', 'openai', 'perplexity']:
-            return jsonify({
-                'success': False,
-                'error': 'API provider must be anthropic, openai, or perplexity',
-                'code': 'INVALID_API_PROVIDER'
-            }), 400
+        payload, status_code = run_batch_job(batch_job_id, params)
+        return jsonify(payload), status_code
         
-        # 콘텐츠 타입 검증
-        if content_type not in ['standard', 'blog', 'enhanced_blog', 'threads', 'x']:
-            return jsonify({
-                'success': False,
-                'error': 'Content type must be standard, blog, enhanced_blog, threads, or x',
-                'code': 'INVALID_CONTENT_TYPE'
-            }), 400
+    except Exception as e:
+        logger.error(f"Batch generation error: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': 'Internal server error',
+            'code': 'INTERNAL_ERROR'
+        }), 500
+
+def build_parallel_stats(parallel_stats, actual_time, url_count):
+    """배치 응답용 병렬처리 통계 요약"""
+    return {
+        'max_workers': 3,
+        'completed_threads': parallel_stats.get('completed_tasks', 0),
+        'failed_threads': parallel_stats.get('failed_tasks', 0),
+        'total_threads': parallel_stats.get('completed_tasks', 0) + parallel_stats.get('failed_tasks', 0),
+        'parallel_efficiency': f"{((actual_time / url_count / 3) * 100):.1f}%" if url_count > 0 else "100%",
+        'speedup_factor': f"{3:.1f}x" if url_count > 1 else "1x",
+        'fetch_seconds': parallel_stats.get('pipeline', {}).get('fetch_seconds'),
+        'hosts': parallel_stats.get('hosts', {})
+    }
+
+def _process_batch_result(result, content_type):
+    """배치 결과 하나를 API 응답 형식으로 변환 (성공 시 생성 파일 내용 포함)"""
+    if not result['success']:
+        return {
+            'success': False,
+            'url': result['url'],
+            'error': result['error']
+        }
+    
+    # 파일에서 콘텐츠 읽기
+    with open(result['output_file'], 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # 파일 영구 보관 (기존 방식 복원)
+    logger.info(f"파일 저장 완료: {result['output_file']}")
+    
+    return {
+        'success': True,
+        'url': result['url'],
+        'title': result['title'],
+        'content': content,
+        'filename': Path(result['output_file']).name,
+        'timestamp': result['timestamp'],
+        'content_type': result.get('content_type', content_type),  # 백엔드에서 content_type 보장
+        'output_file': str(result['output_file'])
+    }
+
+def run_batch_job(batch_job_id, params):
+    """
+    배치 콘텐츠 생성 작업 실행 (요청 스레드 또는 백그라운드 워커에서 호출)
+    
+    URL별 결과가 나올 때마다 작업 저장소의 partial_results/completed_count를 갱신한다.
+    
+    Returns:
+        tuple: (응답 payload, HTTP 상태 코드)
+    """
+    urls = params['urls']
+    content_type = params['content_type']
+    processed_by_index = {}
+    
+    def on_result(index, result):
+        # 완료된 URL 결과를 즉시 반영 (부분 결과 조회 및 진행률 계산용)
+        try:
+            processed = _process_batch_result(result, content_type)
+        except Exception as e:
+            logger.warning(f"부분 결과 처리 실패 ({result.get('url')}): {str(e)}")
+            return
+        processed_by_index[index] = processed
+        
+        def apply(job):
+            job['partial_results'].append({'index': index, **processed})
+            job['completed_count'] = len(job['partial_results'])
+            job['progress'] = 10 + int(85 * job['completed_count'] / len(urls))
+        job_store.mutate(batch_job_id, apply)
+    
+    try:
+        # NONGBUXX 생성기 대여 (사용자 API 키 사용, 같은 키로 초기화된 생성기 재사용)
+        generator = generator_pool.acquire(
+            api_provider=params['api_provider'],
+            api_key=params['api_key'],  # 사용자 API 키 전달
+            save_intermediate=params['save_intermediate']
+        )
+        generator.progress_callback = make_progress_callback(batch_job_id)
+    except Exception as e:
+        logger.error(f"Batch generation error (Job ID: {batch_job_id}): {str(e)}")
+        update_job(
+            batch_job_id,
+            status='failed',
+            stage='failed',
+            error='Internal server error',
+            code='INTERNAL_ERROR',
+            completed_at=datetime.now().isoformat()
+        )
+        return {
+            'success': False,
+            'job_id': batch_job_id,
+            'error': 'Internal server error',
+            'code': 'INTERNAL_ERROR'
+        }, 500
+    
+    # 🚀 향상된 배치 처리 (콘텐츠 타입 전달)
+    try:
+        # 작업 시작 시간 기록
+        start_time = time.time()
         
-        # 배치 작업 ID 생성
-        batch_job_id = str(uuid.uuid4())
-        active_jobs[batch_job_id] = {
-            'status': 'processing',
-            'type': 'batch',
-            'urls': urls,
+        # 예상 처리 시간 계산 (사용자 알림용)
+        estimated_time_per_url = 30  # 기본값
+        if content_type == 'blog':
+            estimated_time_per_url = 45
+        elif content_type == 'enhanced_blog':
+            estimated_time_per_url = 60
+        
+        total_estimated_time = len(urls) * estimated_time_per_url
+        
+        # 작업 정보 업데이트
+        update_job(
+            batch_job_id,
+            stage='processing',
+            estimated_time_seconds=total_estimated_time,
+            progress=10
+        )
+        
+        logger.info(f"Starting batch generation: {len(urls)} URLs, estimated time: {total_estimated_time}s")
+        
+        # 🧹 캐시 정리 (배치 처리 전)
+        cleanup_expired_cache()
+        
+        # 배치 처리 실행 (워드프레스 타입 포함)
+        try:
+            results = generator.batch_generate(
+                urls, 
+                content_type=content_type,
+                selected_formats=params['selected_formats'],
+                wordpress_type=params['wordpress_type'],
+                on_result=on_result
+            )
+            
+            # 🎯 병렬처리 통계 수집
+            parallel_stats = generator.get_parallel_stats()
+        finally:
+            # 생성기 반납
+            generator_pool.release(generator)
+        
+        # 실제 처리 시간 계산
+        actual_time = time.time() - start_time
+        
+        # 결과 처리 - 진행 중 변환된 결과 재사용
+        processed_results = [
+            processed_by_index[index] if index in processed_by_index
+            else _process_batch_result(result, content_type)
+            for index, result in enumerate(results)
+        ]
+        
+        # 성공 통계
+        success_count = sum(1 for r in processed_results if r['success'])
+        
+        response_data = {
+            'results': processed_results,
+            'success_count': success_count,
+            'total_count': len(urls),
+            'api_provider': params['api_provider'],
             'content_type': content_type,
-            'started_at': datetime.now().isoformat(),
-            'progress': 0,
-            'results': []
+            'processing_time_seconds': actual_time,
+            'parallel_stats': build_parallel_stats(parallel_stats, actual_time, len(urls))
         }
         
-        logger.info(f"Starting batch generation for {len(urls)} URLs (Job ID: {batch_job_id}, Type: {content_type})")
+        # 작업 완료 처리
+        update_job(
+            batch_job_id,
+            status='completed',
+            stage='completed',
+            progress=100,
+            completed_at=datetime.now().isoformat(),
+            success_count=success_count,
+            completed_count=len(urls),
+            total_count=len(urls),
+            actual_time_seconds=actual_time,
+            estimated_time_seconds=total_estimated_time,
+            data=response_data
+        )
+        
+        logger.info(f"Batch generation completed for job {batch_job_id}: {success_count}/{len(urls)} successful (Type: {content_type})")
+        logger.info(f"Processing time: {actual_time:.2f}s (estimated: {total_estimated_time}s)")
         
-        # NONGBUXX 생성기 초기화 (사용자 API 키 사용)
-        generator = NongbuxxGenerator(
-            api_provider=api_provider,
-            api_key=api_key,  # 사용자 API 키 전달
-            save_intermediate=save_intermediate
+        return {
+            'success': True,
+            'job_id': batch_job_id,
+            'data': response_data
+        }, 200
+        
+    except Exception as processing_error:
+        # 처리 중 오류 발생
+        error_msg = str(processing_error)
+        logger.error(f"Batch processing error: {error_msg}")
+        
+        # 사용자 친화적 에러 메시지 생성
+        if 'timeout' in error_msg.lower():
+            user_error = "처리 시간이 초과되었습니다. 선택한 뉴스 개수를 줄여주세요."
+        elif 'memory' in error_msg.lower():
+            user_error = "서버 메모리가 부족합니다. 선택한 뉴스 개수를 줄여주세요."
+        elif 'api' in error_msg.lower() and 'key' in error_msg.lower():
+            user_error = "API 키에 문제가 있습니다. 키를 확인해주세요."
+        elif 'rate' in error_msg.lower() and 'limit' in error_msg.lower():
+            user_error = "API 사용량 한도가 초과되었습니다. 잠시 후 다시 시도해주세요."
+        else:
+            user_error = f"처리 중 오류가 발생했습니다: {error_msg}"
+        
+        # 작업 실패 처리
+        update_job(
+            batch_job_id,
+            status='failed',
+            stage='failed',
+            error=user_error,
+            code='PROCESSING_ERROR',
+            completed_at=datetime.now().isoformat()
         )
         
-        # 🚀 향상된 배치 처리 (콘텐츠 타입 전달)
+        return {
+            'success': False,
+            'job_id': batch_job_id,
+            'error': user_error,
+            'code': 'PROCESSING_ERROR'
+        }, 500
+
+@app.route('/api/batch-generate/stream', methods=['POST', 'OPTIONS'])
+def batch_generate_stream():
+    """
+    배치 콘텐츠 생성 스트리밍 API (Server-Sent Events)
+    
+    Request Body는 /api/batch-generate 와 동일하다.
+    URL별 결과가 완료되는 즉시 이벤트로 전송하고, 전체 결과 목록은 서버에 모아두지 않는다.
+    
+    Events:
+        start   - {"job_id", "total_count"}
+        result  - {"index", "success", "url", "title", "content", ...} (완료 순서대로)
+        summary - {"job_id", "success_count", "total_count", "processing_time_seconds", "parallel_stats", ...}
+        error   - {"error", "code"} (처리 중 오류 발생 시)
+    """
+    if request.method == 'OPTIONS':
+        response = jsonify({})
+        response.headers['Access-Control-Allow-Origin'] = request.headers.get('Origin', '*')
+        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
+        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, Accept'
+        return response
+    
+    try:
+        params, error_response = parse_batch_request(request.get_json())
+        if error_response:
+            return error_response
+        
+        urls = params['urls']
+        content_type = params['content_type']
+        
+        # 배치 작업 ID 생성 (스트리밍 중에도 /api/status 로 진행 상황 조회 가능)
+        batch_job_id = str(uuid.uuid4())
+        create_job(
+            batch_job_id,
+            type='batch',
+            urls=urls,
+            content_type=content_type,
+            completed_count=0,
+            total_count=len(urls),
+            streaming=True
+        )
+    except Exception as e:
+        logger.error(f"Batch stream setup error: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': 'Internal server error',
+            'code': 'INTERNAL_ERROR'
+        }), 500
+    
+    generator = None
+    try:
+        # NONGBUXX 생성기 대여 (사용자 API 키 사용, 같은 키로 초기화된 생성기 재사용)
+        generator = generator_pool.acquire(
+            api_provider=params['api_provider'],
+            api_key=params['api_key'],
+            save_intermediate=params['save_intermediate']
+        )
+        generator.progress_callback = make_progress_callback(batch_job_id)
+    except Exception as e:
+        if generator is not None:
+            generator_pool.release(generator)
+        logger.error(f"Batch stream setup error (Job ID: {batch_job_id}): {str(e)}")
+        update_job(
+            batch_job_id,
+            status='failed',
+            stage='failed',
+            error='Internal server error',
+            code='INTERNAL_ERROR',
+            completed_at=datetime.now().isoformat()
+        )
+        return jsonify({
+            'success': False,
+            'error': 'Internal server error',
+            'code': 'INTERNAL_ERROR'
+        }), 500
+    
+    # 이벤트 생성이 시작되었는지 (시작 전에 응답이 닫히면 generate_events 의 finally 가 실행되지 않음)
+    stream_state = {'started': False}
+    
+    def close_stream():
+        """응답 종료 시 생성기 반납 (모든 종료 경로에서 한 번 실행)"""
+        generator_pool.release(generator)
+        if not stream_state['started']:
+            logger.warning(f"⚠️ 배치 스트림 시작 전 연결 종료: {batch_job_id}")
+            update_job(
+                batch_job_id,
+                status='failed',
+                stage='failed',
+                error='클라이언트 연결이 종료되었습니다.',
+                code='STREAM_CLOSED',
+                completed_at=datetime.now().isoformat()
+            )
+    
+    logger.info(f"Starting batch stream for {len(urls)} URLs (Job ID: {batch_job_id}, Type: {content_type})")
+    
+    def generate_events():
+        stream_state['started'] = True
+        start_time = time.time()
+        success_count = 0
+        completed_count = 0
+        results_iter = None
+        
         try:
-            # 작업 시작 시간 기록
-            start_time = time.time()
-            
-            # 예상 처리 시간 계산 (사용자 알림용)
-            estimated_time_per_url = 30  # 기본값
-            if content_type == 'blog':
-                estimated_time_per_url = 45
-            elif content_type == 'enhanced_blog':
-                estimated_time_per_url = 60
-            
-            total_estimated_time = len(urls) * estimated_time_per_url
-            
-            # 작업 정보 업데이트
-            active_jobs[batch_job_id].update({
-                'estimated_time_seconds': total_estimated_time,
-                'progress': 10
-            })
-            
-            logger.info(f"Starting batch generation: {len(urls)} URLs, estimated time: {total_estimated_time}s")
+            # 첫 이벤트 전송 중 연결이 끊겨도 아래 GeneratorExit 처리와 생성기 반납이 실행되도록 try 안에서 전송
+            yield format_sse_event('start', {'job_id': batch_job_id, 'total_count': len(urls)})
             
             # 🧹 캐시 정리 (배치 처리 전)
             cleanup_expired_cache()
+            update_job(batch_job_id, stage='processing', progress=10)
             
-            # 배치 처리 실행 (워드프레스 타입 포함)
-            results = generator.batch_generate(
-                urls, 
+            results_iter = generator.iter_batch_generate(
+                urls,
                 content_type=content_type,
-                selected_formats=selected_formats,
-                wordpress_type=wordpress_type
+                selected_formats=params['selected_formats'],
+                wordpress_type=params['wordpress_type']
             )
+            for index, result in results_iter:
+                processed = _process_batch_result(result, content_type)
+                completed_count += 1
+                if processed['success']:
+                    success_count += 1
+                
+                update_job(
+                    batch_job_id,
+                    completed_count=completed_count,
+                    progress=10 + int(85 * completed_count / len(urls))
+                )
+                
+                yield format_sse_event('result', {'index': index, **processed})
             
-            # 🎯 병렬처리 통계 수집
-            parallel_stats = generator.get_parallel_stats()
-            
-            # 정리
-            generator.cleanup()
-            
-            # 실제 처리 시간 계산
             actual_time = time.time() - start_time
-            
-            # 결과 처리 - 메모리 캐시에 저장
-            processed_results = []
-            for result in results:
-                if result['success']:
-                    # 파일에서 콘텐츠 읽기
-                    with open(result['output_file'], 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # 파일 영구 보관 (기존 방식 복원)
-                    logger.info(f"파일 저장 완료: {result['output_file']}")
-                    
-                    processed_results.append({
-                        'success': True,
-                        'url': result['url'],
-                        'title': result['title'],
-                        'content': content,
-                        'filename': result['output_file'].name,
-                        'timestamp': result['timestamp'],
-                        'content_type': result.get('content_type', content_type),  # 백엔드에서 content_type 보장
-                        'output_file': str(result['output_file'])
-                    })
-                else:
-                    processed_results.append({
-                        'success': False,
-                        'url': result['url'],
-                        'error': result['error']
-                    })
-            
-            # 성공 통계
-            success_count = sum(1 for r in processed_results if r['success'])
-            
-            # 작업 완료 처리
-            active_jobs[batch_job_id].update({
-                'status': 'completed',
-                'progress': 100,
-                'completed_at': datetime.now().isoformat(),
-                'results': processed_results,
+            summary = {
+                'job_id': batch_job_id,
                 'success_count': success_count,
                 'total_count': len(urls),
-                'actual_time_seconds': actual_time,
-                'estimated_time_seconds': total_estimated_time
-            })
-            
-            logger.info(f"Batch generation completed for job {batch_job_id}: {success_count}/{len(urls)} successful (Type: {content_type})")
-            logger.info(f"Processing time: {actual_time:.2f}s (estimated: {total_estimated_time}s)")
-            
-            return jsonify({
-                'success': True,
-                'job_id': batch_job_id,
-                'data': {
-                    'results': processed_results,
-                    'success_count': success_count,
-                    'total_count': len(urls),
-                    'api_provider': api_provider,
-                    'content_type': content_type,
-                    'processing_time_seconds': actual_time,
-                    'parallel_stats': {
-                        'max_workers': 3,
-                        'completed_threads': parallel_stats.get('completed_tasks', 0),
-                        'failed_threads': parallel_stats.get('failed_tasks', 0),
-                        'total_threads': parallel_stats.get('completed_tasks', 0) + parallel_stats.get('failed_tasks', 0),
-                        'parallel_efficiency': f"{((actual_time / len(urls) / 3) * 100):.1f}%" if len(urls) > 0 else "100%",
-                        'speedup_factor': f"{3:.1f}x" if len(urls) > 1 else "1x"
-                    }
-                }
-            })
+                'api_provider': params['api_provider'],
+                'content_type': content_type,
+                'processing_time_seconds': actual_time,
+                'parallel_stats': build_parallel_stats(generator.get_parallel_stats(), actual_time, len(urls))
+            }
             
-        except Exception as processing_error:
-            # 처리 중 오류 발생
-            error_msg = str(processing_error)
-            logger.error(f"Batch processing error: {error_msg}")
+            update_job(
+                batch_job_id,
+                status='completed',
+                stage='completed',
+                progress=100,
+                completed_at=datetime.now().isoformat(),
+                success_count=success_count,
+                actual_time_seconds=actual_time
+            )
             
-            # 사용자 친화적 에러 메시지 생성
-            if 'timeout' in error_msg.lower():
-                user_error = "처리 시간이 초과되었습니다. 선택한 뉴스 개수를 줄여주세요."
-            elif 'memory' in error_msg.lower():
-                user_error = "서버 메모리가 부족합니다. 선택한 뉴스 개수를 줄여주세요."
-            elif 'api' in error_msg.lower() and 'key' in error_msg.lower():
-                user_error = "API 키에 문제가 있습니다. 키를 확인해주세요."
-            elif 'rate' in error_msg.lower() and 'limit' in error_msg.lower():
-                user_error = "API 사용량 한도가 초과되었습니다. 잠시 후 다시 시도해주세요."
-            else:
-                user_error = f"처리 중 오류가 발생했습니다: {error_msg}"
+            logger.info(f"Batch stream completed for job {batch_job_id}: {success_count}/{len(urls)} successful (Type: {content_type})")
             
-            # 작업 실패 처리
-            active_jobs[batch_job_id].update({
-                'status': 'failed',
-                'error': user_error,
-                'completed_at': datetime.now().isoformat()
-            })
+            yield format_sse_event('summary', summary)
             
-            return jsonify({
-                'success': False,
-                'error': user_error,
+        except GeneratorExit:
+            # 클라이언트 연결 종료 - 시작하지 않은 URL은 iter_batch_generate 종료 시 취소됨
+            logger.warning(f"⚠️ 배치 스트림 연결 종료: {batch_job_id}")
+            update_job(
+                batch_job_id,
+                status='failed',
+                stage='failed',
+                error='클라이언트 연결이 종료되었습니다.',
+                code='STREAM_CLOSED',
+                completed_at=datetime.now().isoformat()
+            )
+            raise
+        except Exception as e:
+            logger.error(f"Batch stream error (Job ID: {batch_job_id}): {str(e)}")
+            update_job(
+                batch_job_id,
+                status='failed',
+                stage='failed',
+                error=f"처리 중 오류가 발생했습니다: {str(e)}",
+                code='PROCESSING_ERROR',
+                completed_at=datetime.now().isoformat()
+            )
+            yield format_sse_event('error', {
+                'error': f"처리 중 오류가 발생했습니다: {str(e)}",
                 'code': 'PROCESSING_ERROR'
-            }), 500
-        
-    except Exception as e:
-        logger.error(f"Batch generation error: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+            })
+        finally:
+            # 진행 중인 URL 처리가 끝날 때까지 대기 (생성기는 응답 종료 시 close_stream 에서 반납)
+            if results_iter is not None:
+                results_iter.close()
+    
+    response = sse_response(generate_events())
+    response.call_on_close(close_stream)
+    return response
+
+def sse_response(events):
+    """SSE 이벤트 제너레이터를 스트리밍 응답으로 변환"""
+    response = Response(stream_with_context(events), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # 프록시 버퍼링 비활성화
+    return response
+
+def format_sse_event(event, data):
+    """Server-Sent Events 형식으로 이벤트 직렬화"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
 
 @app.route('/api/extract-news-links', methods=['POST', 'OPTIONS'])
 def extract_news_links():
@@ -1581,6 +2170,7 @@ def create_source():
         # 단독 출처인 경우에만 parser_type 추가
         if not new_source['is_parent']:
             new_source['parser_type'] = data.get('parser_type', 'generic')
+            new_source['render_js'] = bool(data.get('render_js', False))
         
         # 서브 카테고리 추가 (부모 출처인 경우)
         if new_source['is_parent'] and 'subcategories' in data:
@@ -1591,6 +2181,7 @@ def create_source():
                     'name': subcategory['name'],
                     'url': subcategory['url'],
                     'parser_type': subcategory.get('parser_type', 'universal'),
+                    'render_js': bool(subcategory.get('render_js', False)),
                     'active': subcategory.get('active', True),
                     'description': subcategory.get('description', ''),
                     'created_at': datetime.now().isoformat(),
@@ -1713,6 +2304,7 @@ def update_source(source_id):
         # 부모 출처가 아닌 경우에만 parser_type 추가
         if not updated_source['is_parent']:
             updated_source['parser_type'] = data.get('parser_type', existing_source.get('parser_type', 'generic'))
+            updated_source['render_js'] = bool(data.get('render_js', existing_source.get('render_js', False)))
         
         # 서브카테고리 업데이트 (부모 출처인 경우)
         if updated_source['is_parent'] and 'subcategories' in data:
@@ -1723,6 +2315,7 @@ def update_source(source_id):
                     'name': subcategory['name'],
                     'url': subcategory['url'],
                     'parser_type': subcategory.get('parser_type', 'universal'),
+                    'render_js': bool(subcategory.get('render_js', False)),
                     'active': subcategory.get('active', True),
                     'description': subcategory.get('description', ''),
                     'created_at': subcategory.get('created_at', datetime.now().isoformat()),
@@ -1876,6 +2469,7 @@ def add_subcategory(parent_id):
             'name': data['name'],
             'url': data['url'],
             'parser_type': data.get('parser_type', 'universal'),
+            'render_js': bool(data.get('render_js', False)),
             'active': data.get('active', True),
             'description': data.get('description', ''),
             'created_at': datetime.now().isoformat(),
@@ -1923,21 +2517,36 @@ def get_cache_stats():
     try:
         cleanup_expired_cache()  # 정리 후 통계 조회
         
-        total_cache_size = len(content_cache)
-        valid_cache_count = sum(1 for k in content_cache.keys() if is_cache_valid(k))
+        stats = content_cache.get_stats()
+        extraction_stats = get_extraction_cache().get_stats()
+        dedup_stats = get_generation_dedup_index().get_stats()
         
         return jsonify({
             'success': True,
             'cache_stats': {
-                'total_cached_items': total_cache_size,
-                'valid_cached_items': valid_cache_count,
-                'expired_items_cleaned': total_cache_size - valid_cache_count,
-                'cache_hit_potential': f"{(valid_cache_count / max(total_cache_size, 1)) * 100:.1f}%"
+                **stats,
+                'hit_rate': f"{stats['hit_rate'] * 100:.1f}%",
+                'coalescing': get_generation_flight().get_stats()
+            },
+            'extraction_cache_stats': {
+                **extraction_stats,
+                'hit_rate': f"{extraction_stats['hit_rate'] * 100:.1f}%"
+            },
+            'dedup_stats': {
+                **dedup_stats,
+                'hit_rate': f"{dedup_stats['hit_rate'] * 100:.1f}%"
             },
-            'performance_impact': {
-                'potential_speedup': "2-3배 빠른 응답 (캐시된 항목)",
-                'cache_duration': "30분",
-                'memory_efficiency': "자동 만료 관리"
+            'job_store_stats': job_store.get_stats(),
+            'generator_pool_stats': generator_pool.get_stats(),
+            'http_client_stats': get_http_client().get_stats(),
+            'browser_pool_stats': get_browser_pool_stats(),
+            'llm_gateway_stats': get_llm_gateway().get_stats(),
+            'completion_cache_stats': get_completion_cache_stats(),
+            'job_executor_stats': get_job_executor().get_stats(),
+            'cache_config': {
+                'backend': os.getenv('CACHE_BACKEND', 'sqlite'),
+                'ttl_seconds': stats['default_ttl'],
+                'eviction_policy': 'LRU'
             }
         })
     except Exception as e:
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+추출 기사 아카이브 (SQLite)
+
+WebExtractor 가 extracted_articles/article_{timestamp}.txt 로 남기던 추출 결과를
+URL 키 / 본문 해시 색인이 있는 SQLite 테이블 하나에 압축 JSON 으로 보관한다.
+- 같은 초에 저장된 병렬 추출 결과가 서로 덮어쓰지 않음 (URL 단위 upsert)
+- 저장은 백그라운드 쓰기 스레드가 묶어서 처리 (추출 스레드는 큐에 넣고 바로 반환)
+- URL / 본문 해시로 색인 조회, 쓰기 대기 중인 항목도 바로 조회 가능
+- 추출 캐시(ExtractionCache)의 2차 저장소로 사용 (워커 간 공유, 재시작 후에도 유지)
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from content_cache import content_fingerprint, normalize_url
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class ArticleArchive:
+    """URL / 본문 해시 색인 기사 아카이브 (백그라운드 쓰기)"""
+
+    def __init__(self, db_path: str = 'cache/article_archive.db', retention_days: float = 30,
+                 queue_size: int = 1000, batch_size: int = 50):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            retention_days: 보관 기간 (일, 쓰기 스레드 시작 시 오래된 항목 정리, 0이면 정리 안 함)
+            queue_size: 쓰기 대기열 크기 (가득 차면 저장을 건너뛰고 경고)
+            batch_size: 한 트랜잭션에 묶어 쓸 최대 항목 수
+        """
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self.batch_size = max(1, batch_size)
+        self._queue: 'queue.Queue[Any]' = queue.Queue(maxsize=queue_size)
+        # 쓰기 대기 중인 항목 (url_key → 행) - 기록 전에도 조회되도록
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_pid: Optional[int] = None
+
+        self.stats: Dict[str, int] = {
+            'queued': 0,
+            'written': 0,
+            'skipped': 0,
+            'dropped': 0,
+            'url_hits': 0,
+            'hash_hits': 0,
+            'misses': 0,
+            'errors': 0
+        }
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS articles (
+                url_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                content_hash TEXT,
+                title TEXT,
+                publisher TEXT,
+                fetched_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                data BLOB NOT NULL
+            )"""
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(content_hash)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_fetched ON articles(fetched_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드/프로세스별 연결 (fork 이후 연결 재사용 방지)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+
+    def _ensure_writer(self) -> None:
+        """현재 프로세스의 쓰기 스레드 시작 (gunicorn fork 이후 워커마다 새로 시작)"""
+        if self._writer is not None and self._writer_pid == os.getpid() and self._writer.is_alive():
+            return
+        with self._lock:
+            if self._writer is not None and self._writer_pid == os.getpid() and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(target=self._write_loop, name='nongbuxx-archive-writer', daemon=True)
+            self._writer_pid = os.getpid()
+            self._writer.start()
+
+    def archive(self, data: Dict[str, Any]) -> bool:
+        """
+        추출 결과 저장 요청 (큐에 넣고 바로 반환)
+
+        Returns:
+            큐에 넣었으면 True (실패한 추출, 같은 본문 재저장, 대기열 초과는 False)
+        """
+        if not data.get('success') or not data.get('url'):
+            return False
+
+        url_key = normalize_url(data['url'])
+        content_hash = content_fingerprint(data, min_chars=1)
+        with self._lock:
+            pending = self._pending.get(url_key)
+        if pending is not None and pending['content_hash'] == content_hash and \
+                pending['validators'] == data.get('http_validators'):
+            self._count('skipped')
+            return False
+
+        # 호출 측이 이후 결과를 수정해도 저장 내용이 바뀌지 않도록 직렬화 시점에 고정
+        row = {
+            'url_key': url_key,
+            'url': data['url'],
+            'content_hash': content_hash,
+            'title': data.get('title'),
+            'publisher': data.get('publisher'),
+            'fetched_at': time.time(),
+            'validators': data.get('http_validators'),
+            'json': json.dumps(data, ensure_ascii=False, default=str)
+        }
+        self._ensure_writer()
+        with self._lock:
+            self._pending[url_key] = row
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._lock:
+                if self._pending.get(url_key) is row:
+                    del self._pending[url_key]
+            self._count('dropped')
+            logger.warning(f"⚠️ 기사 아카이브 대기열 초과, 저장 생략: {data['url']}")
+            return False
+        self._count('queued')
+        return True
+
+    def _write_loop(self) -> None:
+        if self.retention_days:
+            self.prune(time.time() - self.retention_days * 86400)
+
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            # 대기 중인 항목을 한 트랜잭션으로 묶어 기록
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = [row for row in batch if row is not _STOP]
+            if rows:
+                self._write_rows(rows)
+            for _ in batch:
+                self._queue.task_done()
+            if len(rows) != len(batch):
+                return
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        records = []
+        for row in rows:
+            blob = zlib.compress(row['json'].encode('utf-8'))
+            records.append((
+                row['url_key'], row['url'], row['content_hash'], row['title'], row['publisher'],
+                row['fetched_at'], len(blob), blob
+            ))
+        try:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            conn.executemany(
+                """INSERT OR REPLACE INTO articles
+                   (url_key, url, content_hash, title, publisher, fetched_at, size, data)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                records
+            )
+            conn.execute("COMMIT")
+            self._count('written', len(records))
+        except sqlite3.Error as e:
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            self._count('errors')
+            logger.warning(f"⚠️ 기사 아카이브 저장 실패 ({len(records)}건): {e}")
+        finally:
+            with self._lock:
+                for row in rows:
+                    if self._pending.get(row['url_key']) is row:
+                        del self._pending[row['url_key']]
+
+    @staticmethod
+    def _pending_entry(pending: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'url': pending['url'],
+            'content_hash': pending['content_hash'],
+            'fetched_at': pending['fetched_at'],
+            'data': json.loads(pending['json'])
+        }
+
+    def _row_to_entry(self, row) -> Optional[Dict[str, Any]]:
+        url, content_hash, fetched_at, blob = row
+        try:
+            data = json.loads(zlib.decompress(blob).decode('utf-8'))
+        except (zlib.error, ValueError) as e:
+            self._count('errors')
+            logger.warning(f"⚠️ 기사 아카이브 항목 손상: {url} ({e})")
+            return None
+        return {'url': url, 'content_hash': content_hash, 'fetched_at': fetched_at, 'data': data}
+
+    def get_by_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        URL로 조회 (정규화 URL 기본 키)
+
+        Returns:
+            {'url', 'content_hash', 'fetched_at', 'data'} 또는 None
+        """
+        url_key = normalize_url(url)
+        with self._lock:
+            pending = self._pending.get(url_key)
+        if pending is not None:
+            self._count('url_hits')
+            return self._pending_entry(pending)
+
+        try:
+            row = self._connect().execute(
+                "SELECT url, content_hash, fetched_at, data FROM articles WHERE url_key = ?", (url_key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._count('errors')
+            logger.warning(f"⚠️ 기사 아카이브 조회 실패: {e}")
+            return None
+        entry = self._row_to_entry(row) if row else None
+        self._count('url_hits' if entry else 'misses')
+        return entry
+
+    def get_by_hash(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """본문 해시(content_fingerprint)로 가장 최근 항목 조회"""
+        with self._lock:
+            pending = next((row for row in self._pending.values() if row['content_hash'] == content_hash), None)
+        if pending is not None:
+            self._count('hash_hits')
+            return self._pending_entry(pending)
+
+        try:
+            row = self._connect().execute(
+                """SELECT url, content_hash, fetched_at, data FROM articles
+                   WHERE content_hash = ? ORDER BY fetched_at DESC LIMIT 1""",
+                (content_hash,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._count('errors')
+            logger.warning(f"⚠️ 기사 아카이브 조회 실패: {e}")
+            return None
+        entry = self._row_to_entry(row) if row else None
+        self._count('hash_hits' if entry else 'misses')
+        return entry
+
+    def prune(self, before: float) -> int:
+        """fetched_at 이 before 이전인 항목 삭제 (삭제 개수 반환)"""
+        try:
+            cursor = self._connect().execute("DELETE FROM articles WHERE fetched_at < ?", (before,))
+            if cursor.rowcount:
+                logger.info(f"🧹 기사 아카이브 정리: {cursor.rowcount}건")
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            self._count('errors')
+            logger.warning(f"⚠️ 기사 아카이브 정리 실패: {e}")
+            return 0
+
+    def flush(self, timeout: float = 10) -> bool:
+        """대기 중인 저장이 끝날 때까지 대기 (시간 내 완료 시 True)"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self._lock:
+                if not self._pending:
+                    return True
+            time.sleep(0.01)
+        return False
+
+    def close(self) -> None:
+        """남은 저장을 마치고 쓰기 스레드 종료"""
+        if self._writer is not None and self._writer_pid == os.getpid() and self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join(timeout=10)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장/조회 통계 및 보관 항목 수, 압축 크기"""
+        try:
+            entries, total_bytes = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM articles"
+            ).fetchone()
+        except sqlite3.Error:
+            entries, total_bytes = None, None
+        with self._lock:
+            stats = dict(self.stats)
+            pending = len(self._pending)
+        return {
+            **stats,
+            'pending': pending,
+            'entries': entries,
+            'bytes': total_bytes,
+            'db_path': self.db_path,
+            'retention_days': self.retention_days
+        }
+
+
+# 싱글톤 인스턴스
+article_archive_instance = None
+_article_archive_lock = threading.Lock()
+
+
+def get_article_archive() -> ArticleArchive:
+    """기사 아카이브 인스턴스 가져오기 (프로세스 종료 시 남은 저장 마무리)"""
+    global article_archive_instance
+    if article_archive_instance is None:
+        with _article_archive_lock:
+            if article_archive_instance is None:
+                article_archive_instance = ArticleArchive(
+                    db_path=os.getenv('ARTICLE_ARCHIVE_PATH', 'cache/article_archive.db'),
+                    retention_days=float(os.getenv('ARTICLE_ARCHIVE_RETENTION_DAYS', 30)),
+                    queue_size=int(os.getenv('ARTICLE_ARCHIVE_QUEUE_SIZE', 1000))
+                )
+                atexit.register(article_archive_instance.close)
+    return article_archive_instance
@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+"""
+lxml 기반 기사 파싱 엔진
+
+WebExtractor 의 BeautifulSoup(html.parser) 경로와 같은 결과를 내면서
+- 문서 트리를 lxml 로 한 번만 만들고
+- 제목/저자/발행일/출처/본문 후보 선택자와 meta 태그를 미리 컴파일한
+  추출 계획(ExtractionPlan)으로 트리를 한 번만 순회하여 평가한다.
+
+사이트별 제목/본문/출처 전략(SiteProfile)은 URL 호스트로 한 번 선택한다
+(Yahoo Finance, 네이버 뉴스, 그 외 일반 사이트). 문서를 다시 문자열로 만들어 사이트를 판별하지 않는다.
+
+선택자 우선순위와 '선택자별 문서 순서상 첫 번째 요소' 규칙은 select_one 과 동일하다.
+cssselect 의존성 없이 이 모듈이 쓰는 단순 선택자 형태만 지원한다:
+  tag, .class, #id, [class*="부분문자열"], 그리고 두 단계 자손 선택자 "A B"
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import lxml.html
+from lxml import etree
+
+# 본문 컨테이너 후보 (우선순위 순)
+ARTICLE_SELECTORS = [
+    'article',
+    '.article',
+    '.articlePage',
+    '.story-body',
+    '.content',
+    '.post-content',
+    '[class*="article"]',
+    '[class*="content"]'
+]
+
+YAHOO_TITLE_SELECTORS = [
+    '.cover-title',  # Yahoo Finance 실제 기사 제목
+    'title',         # Page title (정확함)
+]
+
+TITLE_SELECTORS = [
+    'h1',
+    '#title_area h2',  # 네이버 뉴스
+    '.media_end_head_headline h2',  # 네이버 뉴스
+    '#articleTitle',  # 구 네이버 뉴스
+    '.headline',
+    '.title',
+    '[class*="title"]',
+    '[class*="headline"]',
+]
+
+AUTHOR_SELECTORS = [
+    '[class*="author"]',
+    '[class*="byline"]',
+    '.author',
+    '.byline'
+]
+
+DATE_SELECTORS = [
+    '[class*="date"]',
+    '[class*="time"]',
+    '.date',
+    '.time',
+    '.published'
+]
+
+PUBLISHER_SELECTORS = [
+    '.publisher',
+    '.source',
+    '[class*="publisher"]',
+    '[class*="source"]',
+    '.media_end_head_top_logo img',  # 네이버 뉴스 언론사 로고
+    '.press_logo img'  # 네이버 뉴스 언론사 로고 (구버전)
+]
+
+# 도메인별 출처 이름
+DOMAIN_TO_PUBLISHER = {
+    'bloomberg.com': 'Bloomberg',
+    'wsj.com': 'WSJ',
+    'reuters.com': 'Reuters',
+    'ft.com': 'Financial Times',
+    'cnbc.com': 'CNBC',
+    'finance.yahoo.com': 'Yahoo Finance',
+    'naver.com': '네이버뉴스',
+    'news.naver.com': '네이버뉴스',
+    'yna.co.kr': '연합뉴스',
+    'bbc.com': 'BBC',
+    'cnn.com': 'CNN',
+    'forbes.com': 'Forbes',
+    'economist.com': 'The Economist',
+    'techcrunch.com': 'TechCrunch',
+    'theverge.com': 'The Verge'
+}
+
+
+
+class SiteProfile:
+    """
+    사이트별 추출 전략 (선택자 목록과 제목/출처 규칙)
+
+    URL 호스트로 한 번 선택되며, lxml 경로와 BeautifulSoup 경로가 같은 전략을 사용한다.
+    """
+
+    def __init__(self, name: str, hosts: Tuple[str, ...] = (),
+                 article_selectors: Optional[List[str]] = None,
+                 title_selectors: Optional[List[str]] = None,
+                 lead_title_selectors: Optional[List[str]] = None,
+                 title_suffixes: Tuple[str, ...] = (),
+                 press_selectors: Optional[List[str]] = None):
+        """
+        Args:
+            name: 전략 이름
+            hosts: 적용할 호스트 (하위 도메인 포함)
+            article_selectors: 본문 컨테이너 후보 (우선순위 순)
+            title_selectors: 제목 후보 (5자 초과 텍스트)
+            lead_title_selectors: 일반 제목 후보보다 먼저 확인하는 사이트 제목 (10~200자, title_suffixes 제거)
+            title_suffixes: 사이트 제목에서 제거할 사이트명 접미사
+            press_selectors: 도메인 매핑보다 먼저 확인하는 언론사 로고 이미지 (alt 텍스트 사용)
+        """
+        self.name = name
+        self.hosts = hosts
+        self.article_selectors = article_selectors or ARTICLE_SELECTORS
+        self.title_selectors = title_selectors or TITLE_SELECTORS
+        self.lead_title_selectors = lead_title_selectors or []
+        self.title_suffixes = title_suffixes
+        self.press_selectors = press_selectors or []
+
+    def matches(self, host: str) -> bool:
+        return any(host == suffix or host.endswith('.' + suffix) for suffix in self.hosts)
+
+
+GENERIC_SITE = SiteProfile('generic')
+
+YAHOO_FINANCE_SITE = SiteProfile(
+    'yahoo_finance',
+    hosts=('yahoo.com',),
+    article_selectors=['.caas-body', '.body-wrap'] + ARTICLE_SELECTORS,
+    lead_title_selectors=YAHOO_TITLE_SELECTORS,
+    title_suffixes=(' - Yahoo Finance', ' | Yahoo Finance')
+)
+
+NAVER_NEWS_SITE = SiteProfile(
+    'naver_news',
+    hosts=('naver.com',),
+    article_selectors=['#dic_area', '#articleBodyContents', '#articeBody', '#newsEndContents'] + ARTICLE_SELECTORS,
+    title_selectors=['#title_area', '.media_end_head_headline', '#articleTitle'] + TITLE_SELECTORS,
+    press_selectors=['.media_end_head_top_logo img', '.press_logo img']
+)
+
+# 호스트별 사이트 전략 (일치하는 것이 없으면 GENERIC_SITE)
+SITE_PROFILES = [YAHOO_FINANCE_SITE, NAVER_NEWS_SITE]
+
+
+def get_site_profile(url: str) -> SiteProfile:
+    """URL 호스트로 사이트 전략 선택 (문서 내용은 보지 않음)"""
+    host = urlparse(url).hostname or ''
+    for profile in SITE_PROFILES:
+        if profile.matches(host):
+            return profile
+    return GENERIC_SITE
+
+
+# 메타데이터로 수집하는 meta name/property
+META_NAMES = ['description', 'author', 'published_time', 'keywords']
+
+# 첫 번째 요소만 필요한 meta 태그 (속성, 값)
+META_LOOKUPS = [
+    ('name', 'author'),
+    ('name', 'date'),
+    ('property', 'article:published_time'),
+    ('property', 'og:site_name'),
+    ('name', 'publisher'),
+    ('property', 'article:publisher'),
+    ('property', 'og:title'),
+]
+
+# get_text() 와 같이 텍스트에서 제외하는 요소
+_SKIP_TEXT_TAGS = frozenset(['script', 'style', 'template'])
+
+# 본문 추출 시 문단 경계가 되는 블록 요소
+_BLOCK_TAGS = frozenset([
+    'address', 'article', 'blockquote', 'br', 'dd', 'details', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main',
+    'ol', 'p', 'pre', 'section', 'summary', 'table', 'tbody', 'td', 'tfoot', 'th', 'thead', 'tr', 'ul'
+])
+
+# 본문 추출 시 하위 트리 전체를 건너뛰는 요소
+_NON_CONTENT_TAGS = frozenset(['noscript', 'nav', 'aside', 'footer', 'form', 'button', 'iframe', 'svg', 'select'])
+
+# class/id 로 판단하는 광고·관련 기사·공유·댓글 영역
+_BOILERPLATE_MARKER = re.compile(
+    r'related|recommend|newsletter|advert|sponsor|subscribe|promo|share|social|comment|u_cbox|photo',
+    re.IGNORECASE
+)
+
+_SIMPLE_SELECTOR = re.compile(r'^(?:(?P<tag>[a-zA-Z][\w-]*)|\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+)|\[class\*="(?P<sub>[^"]+)"\])$')
+
+
+def _parse_simple(selector: str) -> Tuple[str, str]:
+    match = _SIMPLE_SELECTOR.match(selector)
+    if not match:
+        raise ValueError(f"지원하지 않는 선택자: {selector}")
+    kind = match.lastgroup
+    return kind, match.group(kind)
+
+
+def _matches(kind: str, value: str, tag: str, element_id: str, class_attr: str, classes: frozenset) -> bool:
+    if kind == 'tag':
+        return tag == value
+    if kind == 'cls':
+        return value in classes
+    if kind == 'id':
+        return element_id == value
+    return value in class_attr
+
+
+class ExtractionPlan:
+    """
+    여러 선택자 그룹을 한 번의 트리 순회로 평가하는 컴파일된 추출 계획
+
+    선택자를 태그/클래스/id 색인과 부분 문자열 목록으로 나눠 두고,
+    요소마다 해당하는 선택자만 확인하여 선택자별 첫 번째 일치 요소를 기록한다.
+    """
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.groups = groups
+        self._by_tag: Dict[str, List[Tuple[str, Optional[Tuple[str, str]]]]] = {}
+        self._by_class: Dict[str, List[Tuple[str, Optional[Tuple[str, str]]]]] = {}
+        self._by_id: Dict[str, List[Tuple[str, Optional[Tuple[str, str]]]]] = {}
+        self._by_substring: List[Tuple[str, str, Optional[Tuple[str, str]]]] = []
+
+        selectors = {selector for group in groups.values() for selector in group}
+        for selector in selectors:
+            parts = selector.split()
+            if len(parts) > 2:
+                raise ValueError(f"지원하지 않는 선택자: {selector}")
+            ancestor = _parse_simple(parts[0]) if len(parts) == 2 else None
+            kind, value = _parse_simple(parts[-1])
+            if kind == 'tag':
+                self._by_tag.setdefault(value, []).append((selector, ancestor))
+            elif kind == 'cls':
+                self._by_class.setdefault(value, []).append((selector, ancestor))
+            elif kind == 'id':
+                self._by_id.setdefault(value, []).append((selector, ancestor))
+            else:
+                self._by_substring.append((value, selector, ancestor))
+
+    @staticmethod
+    def _has_ancestor(element, ancestor: Tuple[str, str]) -> bool:
+        kind, value = ancestor
+        for parent in element.iterancestors():
+            class_attr = parent.get('class') or ''
+            if _matches(kind, value, parent.tag, parent.get('id') or '', class_attr, frozenset(class_attr.split())):
+                return True
+        return False
+
+    def run(self, root) -> Tuple[Dict[str, Any], Dict[Tuple[str, str], Any], List[Any]]:
+        """
+        트리를 한 번 순회하여 평가
+
+        Returns:
+            tuple: (선택자 → 첫 번째 요소, (meta 속성, 값) → 첫 번째 meta 요소, 전체 meta 요소 목록)
+        """
+        found: Dict[str, Any] = {}
+        meta_found: Dict[Tuple[str, str], Any] = {}
+        metas: List[Any] = []
+
+        def record(candidates, element):
+            for selector, ancestor in candidates:
+                if selector not in found and (ancestor is None or self._has_ancestor(element, ancestor)):
+                    found[selector] = element
+
+        for element in root.iter():
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue  # 주석 / 처리 지시문
+
+            if tag == 'meta':
+                metas.append(element)
+                for attribute, value in META_LOOKUPS:
+                    if (attribute, value) not in meta_found and element.get(attribute) == value:
+                        meta_found[(attribute, value)] = element
+
+            candidates = self._by_tag.get(tag)
+            if candidates:
+                record(candidates, element)
+
+            element_id = element.get('id')
+            if element_id:
+                candidates = self._by_id.get(element_id)
+                if candidates:
+                    record(candidates, element)
+
+            class_attr = element.get('class')
+            if class_attr:
+                for token in class_attr.split():
+                    candidates = self._by_class.get(token)
+                    if candidates:
+                        record(candidates, element)
+                for substring, selector, ancestor in self._by_substring:
+                    if selector not in found and substring in class_attr and (
+                            ancestor is None or self._has_ancestor(element, ancestor)):
+                        found[selector] = element
+
+        return found, meta_found, metas
+
+    def first(self, found: Dict[str, Any], group: str) -> List[Tuple[str, Any]]:
+        """그룹의 선택자 우선순위 순으로 (선택자, 첫 번째 요소) 목록"""
+        return [(selector, found[selector]) for selector in self.groups[group] if selector in found]
+
+
+def _plan_groups() -> Dict[str, List[str]]:
+    groups = {
+        'author': AUTHOR_SELECTORS,
+        'date': DATE_SELECTORS,
+        'publisher': PUBLISHER_SELECTORS,
+        'fallback': ['main', 'title'],
+    }
+    for profile in [GENERIC_SITE] + SITE_PROFILES:
+        groups[f'{profile.name}:article'] = profile.article_selectors
+        groups[f'{profile.name}:title'] = profile.title_selectors
+        groups[f'{profile.name}:lead_title'] = profile.lead_title_selectors
+        groups[f'{profile.name}:press'] = profile.press_selectors
+    return groups
+
+
+# 모든 사이트 전략의 선택자를 한 번에 컴파일 (사이트와 무관하게 순회는 1회)
+EXTRACTION_PLAN = ExtractionPlan(_plan_groups())
+
+
+def parse_html(html: Union[str, bytes], encoding: Optional[str] = None):
+    """
+    HTML 문자열 또는 응답 바이트를 lxml 트리로 변환 (실패 시 None)
+
+    바이트는 파이썬에서 디코딩하지 않고 encoding(미지정 시 UTF-8)으로 libxml2 에 바로 전달한다.
+    """
+    if not html or not html.strip():
+        return None
+    if isinstance(html, str):
+        # 인코딩 선언이 포함된 문자열도 처리하도록 UTF-8 바이트로 전달
+        html, encoding = html.encode('utf-8', errors='replace'), 'utf-8'
+    try:
+        parser = lxml.html.HTMLParser(encoding=encoding or 'utf-8')
+    except LookupError:
+        # libxml2 가 모르는 인코딩 이름이면 파이썬에서 한 번 디코딩
+        html = html.decode(encoding, errors='replace').encode('utf-8')
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+    try:
+        return lxml.html.document_fromstring(html, parser=parser)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def element_text(element) -> str:
+    """BeautifulSoup get_text() 와 같은 규칙의 텍스트 (script/style/template, 주석 제외)"""
+    parts: List[str] = []
+
+    def walk(node):
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str) and child.tag not in _SKIP_TEXT_TAGS:
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    if isinstance(element.tag, str) and element.tag not in _SKIP_TEXT_TAGS:
+        walk(element)
+    return ''.join(parts)
+
+
+class ParsedArticle:
+    """한 번 파싱한 문서에서 추출한 기사 구성 요소"""
+
+    def __init__(self, html: Union[str, bytes], url: str, site: Optional[SiteProfile] = None,
+                 encoding: Optional[str] = None):
+        self.url = url
+        self.site = site or get_site_profile(url)
+        self.root = parse_html(html, encoding)
+        if self.root is None:
+            self._found: Dict[str, Any] = {}
+            self._meta: Dict[Tuple[str, str], Any] = {}
+            self._metas: List[Any] = []
+        else:
+            self._found, self._meta, self._metas = EXTRACTION_PLAN.run(self.root)
+
+    def _meta_content(self, attribute: str, value: str) -> Optional[str]:
+        """첫 번째 meta 요소의 content (요소가 없으면 None)"""
+        element = self._meta.get((attribute, value))
+        if element is None:
+            return None
+        return element.get('content', '')
+
+    def find_article(self):
+        """기사 본문 요소"""
+        for _, element in EXTRACTION_PLAN.first(self._found, f'{self.site.name}:article'):
+            return element
+
+        # Fallback: look for main content area
+        main = self._found.get('main')
+        if main is not None:
+            return main
+        if self.root is not None:
+            for element in self.root.iter('div'):
+                if element.get('role') == 'main':
+                    return element
+        return None
+
+    def title(self) -> str:
+        """제목 (WebExtractor._get_title 과 같은 우선순위)"""
+        # 사이트 제목 (Yahoo Finance 등, 먼저 시도)
+        for _, element in EXTRACTION_PLAN.first(self._found, f'{self.site.name}:lead_title'):
+            text = strip_title_suffix(element_text(element).strip(), self.site)
+            # 유효한 제목인지 확인
+            if text and 10 <= len(text) <= 200:
+                return text.strip()
+
+        # 일반적인 제목 선택자들
+        for _, element in EXTRACTION_PLAN.first(self._found, f'{self.site.name}:title'):
+            text = element_text(element).strip()
+            if text and len(text) > 5:
+                return text
+
+        # meta 태그에서 제목 추출
+        content = self._meta_content('property', 'og:title')
+        if content and content.strip():
+            return content.strip()
+
+        # HTML title 태그 (fallback)
+        html_title = self._found.get('title')
+        if html_title is not None:
+            text = element_text(html_title).strip()
+            if text:
+                return text
+
+        return "제목 없음"
+
+    def metadata(self) -> Dict[str, str]:
+        """메타데이터 (description, author, published_time, keywords)"""
+        metadata: Dict[str, str] = {}
+        for meta in self._metas:
+            name = meta.get('name', meta.get('property', ''))
+            content = meta.get('content', '')
+            name_lower = name.lower()
+            if name_lower in META_NAMES and content:
+                metadata[name_lower] = content
+        return metadata
+
+    def author(self) -> str:
+        """저자 정보"""
+        content = self._meta_content('name', 'author')
+        if content:
+            return content
+
+        for _, element in EXTRACTION_PLAN.first(self._found, 'author'):
+            text = element_text(element).strip()
+            if text and len(text) < 100:  # Reasonable author name length
+                return text
+        return ''
+
+    def publish_date(self) -> str:
+        """발행일"""
+        content = self._meta_content('name', 'date')
+        if content is None:
+            content = self._meta_content('property', 'article:published_time')
+        if content:
+            return content
+
+        for _, element in EXTRACTION_PLAN.first(self._found, 'date'):
+            text = element_text(element).strip()
+            if text and len(text) < 50:  # Reasonable date length
+                return text
+        return ''
+
+    def publisher(self) -> str:
+        """출처/발행사 정보"""
+        # 1. Meta 태그에서 publisher 정보 찾기
+        content = None
+        for attribute, value in (('property', 'og:site_name'), ('name', 'publisher'), ('property', 'article:publisher')):
+            content = self._meta_content(attribute, value)
+            if content is not None:
+                break
+        if content:
+            return content.strip()
+
+        # 2. 사이트 전략의 언론사 로고 (네이버 뉴스: 포털 대신 실제 언론사)
+        for _, element in EXTRACTION_PLAN.first(self._found, f'{self.site.name}:press'):
+            alt_text = element.get('alt', '')
+            if alt_text and alt_text.strip():
+                return alt_text.strip()
+
+        # 3. 도메인별 하드코딩된 출처 매핑
+        domain = urlparse(self.url).netloc.lower()
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        for key, value in DOMAIN_TO_PUBLISHER.items():
+            if key in domain:
+                return value
+
+        # 4. HTML에서 publisher 정보 찾기
+        for _, element in EXTRACTION_PLAN.first(self._found, 'publisher'):
+            # 이미지인 경우 alt 텍스트 확인
+            if element.tag == 'img':
+                alt_text = element.get('alt', '')
+                if alt_text:
+                    return alt_text.strip()
+            else:
+                text = element_text(element).strip()
+                if text and len(text) < 50:
+                    return text
+
+        # 5. 도메인명을 출처로 사용 (fallback)
+        return domain.split('.')[0].title()
+
+
+def strip_title_suffix(text: str, site: SiteProfile) -> str:
+    """사이트 제목에서 사이트명 접미사 제거 (첫 번째로 발견된 접미사만)"""
+    for suffix in site.title_suffixes:
+        if suffix in text:
+            return text.replace(suffix, '')
+    return text
+
+
+def extract_blocks(article) -> List[str]:
+    """
+    본문 요소를 한 번 순회하며 블록 단위 텍스트 추출
+
+    각 텍스트 노드는 자신을 감싸는 가장 가까운 블록 요소의 문단으로 정확히 한 번만 들어간다.
+    (중첩 div 마다 하위 텍스트 전체를 다시 만들던 방식의 중복/제곱 비용 제거)
+    블록 요소와 <br> 은 문단 경계가 되고, 문단 안의 공백은 한 칸으로 합친다.
+    광고/관련 기사/내비게이션 등 본문이 아닌 하위 트리는 건너뛴다.
+    """
+    blocks: List[str] = []
+    buffer: List[str] = []
+
+    def flush():
+        if buffer:
+            text = ' '.join(''.join(buffer).split())
+            buffer.clear()
+            if text:
+                blocks.append(text)
+
+    def walk(node):
+        if node.text:
+            buffer.append(node.text)
+        for child in node:
+            tag = child.tag
+            if isinstance(tag, str) and not _is_boilerplate(child):
+                is_block = tag in _BLOCK_TAGS
+                if is_block:
+                    flush()
+                walk(child)
+                if is_block:
+                    flush()
+            if child.tail:
+                buffer.append(child.tail)
+
+    walk(article)
+    flush()
+    return blocks
+
+
+def _is_boilerplate(element) -> bool:
+    if element.tag in _SKIP_TEXT_TAGS or element.tag in _NON_CONTENT_TAGS:
+        return True
+    marker = f"{element.get('class') or ''} {element.get('id') or ''}"
+    return bool(marker.strip()) and _BOILERPLATE_MARKER.search(marker) is not None
+
+
+def extract_paragraphs(article) -> List[str]:
+    """본문 요소에서 문단 텍스트 목록 추출"""
+    skip_keywords = [
+        'recommended', 'related', 'subscribe', 'follow', 'download',
+        'sign up', 'newsletter', 'advertisement', 'sponsored'
+    ]
+
+    # Skip promotional content
+    return [
+        text for text in extract_blocks(article)
+        if len(text) > 10 and not any(keyword in text.lower() for keyword in skip_keywords)
+    ]
+
+
+def extract_paragraphs_from_html(fragment: str) -> List[str]:
+    """HTML 조각(본문 요소 직렬화 결과)에서 문단 텍스트 목록 추출"""
+    if not fragment or not fragment.strip():
+        return []
+    try:
+        return extract_paragraphs(lxml.html.fragment_fromstring(fragment, create_parent='div'))
+    except (etree.ParserError, ValueError):
+        return []
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+본문 추출 회귀 검사
+
+benchmarks/fixtures/content_corpus.json 에 등록된 고정 페이지마다
+기존 본문 추출 방식(중첩 div 마다 get_text() 반복)과 현재 WebExtractor 결과를 비교한다.
+- 출력 크기(문자 수)와 토큰 수(근사치)가 줄었는지
+- 반드시 포함되어야 할 문장(must_contain)이 남아 있고 광고/관련 기사 등(must_not_contain)이 빠졌는지
+- 기존 출력의 문장이 현재 출력에 얼마나 남아 있는지 (문장 보존율)
+
+사용법:
+    python benchmarks/content_regression.py
+    python benchmarks/content_regression.py --json
+"""
+
+import argparse
+import json
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup, Tag
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+sys.path.insert(0, str(ROOT_DIR))
+
+from article_parser import get_site_profile  # noqa: E402
+from web_extractor import WebExtractor  # noqa: E402
+
+SKIP_KEYWORDS = [
+    'recommended', 'related', 'subscribe', 'follow', 'download',
+    'sign up', 'newsletter', 'advertisement', 'sponsored'
+]
+
+
+def legacy_paragraphs(article):
+    """기존 _get_content 방식 (비교 기준으로 고정)"""
+    paragraphs = []
+    for element in article.find_all(['p', 'h2', 'h3', 'h4', 'blockquote', 'div']):
+        if not isinstance(element, Tag):
+            continue
+        text = element.get_text().strip()
+        if text and len(text) > 10 and not any(keyword in text.lower() for keyword in SKIP_KEYWORDS):
+            paragraphs.append(text)
+    return paragraphs
+
+
+def estimate_tokens(text):
+    """토큰 수 근사치 (ASCII 4자당 1토큰, 그 외 문자는 1자당 1토큰)"""
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return round(ascii_chars / 4 + (len(text) - ascii_chars))
+
+
+def normalize(text):
+    return ' '.join(text.split())
+
+
+def sentences(paragraphs):
+    """문장 보존율 계산용 문장 집합"""
+    found = set()
+    for paragraph in paragraphs:
+        for sentence in re.split(r'(?<=[.!?])\s+|\n+', paragraph):
+            sentence = normalize(sentence)
+            if len(sentence) >= 15:
+                found.add(sentence)
+    return found
+
+
+def check_fixture(extractor, name, spec):
+    html = (FIXTURES_DIR / name).read_text(encoding='utf-8')
+    url = spec['url']
+
+    start = time.perf_counter()
+    article = extractor._find_article(BeautifulSoup(html, 'html.parser'), get_site_profile(url))
+    legacy = legacy_paragraphs(article) if article else []
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    result = extractor._parse_html(html, url)
+    current_ms = (time.perf_counter() - start) * 1000
+    current = result.get('content', {}).get('paragraphs', []) if result.get('success') else []
+
+    legacy_text = '\n\n'.join(legacy)
+    current_text = '\n\n'.join(current)
+    flat_current = normalize(current_text)
+
+    legacy_sentences = sentences(legacy)
+    missing_sentences = sorted(sentence for sentence in legacy_sentences if sentence not in flat_current)
+    missing_required = [text for text in spec.get('must_contain', []) if normalize(text) not in flat_current]
+    leaked = [text for text in spec.get('must_not_contain', []) if normalize(text) in flat_current]
+
+    legacy_tokens, current_tokens = estimate_tokens(legacy_text), estimate_tokens(current_text)
+    failures = []
+    if missing_required:
+        failures.append('must_contain 누락')
+    if leaked:
+        failures.append('must_not_contain 포함')
+    if legacy_tokens and current_tokens > legacy_tokens:
+        failures.append('토큰 수 증가')
+
+    return {
+        'legacy': {'paragraphs': len(legacy), 'chars': len(legacy_text), 'tokens': legacy_tokens, 'ms': round(legacy_ms, 2)},
+        'current': {'paragraphs': len(current), 'chars': len(current_text), 'tokens': current_tokens, 'ms': round(current_ms, 2)},
+        'token_reduction': round(1 - current_tokens / legacy_tokens, 4) if legacy_tokens else None,
+        'sentence_retention': round(1 - len(missing_sentences) / len(legacy_sentences), 4) if legacy_sentences else None,
+        'missing_sentences': missing_sentences,
+        'missing_required': missing_required,
+        'leaked': leaked,
+        'failures': failures
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='본문 추출 회귀 검사')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    corpus = json.loads((FIXTURES_DIR / 'content_corpus.json').read_text(encoding='utf-8'))
+    extractor = WebExtractor(save_to_file=False)
+    results = {name: check_fixture(extractor, name, spec) for name, spec in corpus.items()}
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        print("🧪 본문 추출 회귀 검사 (기존 → 현재)")
+        for name, stat in results.items():
+            legacy, current = stat['legacy'], stat['current']
+            print(f"\n📄 {name}")
+            print(f"   문단   {legacy['paragraphs']:>7} → {current['paragraphs']}")
+            print(f"   문자   {legacy['chars']:>7,} → {current['chars']:,}")
+            print(f"   토큰   {legacy['tokens']:>7,} → {current['tokens']:,}"
+                  + (f" ({stat['token_reduction'] * 100:.1f}% 감소)" if stat['token_reduction'] is not None else " (기존 추출 결과 없음)"))
+            print(f"   시간   {legacy['ms']:>5.1f}ms → {current['ms']:.1f}ms")
+            if stat['sentence_retention'] is not None:
+                print(f"   기존 문장 보존율 {stat['sentence_retention'] * 100:.1f}%")
+            for sentence in stat['missing_sentences'][:5]:
+                print(f"     - 현재 출력에 없음: {sentence[:80]}")
+            print(f"   {'✅ 통과' if not stat['failures'] else '❌ ' + ', '.join(stat['failures'])}")
+
+    if any(stat['failures'] for stat in results.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
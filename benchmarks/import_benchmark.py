@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+모듈 import 시간 벤치마크
+
+각 모듈을 새 인터프리터에서 `python -X importtime` 으로 import 하여
+모듈별 누적 import 시간을 측정한다. 무거운 의존성이 다시 시작 시점에
+로드되는 회귀를 잡기 위한 용도.
+
+사용법:
+    python benchmarks/import_benchmark.py
+    python benchmarks/import_benchmark.py --repeat 5 --top 15
+    python benchmarks/import_benchmark.py --max-app-ms 1500   # 초과 시 종료 코드 1
+    python benchmarks/import_benchmark.py --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# 프로젝트 모듈 (app 은 전체 서버 부팅 비용)
+PROJECT_MODULES = [
+    'app',
+    'nongbuxx_generator',
+    'web_extractor',
+    'converter',
+    'blog_content_generator',
+    'url_extractor',
+    'x_publisher',
+    'x_crawler',
+    'scheduler_service',
+]
+
+# 지연 로드 대상 선택 의존성 - `import app` 시점에 로드되면 안 됨
+LAZY_DEPENDENCIES = ['selenium', 'webdriver_manager', 'tweepy', 'anthropic', 'openai', 'apscheduler']
+
+
+def measure_import(module_name):
+    """새 인터프리터에서 모듈 import 시간 측정 - {모듈명: (self_us, cumulative_us)}"""
+    env = {**os.environ, 'PYTHONDONTWRITEBYTECODE': '1', 'WARM_START': 'false'}
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{module_name} import 실패:\n{proc.stderr[-2000:]}")
+
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            timings[name.strip()] = (int(self_us), int(cumulative_us))
+        except ValueError:
+            continue
+    return timings
+
+
+def run_benchmark(modules, repeat):
+    """모듈별 누적 import 시간(중앙값, ms) 및 app import 시 로드된 지연 의존성 반환"""
+    results = {}
+    loaded_lazy = []
+    for module_name in modules:
+        samples = []
+        for _ in range(repeat):
+            timings = measure_import(module_name)
+            samples.append(timings.get(module_name, (0, 0))[1] / 1000)
+            if module_name == 'app':
+                loaded_lazy = sorted(dep for dep in LAZY_DEPENDENCIES if dep in timings)
+        results[module_name] = {
+            'median_ms': round(statistics.median(samples), 1),
+            'min_ms': round(min(samples), 1),
+            'max_ms': round(max(samples), 1)
+        }
+    return results, loaded_lazy
+
+
+def top_contributors(module_name, top):
+    """모듈 import 시 누적 시간이 큰 하위 top-level 패키지"""
+    timings = measure_import(module_name)
+    by_package = {}
+    for name, (_, cumulative_us) in timings.items():
+        package = name.split('.')[0]
+        if package == module_name:
+            continue
+        by_package[package] = max(by_package.get(package, 0), cumulative_us)
+    ranked = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+    return [(package, round(us / 1000, 1)) for package, us in ranked]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='모듈 import 시간 벤치마크')
+    parser.add_argument('--modules', nargs='+', default=PROJECT_MODULES, help='측정할 모듈 목록')
+    parser.add_argument('--repeat', type=int, default=3, help='모듈별 반복 측정 횟수 (중앙값 사용)')
+    parser.add_argument('--top', type=int, default=10, help='app import 시 비용이 큰 패키지 표시 개수')
+    parser.add_argument('--max-app-ms', type=float, help='app import 허용 시간 (초과 시 종료 코드 1)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    results, loaded_lazy = run_benchmark(args.modules, args.repeat)
+    contributors = top_contributors('app', args.top) if 'app' in args.modules else []
+
+    if args.json:
+        print(json.dumps({
+            'python': sys.version.split()[0],
+            'modules': results,
+            'app_top_packages_ms': dict(contributors),
+            'lazy_dependencies_loaded_by_app': loaded_lazy
+        }, indent=2, ensure_ascii=False))
+    else:
+        print(f"📦 모듈 import 시간 (Python {sys.version.split()[0]}, {args.repeat}회 중앙값)")
+        print(f"{'module':<26}{'median':>10}{'min':>10}{'max':>10}")
+        for module_name, stat in results.items():
+            print(f"{module_name:<26}{stat['median_ms']:>8.1f}ms{stat['min_ms']:>8.1f}ms{stat['max_ms']:>8.1f}ms")
+
+        if contributors:
+            print(f"\n🔍 `import app` 비용 상위 패키지")
+            for package, ms in contributors:
+                print(f"   {package:<24}{ms:>8.1f}ms")
+
+        if 'app' in args.modules:
+            if loaded_lazy:
+                print(f"\n⚠️ `import app` 시점에 로드된 지연 로드 대상: {', '.join(loaded_lazy)}")
+            else:
+                print(f"\n✅ 지연 로드 대상({', '.join(LAZY_DEPENDENCIES)})은 `import app` 시점에 로드되지 않음")
+
+    if args.max_app_ms is not None and 'app' in results:
+        if results['app']['median_ms'] > args.max_app_ms:
+            print(f"\n❌ app import {results['app']['median_ms']}ms > 허용치 {args.max_app_ms}ms")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
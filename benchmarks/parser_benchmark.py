@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+기사 파싱 엔진 벤치마크
+
+benchmarks/fixtures/ 의 고정 기사 페이지(Yahoo Finance / 네이버 뉴스 구조)를
+WebExtractor 의 두 파싱 엔진으로 처리하여 시간을 비교하고 결과가 같은지 확인한다.
+- html.parser: 기존 BeautifulSoup 경로 (필드마다 select_one 으로 트리 재탐색)
+- lxml: article_parser 경로 (트리 1회 생성 + 컴파일된 추출 계획 1회 순회)
+
+사용법:
+    python benchmarks/parser_benchmark.py
+    python benchmarks/parser_benchmark.py --repeat 50
+    python benchmarks/parser_benchmark.py --json
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+sys.path.insert(0, str(ROOT_DIR))
+
+from web_extractor import WebExtractor  # noqa: E402
+
+# 고정 페이지별 원본 URL (출처/특수 처리 판단에 사용)
+FIXTURE_URLS = {
+    'yahoo_finance_article.html': 'https://finance.yahoo.com/news/chipmakers-rally-134500123.html',
+    'naver_news_article.html': 'https://n.news.naver.com/mnews/article/001/0014712345',
+}
+
+ENGINES = ['html.parser', 'lxml']
+
+
+def parse_with(extractor, engine, html, url):
+    extractor.parser_engine = engine
+    result = extractor._parse_html(html, url)
+    result.pop('timestamp', None)
+    return result
+
+
+def time_engine(extractor, engine, html, url, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_with(extractor, engine, html, url)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': round(statistics.median(samples), 2),
+        'min_ms': round(min(samples), 2)
+    }
+
+
+def run_benchmark(repeat):
+    extractor = WebExtractor(save_to_file=False)
+    results = {}
+    for fixture in sorted(FIXTURES_DIR.glob('*.html')):
+        html = fixture.read_text(encoding='utf-8')
+        url = FIXTURE_URLS.get(fixture.name, f'https://example.com/{fixture.stem}')
+
+        outputs = {engine: parse_with(extractor, engine, html, url) for engine in ENGINES}
+        timings = {engine: time_engine(extractor, engine, html, url, repeat) for engine in ENGINES}
+        baseline, optimized = timings['html.parser']['median_ms'], timings['lxml']['median_ms']
+        results[fixture.name] = {
+            'bytes': len(html.encode('utf-8')),
+            'engines': timings,
+            'speedup': round(baseline / optimized, 2) if optimized else None,
+            'same_output': outputs['html.parser'] == outputs['lxml'],
+            'differences': sorted(
+                key for key in set(outputs['html.parser']) | set(outputs['lxml'])
+                if outputs['html.parser'].get(key) != outputs['lxml'].get(key)
+            )
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 파싱 엔진 벤치마크')
+    parser.add_argument('--repeat', type=int, default=20, help='고정 페이지별 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    results = run_benchmark(args.repeat)
+
+    if args.json:
+        print(json.dumps({'python': sys.version.split()[0], 'fixtures': results}, indent=2, ensure_ascii=False))
+    else:
+        print(f"📰 기사 파싱 엔진 비교 ({args.repeat}회 중앙값)")
+        print(f"{'fixture':<30}{'KB':>7}{'html.parser':>14}{'lxml':>10}{'speedup':>10}  output")
+        for name, stat in results.items():
+            same = '동일' if stat['same_output'] else f"차이: {', '.join(stat['differences'])}"
+            print(f"{name:<30}{stat['bytes'] / 1024:>7.1f}"
+                  f"{stat['engines']['html.parser']['median_ms']:>12.2f}ms"
+                  f"{stat['engines']['lxml']['median_ms']:>8.2f}ms"
+                  f"{stat['speedup']:>9.2f}x  {same}")
+
+    if not all(stat['same_output'] for stat in results.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+사이트 판별 방식 마이크로벤치마크
+
+기존 _get_title 은 Yahoo Finance 여부를 확인하려고 기사마다 문서 전체를 다시 문자열로 만들었다
+('finance.yahoo.com' in str(soup)). 현재는 URL 호스트로 사이트 전략(SiteProfile)을 한 번 고른다.
+- 판별 비용: str(soup) 직렬화 검사 vs get_site_profile(url)
+- 기사 1건 파싱 시간: 기존 제목 추출(직렬화 포함) vs 현재 (html.parser / lxml 경로)
+
+사용법:
+    python benchmarks/site_dispatch_benchmark.py
+    python benchmarks/site_dispatch_benchmark.py --repeat 50
+    python benchmarks/site_dispatch_benchmark.py --json
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup, Tag
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+sys.path.insert(0, str(ROOT_DIR))
+
+from article_parser import get_site_profile  # noqa: E402
+from parser_benchmark import FIXTURE_URLS  # noqa: E402
+from web_extractor import WebExtractor  # noqa: E402
+
+
+def legacy_get_title(soup, site=None):
+    """기존 _get_title (문서 전체 직렬화로 Yahoo Finance 판별, 비교 기준으로 고정)"""
+    if 'finance.yahoo.com' in str(soup):
+        for selector in ['.cover-title', 'title']:
+            title = soup.select_one(selector)
+            if title and isinstance(title, Tag):
+                text = title.get_text().strip()
+                if ' - Yahoo Finance' in text:
+                    text = text.replace(' - Yahoo Finance', '')
+                elif ' | Yahoo Finance' in text:
+                    text = text.replace(' | Yahoo Finance', '')
+                if text and 10 <= len(text) <= 200:
+                    return text.strip()
+
+    for selector in ['h1', '#title_area h2', '.media_end_head_headline h2', '#articleTitle',
+                     '.headline', '.title', '[class*="title"]', '[class*="headline"]']:
+        title = soup.select_one(selector)
+        if title and isinstance(title, Tag):
+            text = title.get_text().strip()
+            if text and len(text) > 5:
+                return text
+
+    og_title = soup.find('meta', property='og:title')
+    if og_title and isinstance(og_title, Tag):
+        content = og_title.get('content', '')
+        if isinstance(content, str) and content:
+            return content.strip()
+
+    title_tag = soup.find('title')
+    if title_tag and isinstance(title_tag, Tag):
+        return title_tag.get_text().strip()
+
+    return "제목 없음"
+
+
+def median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def run_benchmark(repeat):
+    extractor = WebExtractor(save_to_file=False)
+    legacy_extractor = WebExtractor(save_to_file=False)
+    legacy_extractor._get_title = legacy_get_title
+    results = {}
+
+    for fixture in sorted(FIXTURES_DIR.glob('*.html')):
+        html = fixture.read_text(encoding='utf-8')
+        url = FIXTURE_URLS.get(fixture.name, f'https://example.com/{fixture.stem}')
+        soup = BeautifulSoup(html, 'html.parser')
+
+        def parse_legacy():
+            legacy_extractor._parse_content(BeautifulSoup(html, 'html.parser'), url)
+
+        def parse_current():
+            extractor._parse_content(BeautifulSoup(html, 'html.parser'), url, get_site_profile(url))
+
+        extractor.parser_engine = 'lxml'
+        results[fixture.name] = {
+            'site': get_site_profile(url).name,
+            'detect_ms': {
+                'serialize': median_ms(lambda: 'finance.yahoo.com' in str(soup), repeat),
+                'host': median_ms(lambda: get_site_profile(url), repeat)
+            },
+            'parse_ms': {
+                'before': median_ms(parse_legacy, repeat),
+                'after': median_ms(parse_current, repeat),
+                'after_lxml': median_ms(lambda: extractor._parse_html(html, url), repeat)
+            }
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사이트 판별 방식 마이크로벤치마크')
+    parser.add_argument('--repeat', type=int, default=20, help='고정 페이지별 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    results = run_benchmark(args.repeat)
+
+    if args.json:
+        print(json.dumps({'python': sys.version.split()[0], 'fixtures': results}, indent=2, ensure_ascii=False))
+        return
+
+    print(f"🧭 사이트 판별 방식 비교 ({args.repeat}회 중앙값)")
+    for name, stat in results.items():
+        detect, parse = stat['detect_ms'], stat['parse_ms']
+        print(f"\n📄 {name} (site: {stat['site']})")
+        print(f"   판별       str(soup) {detect['serialize']:>8.3f}ms → 호스트 {detect['host']:.3f}ms")
+        print(f"   기사 파싱  기존 {parse['before']:>8.2f}ms → 현재 {parse['after']:.2f}ms (lxml {parse['after_lxml']:.2f}ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,8 @@
 
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import json
@@ -9,19 +11,28 @@ import logging
 
 # Import our existing modules
 from converter import NewsConverter
+from content_cache import content_fingerprint, get_content_cache, normalize_url
+
+# 생성 조각 (API 호출 1회 단위) - 조각별로 캐시하므로 나중에 다른 형식을 요청해도 없는 조각만 생성
+BLOG_PIECES = ['markdown', 'html', 'wordpress', 'tistory', 'naver']
 
 class BlogContentGenerator:
-    def __init__(self, api_provider='anthropic', api_key=None):
+    def __init__(self, api_provider='anthropic', api_key=None, converter=None, piece_cache=None):
         """
         완성형 블로그 콘텐츠 생성기
         
         Args:
             api_provider: 'anthropic' 또는 'openai'
             api_key: 사용자 제공 API 키
+            converter: 공유할 NewsConverter (없으면 새로 생성)
+            piece_cache: 생성 조각 캐시 (없으면 생성 콘텐츠 캐시 사용)
         """
         self.api_provider = api_provider
         self.api_key = api_key
-        self.converter = NewsConverter(api_provider=api_provider, api_key=api_key)
+        self.converter = converter or NewsConverter(api_provider=api_provider, api_key=api_key)
+        self.piece_cache = piece_cache if piece_cache is not None else get_content_cache()
+        # 블로그 1건의 API 호출 동시 실행 수 (1이면 순차 호출)
+        self.max_parallel_calls = int(os.getenv('BLOG_PARALLEL_CALLS', 5))
         
         # 출력 디렉토리 설정
         self.output_dir = Path('generated_content')
@@ -130,6 +141,56 @@ class BlogContentGenerator:
         self.logger.info(f"출처 감지 결과: {source_info['name']} → 권장 형식: {source_info['recommended_formats']}")
         return source_info
 
+    def resolve_formats(self, extracted_data=None, selected_formats=None, wordpress_type='text'):
+        """
+        저장할 파일 형식 결정 (생성 전에 호출하여 필요한 조각만 생성)
+        
+        Args:
+            extracted_data: 원본 뉴스 데이터 (출처 감지용)
+            selected_formats: 사용자 선택 형식 (None이면 출처에 따라 자동 결정)
+            wordpress_type: 워드프레스 형식 ('text' 또는 'html')
+            
+        Returns:
+            list: 형식 목록 ('md', 'wordpress', 'tistory', 'naver')
+        """
+        if selected_formats is None:
+            if extracted_data:
+                source_info = self.detect_news_source(extracted_data)
+                selected_formats = source_info['recommended_formats']
+                self.logger.info(f"출처 기반 자동 형식 선택: {source_info['name']} → {selected_formats}")
+            else:
+                # 추출 데이터가 없는 경우 기본값 사용
+                selected_formats = ['md', 'wordpress']
+                self.logger.info(f"기본 형식 사용: {selected_formats}")
+        else:
+            self.logger.info(f"사용자 선택 형식 사용: {selected_formats}")
+        
+        # 워드프레스 HTML이 선택된 경우 md 파일 생성하지 않음
+        if 'wordpress' in selected_formats and wordpress_type == 'html':
+            selected_formats = [fmt for fmt in selected_formats if fmt != 'md']
+        return list(selected_formats)
+    
+    @staticmethod
+    def required_pieces(formats, wordpress_type='text'):
+        """형식 목록을 만드는 데 필요한 생성 조각 (워드프레스 HTML은 html 조각 사용)"""
+        pieces = set()
+        for fmt in formats:
+            if fmt == 'md':
+                pieces.add('markdown')
+            elif fmt == 'wordpress':
+                pieces.add('html' if wordpress_type == 'html' else 'wordpress')
+            elif fmt in ('tistory', 'naver'):
+                pieces.add(fmt)
+        return [piece for piece in BLOG_PIECES if piece in pieces]
+    
+    def _piece_cache_key(self, extracted_data, piece):
+        """조각 캐시 키 (제공자 + URL + 본문 지문 + 조각)"""
+        fingerprint = content_fingerprint(extracted_data, min_chars=1)
+        if fingerprint is None:
+            return None
+        url = normalize_url(extracted_data.get('url', ''))
+        return f"blog:{self.api_provider}:{url}:{fingerprint[:32]}:{piece}"
+    
     def generate_complete_blog_content(self, extracted_data):
         """
         완성형 블로그 콘텐츠 생성 (메타 정보 없이 순수 콘텐츠만)
@@ -462,6 +523,14 @@ class BlogContentGenerator:
             if field in filtered_data and filtered_data[field]:
                 content = filtered_data[field]
                 
+                # content가 딕셔너리인 경우 text 필드 추출
+                if isinstance(content, dict):
+                    content = content.get('text', '')
+                
+                # 문자열이 아닌 경우 건너뛰기
+                if not isinstance(content, str):
+                    continue
+                
                 # 🚨 ETF 홍보성 콘텐츠 체크 (제목에 해당 패턴이 있으면 전체 콘텐츠 제외)
                 if field == 'title':
                     for pattern in etf_promotional_patterns:
@@ -501,7 +570,11 @@ class BlogContentGenerator:
                 content = re.sub(r'\s+', ' ', content)
                 content = re.sub(r'\n\s*\n', '\n\n', content)
                 
-                filtered_data[field] = content.strip()
+                # content 필드가 원래 딕셔너리였으면 원본을 바꾸지 않고 새 딕셔너리로 저장
+                if isinstance(filtered_data[field], dict):
+                    filtered_data[field] = {**filtered_data[field], 'text': content.strip()}
+                else:
+                    filtered_data[field] = content.strip()
         
         self.logger.info("✅ Zacks/Automated Insights 관련 내용 및 ETF 홍보성 콘텐츠 필터링 완료")
         
@@ -529,46 +602,128 @@ HTML 형식으로 작성해주세요."""
         response = self.converter.call_api(prompt, max_tokens=4000)
         return self.converter.clean_response(response)
     
-    def generate_rich_text_blog_content(self, extracted_data, wordpress_type='text'):
+    def generate_rich_text_blog_content(self, extracted_data, wordpress_type='text', formats=None):
         """
         Rich Text 형식의 블로그 콘텐츠 생성 (다양한 블로그 플랫폼 지원)
         
         Args:
             extracted_data: 웹에서 추출된 데이터
             wordpress_type: 워드프레스 형식 ('text' 또는 'html')
+            formats: 만들 형식 목록 (resolve_formats 결과, None이면 모든 조각 생성)
             
         Returns:
-            dict: 다양한 형식의 블로그 콘텐츠
+            dict: 다양한 형식의 블로그 콘텐츠 (meta_info.timings 에 API 호출별 소요 시간)
+            formats 를 주면 해당 형식에 필요한 조각만 포함한다.
         """
         
-        # 기본 완성형 콘텐츠 생성
-        markdown_content = self.generate_complete_blog_content(extracted_data)
+        pieces = BLOG_PIECES if formats is None else self.required_pieces(formats, wordpress_type)
         
-        # HTML 형식 콘텐츠 생성
-        html_content = self.generate_html_blog_content(extracted_data)
+        # 이미 생성한 조각은 캐시에서 재사용
+        results, cached_pieces = {}, []
+        cache_keys = {piece: self._piece_cache_key(extracted_data, piece) for piece in pieces}
+        for piece, key in cache_keys.items():
+            cached = self.piece_cache.get(key) if key else None
+            if cached is not None:
+                results[piece] = cached
+                cached_pieces.append(piece)
+        
+        # 남은 조각의 프롬프트는 서로 독립적이므로 동시에 호출 (전체 시간 ≈ 가장 느린 호출 1회)
+        prompts = self._build_platform_prompts(extracted_data, wordpress_type)
+        builders = {
+            'markdown': lambda: self.generate_complete_blog_content(extracted_data),
+            'html': lambda: self.generate_html_blog_content(extracted_data)
+        }
+        for platform, prompt in prompts.items():
+            builders[platform] = lambda prompt=prompt: self.converter.clean_response(
+                self.converter.call_api(prompt, max_tokens=4000)
+            )
+        tasks = {piece: builders[piece] for piece in pieces if piece not in results}
         
-        # 플랫폼별 최적화된 콘텐츠 생성
-        platform_optimized = self.generate_platform_optimized_content(extracted_data, wordpress_type)
+        start = time.time()
+        generated, timings = self._run_parallel(tasks)
+        total_seconds = round(time.time() - start, 3)
+        if tasks:
+            self.logger.info(
+                f"⚡ 블로그 API 호출 {len(tasks)}개 완료: 전체 {total_seconds}초 "
+                f"(순차 합계 {sum(timings.values()):.3f}초, 동시 {self.max_parallel_calls}개, 캐시 재사용 {cached_pieces or '없음'})"
+            )
+        
+        for piece, content in generated.items():
+            results[piece] = content
+            # 생성 실패 메시지는 캐시하지 않음
+            if cache_keys[piece] and isinstance(content, str) and not content.startswith('오류:'):
+                self.piece_cache.set(cache_keys[piece], content)
+        
+        rich_content = {}
+        if 'markdown' in results:
+            rich_content['markdown'] = results['markdown']
+        if 'html' in results:
+            rich_content['html'] = results['html']
+        platform_optimized = {platform: results[platform] for platform in prompts if platform in results}
         
         # 워드프레스 HTML 형식인 경우 개선된 html_content 사용
-        if wordpress_type == 'html':
-            platform_optimized['wordpress'] = html_content
+        if wordpress_type == 'html' and 'html' in results:
+            platform_optimized['wordpress'] = results['html']
         
-        return {
-            'markdown': markdown_content,
-            'html': html_content,
+        main_content = results.get('markdown') or next(iter(results.values()), '')
+        rich_content.update({
             'platform_optimized': platform_optimized,
             'meta_info': {
                 'title': extracted_data['title'],
                 'description': extracted_data.get('description', ''),
                 'created_at': datetime.now().isoformat(),
-                'word_count': len(markdown_content.split())
+                'word_count': len(main_content.split()),
+                'formats': formats,
+                'generated_pieces': list(generated),
+                'cached_pieces': cached_pieces,
+                'timings': {
+                    'calls': timings,
+                    'total_seconds': total_seconds
+                }
             }
-        }
+        })
+        return rich_content
+    
+    def _run_parallel(self, tasks):
+        """
+        독립적인 API 호출들을 스레드 풀에서 동시에 실행
+        
+        Args:
+            tasks: 이름 → 인자 없는 호출 함수
+            
+        Returns:
+            tuple: (이름 → 결과, 이름 → 소요 시간(초))
+            
+        하나라도 실패하면 아직 시작하지 않은 호출은 취소하고 예외를 그대로 전달한다.
+        """
+        timings = {}
+        
+        def timed(name, fn):
+            start = time.time()
+            try:
+                return fn()
+            finally:
+                timings[name] = round(time.time() - start, 3)
+        
+        if self.max_parallel_calls <= 1 or len(tasks) <= 1:
+            return {name: timed(name, fn) for name, fn in tasks.items()}, timings
+        
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_parallel_calls, len(tasks)),
+            thread_name_prefix='nongbuxx-blog'
+        )
+        try:
+            futures = {name: executor.submit(timed, name, fn) for name, fn in tasks.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+        return results, {name: timings[name] for name in tasks}
     
     def generate_platform_optimized_content(self, extracted_data, wordpress_type='text'):
         """
-        다양한 블로그 플랫폼에 최적화된 콘텐츠 생성
+        다양한 블로그 플랫폼에 최적화된 콘텐츠 생성 (플랫폼별 API 호출 동시 실행)
         
         Args:
             extracted_data: 웹에서 추출된 데이터
@@ -577,6 +732,20 @@ HTML 형식으로 작성해주세요."""
         Returns:
             dict: 플랫폼별 최적화된 콘텐츠
         """
+        prompts = self._build_platform_prompts(extracted_data, wordpress_type)
+        results, _ = self._run_parallel({
+            platform: (lambda prompt=prompt: self.converter.call_api(prompt, max_tokens=4000))
+            for platform, prompt in prompts.items()
+        })
+        return {platform: self.converter.clean_response(results[platform]) for platform in prompts}
+    
+    def _build_platform_prompts(self, extracted_data, wordpress_type='text'):
+        """
+        플랫폼별(워드프레스/티스토리/네이버) 프롬프트 생성
+        
+        Returns:
+            dict: {'wordpress', 'tistory', 'naver'} → 프롬프트
+        """
         
         # 워드프레스용 콘텐츠 (텍스트/HTML 선택)
         if wordpress_type == 'text':
@@ -762,8 +931,6 @@ HTML 형식으로 작성해주세요."""
 
 워드프레스 Gutenberg 에디터에 바로 붙여넣을 수 있는 시각적으로 완성도 높은 HTML 콘텐츠를 작성해주세요. HTML 태그를 포함한 완전한 HTML 구조로 작성하세요. 제목은 반드시 매력적인 한국어로!"""
 
-        wordpress_content = self.converter.call_api(wordpress_prompt, max_tokens=4000)
-        
         # 티스토리용 콘텐츠
         tistory_prompt = f"""티스토리 블로그에 최적화된 HTML 콘텐츠를 작성해주세요.
 
@@ -830,8 +997,6 @@ HTML 형식으로 작성해주세요."""
 
 티스토리에 바로 붙여넣을 수 있는 HTML 콘텐츠를 작성해주세요. 제목은 반드시 매력적인 한국어로!"""
 
-        tistory_content = self.converter.call_api(tistory_prompt, max_tokens=4000)
-        
         # 네이버 블로그용 콘텐츠
         naver_prompt = f"""네이버 블로그에 최적화된 콘텐츠를 작성해주세요.
 
@@ -905,12 +1070,10 @@ HTML 형식으로 작성해주세요."""
 
 네이버 블로그에 바로 붙여넣을 수 있는 콘텐츠를 작성해주세요. 제목은 반드시 매력적인 한국어로!"""
 
-        naver_content = self.converter.call_api(naver_prompt, max_tokens=4000)
-        
         return {
-            'wordpress': self.converter.clean_response(wordpress_content),
-            'tistory': self.converter.clean_response(tistory_content),
-            'naver': self.converter.clean_response(naver_content)
+            'wordpress': wordpress_prompt,
+            'tistory': tistory_prompt,
+            'naver': naver_prompt
         }
     
     def save_blog_content(self, content_data, filename_prefix=None, selected_formats=None, extracted_data=None, wordpress_type='text'):
@@ -932,18 +1095,7 @@ HTML 형식으로 작성해주세요."""
             filename_prefix = f"blog_content_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # 출처별 적절한 형식 자동 결정 (selected_formats가 None인 경우에만)
-        if selected_formats is None:
-            if extracted_data:
-                source_info = self.detect_news_source(extracted_data)
-                selected_formats = source_info['recommended_formats']
-                self.logger.info(f"출처 기반 자동 형식 선택: {source_info['name']} → {selected_formats}")
-            else:
-                # 추출 데이터가 없는 경우 기본값 사용
-                selected_formats = ['md', 'wordpress']
-                self.logger.info(f"기본 형식 사용: {selected_formats}")
-        else:
-            # selected_formats가 전달된 경우 그대로 사용
-            self.logger.info(f"사용자 선택 형식 사용: {selected_formats}")
+        selected_formats = self.resolve_formats(extracted_data, selected_formats, wordpress_type)
         
         saved_files = {}
         
@@ -953,16 +1105,8 @@ HTML 형식으로 작성해주세요."""
             return {}
         
         # 마크다운 파일 저장 (selected_formats에 포함된 경우에만)
-        # 워드프레스 HTML이 선택된 경우 md 파일 생성하지 않음
-        # 워드프레스가 유일한 형식이고 HTML 타입인 경우에도 md 파일 생성하지 않음
-        should_save_md = 'md' in selected_formats
-        if 'wordpress' in selected_formats and wordpress_type == 'html':
-            # 워드프레스 HTML이 선택된 경우 md 파일 생성하지 않음
-            should_save_md = False
-            # selected_formats에서 'md' 제거
-            selected_formats = [fmt for fmt in selected_formats if fmt != 'md']
-        
-        if should_save_md and 'markdown' in content_data:
+        # 워드프레스 HTML이 선택된 경우 md 파일 생성하지 않음 (resolve_formats 에서 제외)
+        if 'md' in selected_formats and 'markdown' in content_data:
             markdown_file = self.output_dir / f"{filename_prefix}.md"
             with open(markdown_file, 'w', encoding='utf-8') as f:
                 f.write(content_data['markdown'])
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+헤드리스 브라우저 풀 (JS 렌더링이 필요한 출처용)
+
+WebExtractor(use_selenium=True) 가 인스턴스마다 ChromeDriverManager().install() 과
+Chrome 실행을 반복하던 것을, 프로세스당 고정 개수의 장수명 드라이버를 URL 단위로 빌려 쓰는 방식으로 바꾼다.
+- page_load_strategy='eager' + 기사 본문 요소가 나타나면 window.stop() 으로 로딩 중단
+- 이미지/폰트/광고 요청 차단 (Chrome 환경설정 + CDP Network.setBlockedURLs)
+- 대여 전 상태 확인, N 페이지마다 드라이버 재시작 (메모리 누수 방지)
+
+JS 렌더링 여부는 data/sources.json 의 출처별 render_js 플래그로 정한다 (needs_js_rendering).
+selenium / webdriver_manager 는 드라이버를 처음 만들 때 로드한다.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
+from urllib.parse import urljoin, urlparse
+
+logger = logging.getLogger(__name__)
+
+SOURCES_FILE = Path('data/sources.json')
+
+# 렌더링 중 요청하지 않을 리소스 (이미지, 폰트, 광고/추적)
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*doubleclick.net*', '*googlesyndication.com*', '*googletagmanager.com*',
+    '*google-analytics.com*', '*adservice.google.*', '*amazon-adsystem.com*',
+    '*taboola.com*', '*outbrain.com*', '*scorecardresearch.com*'
+]
+
+
+class BrowserPool:
+    """고정 개수의 헤드리스 Chrome 드라이버를 URL 단위로 빌려주는 풀"""
+
+    def __init__(self, size: int = 2, recycle_after: int = 50, page_timeout: float = 20,
+                 checkout_timeout: float = 60, user_agent: Optional[str] = None):
+        """
+        Args:
+            size: 동시에 띄울 최대 브라우저 수
+            recycle_after: 드라이버 하나로 처리할 최대 페이지 수 (초과 시 재시작)
+            page_timeout: 페이지 로딩/본문 대기 제한 시간 (초)
+            checkout_timeout: 빈 드라이버를 기다릴 최대 시간 (초)
+            user_agent: 브라우저 User-Agent (없으면 Chrome 기본값)
+        """
+        self.size = max(1, size)
+        self.recycle_after = max(1, recycle_after)
+        self.page_timeout = page_timeout
+        self.checkout_timeout = checkout_timeout
+        self.user_agent = user_agent
+
+        # 유휴 드라이버 (None 은 아직 만들지 않은 슬롯)
+        self._idle: 'queue.LifoQueue[Optional[Dict[str, Any]]]' = queue.LifoQueue()
+        for _ in range(self.size):
+            self._idle.put(None)
+        self._lock = threading.Lock()
+        self._driver_path: Optional[str] = None
+        self._closed = False
+
+        self.stats: Dict[str, Any] = {
+            'created': 0,
+            'recycled': 0,
+            'unhealthy': 0,
+            'pages': 0,
+            'failures': 0,
+            'wait_seconds': 0.0
+        }
+
+    def _create_driver(self) -> Any:
+        """헤드리스 Chrome 드라이버 생성 (chromedriver 설치는 풀 전체에서 1회)"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
+        with self._lock:
+            if self._driver_path is None:
+                from webdriver_manager.chrome import ChromeDriverManager
+                self._driver_path = ChromeDriverManager().install()
+
+        options = Options()
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        if self.user_agent:
+            options.add_argument(f'user-agent={self.user_agent}')
+        # DOMContentLoaded 에서 get() 반환 (이미지/서브리소스 로딩을 기다리지 않음)
+        options.page_load_strategy = 'eager'
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+
+        driver = webdriver.Chrome(service=Service(self._driver_path), options=options)
+        driver.set_page_load_timeout(self.page_timeout)
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"⚠️ 브라우저 리소스 차단 설정 실패: {e}")
+        return driver
+
+    def _is_healthy(self, driver: Any) -> bool:
+        try:
+            return driver.execute_script('return 1') == 1
+        except Exception:
+            return False
+
+    def _quit(self, driver: Any) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"⚠️ 브라우저 종료 실패: {e}")
+
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """
+        드라이버 대여 (with 블록이 끝나면 반납)
+
+        대여 전 상태를 확인해 응답하지 않는 드라이버는 새로 만들고,
+        recycle_after 페이지를 넘긴 드라이버는 반납 시 종료한다.
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+        start = time.time()
+        try:
+            slot = self._idle.get(timeout=self.checkout_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"브라우저 대기 시간 초과 ({self.checkout_timeout}초)")
+        with self._lock:
+            self.stats['wait_seconds'] += time.time() - start
+
+        try:
+            if slot is not None and not self._is_healthy(slot['driver']):
+                with self._lock:
+                    self.stats['unhealthy'] += 1
+                logger.warning("⚠️ 응답 없는 브라우저 교체")
+                self._quit(slot['driver'])
+                slot = None
+            if slot is None:
+                slot = {'driver': self._create_driver(), 'pages': 0}
+                with self._lock:
+                    self.stats['created'] += 1
+        except Exception:
+            self._idle.put(None)
+            raise
+
+        try:
+            yield slot['driver']
+        except Exception:
+            with self._lock:
+                self.stats['failures'] += 1
+            raise
+        finally:
+            slot['pages'] += 1
+            with self._lock:
+                self.stats['pages'] += 1
+            if slot['pages'] >= self.recycle_after or self._closed:
+                if not self._closed:
+                    with self._lock:
+                        self.stats['recycled'] += 1
+                    logger.info(f"♻️ 브라우저 재시작 ({slot['pages']}페이지 처리)")
+                self._quit(slot['driver'])
+                slot = None
+            self._idle.put(slot)
+
+    def render(self, url: str, wait_selectors: Sequence[str] = ('body',)) -> str:
+        """
+        URL을 렌더링하고 기사 본문 요소가 나타나면 로딩을 멈춘 뒤 HTML 반환
+
+        Args:
+            url: 렌더링할 페이지 URL
+            wait_selectors: 기다릴 본문 CSS 선택자 (하나라도 나타나면 중단)
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        with self.checkout() as driver:
+            try:
+                driver.get(url)
+            except TimeoutException:
+                # 페이지 로딩이 끝나지 않아도 이미 받은 DOM 으로 진행
+                logger.warning(f"⚠️ 페이지 로딩 시간 초과, 현재 DOM 사용: {url}")
+            try:
+                WebDriverWait(driver, self.page_timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ', '.join(wait_selectors)))
+                )
+            except TimeoutException:
+                logger.warning(f"⚠️ 본문 요소 대기 시간 초과: {url}")
+            driver.execute_script('window.stop();')
+            return driver.page_source
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        stats['wait_seconds'] = round(stats['wait_seconds'], 3)
+        stats['size'] = self.size
+        stats['recycle_after'] = self.recycle_after
+        stats['idle'] = self._idle.qsize()
+        return stats
+
+    def close(self) -> None:
+        """유휴 드라이버 종료 (대여 중인 드라이버는 반납 시 종료)"""
+        self._closed = True
+        while True:
+            try:
+                slot = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if slot is not None:
+                self._quit(slot['driver'])
+
+
+def _source_hosts(sources: List[Dict[str, Any]]) -> Set[str]:
+    """render_js 가 켜진 출처(또는 서브 카테고리)의 호스트 목록"""
+    hosts = set()
+    for source in sources:
+        base_url = source.get('url', '')
+        if source.get('render_js'):
+            hosts.add(urlparse(base_url).netloc.lower())
+        for subcategory in source.get('subcategories', []):
+            if subcategory.get('render_js'):
+                hosts.add(urlparse(urljoin(base_url, subcategory.get('url', ''))).netloc.lower())
+    hosts.discard('')
+    return {host[4:] if host.startswith('www.') else host for host in hosts}
+
+
+# 출처 파일 수정 시각 기준으로 캐시
+_render_hosts_cache: Dict[str, Any] = {'mtime': None, 'hosts': set()}
+_render_hosts_lock = threading.Lock()
+
+
+def needs_js_rendering(url: str, sources_file: Path = SOURCES_FILE) -> bool:
+    """URL의 호스트가 render_js 출처에 속하는지 확인"""
+    try:
+        mtime = sources_file.stat().st_mtime
+    except OSError:
+        return False
+    with _render_hosts_lock:
+        if _render_hosts_cache['mtime'] != mtime:
+            try:
+                with open(sources_file, 'r', encoding='utf-8') as f:
+                    sources = json.load(f).get('sources', [])
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ 출처 파일 로드 실패: {e}")
+                sources = []
+            _render_hosts_cache['hosts'] = _source_hosts(sources)
+            _render_hosts_cache['mtime'] = mtime
+        hosts = _render_hosts_cache['hosts']
+
+    host = urlparse(url).netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return any(host == rendered or host.endswith('.' + rendered) for rendered in hosts)
+
+
+# 싱글톤 인스턴스
+browser_pool_instance = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool(user_agent: Optional[str] = None) -> BrowserPool:
+    """공유 브라우저 풀 인스턴스 가져오기 (user_agent 는 처음 생성할 때만 사용, 프로세스 종료 시 브라우저 정리)"""
+    global browser_pool_instance
+    if browser_pool_instance is None:
+        with _browser_pool_lock:
+            if browser_pool_instance is None:
+                browser_pool_instance = BrowserPool(
+                    size=int(os.getenv('BROWSER_POOL_SIZE', 2)),
+                    recycle_after=int(os.getenv('BROWSER_RECYCLE_PAGES', 50)),
+                    page_timeout=float(os.getenv('BROWSER_PAGE_TIMEOUT', 20)),
+                    checkout_timeout=float(os.getenv('BROWSER_CHECKOUT_TIMEOUT', 60)),
+                    user_agent=user_agent
+                )
+                atexit.register(browser_pool_instance.close)
+    return browser_pool_instance
+
+
+def get_browser_pool_stats() -> Optional[Dict[str, Any]]:
+    """브라우저 풀 통계 (JS 렌더링 출처를 아직 처리하지 않아 풀이 없으면 None)"""
+    if browser_pool_instance is None:
+        return None
+    return browser_pool_instance.get_stats()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+LLM 응답 캐시 (프롬프트 → 응답)
+
+NewsConverter.call_api 는 temperature=0 으로 호출되므로 같은 기사 본문 + 같은 프롬프트 템플릿이면
+같은 응답을 재사용할 수 있다. (제공자, 모델, max_tokens, 프롬프트 해시) 를 키로 응답을 저장하고,
+적중하면 제공자 호출(게이트웨이 대기 포함)을 생략한다.
+
+저장소는 프로세스 내 LRU + 워커 공유 SQLite (용량 초과 시 오래된 항목부터 삭제, 재시작 후에도 유지).
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from content_cache import LRUCache, SQLiteCache, TieredCache
+from llm_gateway import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class CompletionCache:
+    """temperature=0 LLM 응답 캐시"""
+
+    def __init__(self, store: Any, ttl: float = 7 * 24 * 3600):
+        """
+        Args:
+            store: 저장소 (LRUCache / TieredCache)
+            ttl: 응답 보관 시간 (초)
+        """
+        self.store = store
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            'hits': 0,
+            'misses': 0,
+            'stored': 0,
+            'skipped': 0,
+            'tokens_saved': 0
+        }
+
+    @staticmethod
+    def key(provider: str, model: str, max_tokens: int, prompt: str) -> str:
+        digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        return f"llm:{provider}:{model}:{max_tokens}:{digest}"
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+
+    def lookup(self, provider: str, model: str, max_tokens: int, prompt: str,
+               temperature: float = 0) -> Optional[str]:
+        """저장된 응답 텍스트 (temperature 가 0이 아니거나 없으면 None)"""
+        if temperature != 0:
+            self._count('skipped')
+            return None
+        entry = self.store.get(self.key(provider, model, max_tokens, prompt))
+        if entry is None:
+            self._count('misses')
+            return None
+        self._count('hits')
+        self._count('tokens_saved', entry.get('tokens') or 0)
+        logger.info(f"💾 LLM 응답 캐시 적중: {provider}/{model} ({entry.get('tokens') or 0} 토큰 절약)")
+        return entry['text']
+
+    def store_completion(self, provider: str, model: str, max_tokens: int, prompt: str, text: str,
+                         usage: Optional[int] = None, temperature: float = 0) -> None:
+        """
+        응답 저장 (temperature=0 이고 비어 있지 않은 응답만)
+
+        usage 는 제공자가 보고한 실제 사용 토큰 (없으면 프롬프트/응답 길이로 추정)
+        """
+        if temperature != 0 or not text:
+            return
+        tokens = usage or estimate_tokens(prompt) + estimate_tokens(text)
+        self.store.set(self.key(provider, model, max_tokens, prompt), {
+            'text': text,
+            'tokens': tokens,
+            'stored_at': time.time()
+        }, ttl=self.ttl)
+        self._count('stored')
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses']
+        return {
+            **stats,
+            'ttl': self.ttl,
+            'hit_rate': round(stats['hits'] / lookups, 4) if lookups else 0.0,
+            'store': self.store.get_stats()
+        }
+
+
+# 싱글톤 인스턴스
+completion_cache_instance = None
+_completion_cache_lock = threading.Lock()
+
+
+def get_completion_cache() -> Optional[CompletionCache]:
+    """LLM 응답 캐시 인스턴스 가져오기 (COMPLETION_CACHE=false 이면 None)"""
+    global completion_cache_instance
+    if os.getenv('COMPLETION_CACHE', 'true').lower() != 'true':
+        return None
+    if completion_cache_instance is None:
+        with _completion_cache_lock:
+            if completion_cache_instance is None:
+                ttl = float(os.getenv('COMPLETION_CACHE_TTL_SECONDS', 7 * 24 * 3600))
+                l1 = LRUCache(
+                    max_entries=int(os.getenv('COMPLETION_CACHE_MAX_ENTRIES', 500)),
+                    max_bytes=int(os.getenv('COMPLETION_CACHE_MAX_BYTES', 16 * 1024 * 1024)),
+                    default_ttl=ttl
+                )
+                store = l1
+                if os.getenv('CACHE_BACKEND', 'sqlite').lower() == 'sqlite':
+                    try:
+                        l2 = SQLiteCache(
+                            db_path=os.getenv('COMPLETION_CACHE_DB_PATH', 'cache/completion_cache.db'),
+                            max_bytes=int(os.getenv('COMPLETION_CACHE_DB_MAX_BYTES', 256 * 1024 * 1024)),
+                            default_ttl=ttl
+                        )
+                        store = TieredCache(l1, l2)
+                    except sqlite3.Error as e:
+                        logger.warning(f"⚠️ LLM 응답 캐시 공유 저장소 초기화 실패, 메모리 캐시만 사용: {e}")
+                completion_cache_instance = CompletionCache(store, ttl=ttl)
+    return completion_cache_instance
+
+
+def get_completion_cache_stats() -> Optional[Dict[str, Any]]:
+    """LLM 응답 캐시 통계 (COMPLETION_CACHE=false 이면 None)"""
+    cache = get_completion_cache()
+    return cache.get_stats() if cache else None
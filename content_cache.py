@@ -0,0 +1,714 @@
+#!/usr/bin/env python3
+"""
+생성 콘텐츠 캐시
+- LRUCache: 항목 수/바이트 예산이 제한된 프로세스 내 캐시 (항목별 TTL은 조회 시점에 확인)
+- SQLiteCache: 같은 호스트의 모든 gunicorn 워커가 공유하는 디스크 캐시 (재시작 후에도 유지)
+- TieredCache: L1(프로세스 내) + L2(공유 저장소) 2단계 캐시
+- ExtractionCache: 콘텐츠 타입과 무관한 기사 추출 결과 캐시 (ETag/Last-Modified 재검증)
+- GenerationDedupIndex: 기사 본문 지문 기반 생성 결과 재사용 (AMP/모바일/신디케이션 URL 중복 제거)
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_url(url: str) -> str:
+    """URL 정규화 (캐싱 키 생성용)"""
+    # 쿼리 파라미터 제거, 슬래시 정규화
+    url = re.sub(r'\?.*$', '', url)
+    url = url.rstrip('/')
+    return url.lower()
+
+
+def content_fingerprint(extracted: Dict[str, Any], min_chars: int = 200) -> Optional[str]:
+    """
+    추출된 기사 본문 지문 (정규화 텍스트의 SHA-256)
+
+    대소문자, 공백, 구두점, 유니코드 표기 차이를 제거한 본문으로 계산하므로
+    같은 기사를 AMP/모바일/신디케이션 URL로 가져와도 같은 값이 나온다.
+    본문이 min_chars 보다 짧으면 (잘못 묶일 위험) None 반환.
+    """
+    content = extracted.get('content')
+    text = content.get('text', '') if isinstance(content, dict) else (content or '')
+    if not isinstance(text, str):
+        return None
+    normalized = unicodedata.normalize('NFKC', text).lower()
+    normalized = re.sub(r'[\W_]+', ' ', normalized).strip()
+    if len(normalized) < min_chars:
+        return None
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def estimate_size(value: Any) -> int:
+    """캐시 값의 대략적인 메모리 크기 (UTF-8 JSON 직렬화 기준 바이트 수)"""
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode('utf-8'))
+    except (TypeError, ValueError):
+        return len(str(value).encode('utf-8'))
+
+
+class LRUCache:
+    """크기 제한 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int = 500, max_bytes: int = 64 * 1024 * 1024, default_ttl: float = 1800):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 전체 값 크기 예산 (바이트)
+            default_ttl: 기본 만료 시간 (초)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        # key -> (value, expires_at, size)
+        self._data: 'OrderedDict[str, Tuple[Any, float, int]]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+        self.stats: Dict[str, int] = {
+            'hits': 0,
+            'misses': 0,
+            'sets': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'rejected': 0
+        }
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료된 항목은 조회 시점에 제거)"""
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """캐시 조회 - (값, 만료 시각) 반환"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+
+            value, expires_at, _ = entry
+            if time.time() >= expires_at:
+                self._remove(key)
+                self.stats['expirations'] += 1
+                self.stats['misses'] += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.stats['hits'] += 1
+            return value, expires_at
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """캐시 저장 (예산 초과 시 가장 오래 사용되지 않은 항목부터 제거)"""
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            self.stats['rejected'] += 1
+            logger.warning(f"⚠️ 캐시 저장 생략: 항목 크기 {size}B가 예산 {self.max_bytes}B 초과")
+            return False
+
+        expires_at = time.time() + (ttl if ttl is not None else self.default_ttl)
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+            self._data[key] = (value, expires_at, size)
+            self._total_bytes += size
+            self.stats['sets'] += 1
+
+            while len(self._data) > self.max_entries or self._total_bytes > self.max_bytes:
+                oldest_key = next(iter(self._data))
+                self._remove(oldest_key)
+                self.stats['evictions'] += 1
+        return True
+
+    def delete(self, key: str) -> None:
+        """캐시 항목 삭제"""
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def purge_expired(self) -> int:
+        """만료된 항목 일괄 정리 (정리된 개수 반환)"""
+        now = time.time()
+        with self._lock:
+            expired_keys = [k for k, (_, expires_at, _) in self._data.items() if now >= expires_at]
+            for key in expired_keys:
+                self._remove(key)
+            self.stats['expirations'] += len(expired_keys)
+        return len(expired_keys)
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._data.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 사용 통계"""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                **self.stats,
+                'entries': len(self._data),
+                'bytes': self._total_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'default_ttl': self.default_ttl,
+                'hit_rate': round(self.stats['hits'] / lookups, 4) if lookups else 0.0
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._data.pop(key)
+        self._total_bytes -= size
+
+
+class SQLiteCache:
+    """SQLite 기반 공유 디스크 캐시 (워커 간 공유, 재시작 후에도 유지)"""
+
+    def __init__(self, db_path: str, max_bytes: int = 512 * 1024 * 1024, default_ttl: float = 1800):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            max_bytes: 전체 값 크기 예산 (바이트, 초과 시 오래 사용되지 않은 항목부터 제거)
+            default_ttl: 기본 만료 시간 (초)
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._local = threading.local()
+
+        self.stats: Dict[str, int] = {
+            'hits': 0,
+            'misses': 0,
+            'sets': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'rejected': 0,
+            'errors': 0
+        }
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache_entries(accessed_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드/프로세스별 연결 (fork 이후 연결 재사용 방지)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회"""
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """캐시 조회 - (값, 만료 시각) 반환"""
+        now = time.time()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+
+            value, expires_at = row
+            if now >= expires_at:
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                self.stats['expirations'] += 1
+                self.stats['misses'] += 1
+                return None
+
+            conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self.stats['hits'] += 1
+            return json.loads(value), expires_at
+        except (sqlite3.Error, ValueError) as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 공유 캐시 조회 실패: {e}")
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """캐시 저장 (예산 초과 시 오래 사용되지 않은 항목부터 제거)"""
+        try:
+            serialized = json.dumps(value, ensure_ascii=False, default=str)
+        except (TypeError, ValueError) as e:
+            self.stats['rejected'] += 1
+            logger.warning(f"⚠️ 공유 캐시 저장 생략 (직렬화 불가): {e}")
+            return False
+
+        size = len(serialized.encode('utf-8'))
+        if size > self.max_bytes:
+            self.stats['rejected'] += 1
+            return False
+
+        now = time.time()
+        expires_at = now + (ttl if ttl is not None else self.default_ttl)
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, size, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, serialized, expires_at, size, now)
+            )
+            self.stats['sets'] += 1
+            self._enforce_budget(conn)
+            return True
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 공유 캐시 저장 실패: {e}")
+            return False
+
+    def _enforce_budget(self, conn: sqlite3.Connection) -> None:
+        """바이트 예산 초과분을 오래 사용되지 않은 항목부터 제거"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        freed = 0
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM cache_entries ORDER BY accessed_at ASC"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM cache_entries WHERE key = ?", victims)
+        self.stats['evictions'] += len(victims)
+
+    def delete(self, key: str) -> None:
+        """캐시 항목 삭제"""
+        try:
+            self._connect().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 공유 캐시 삭제 실패: {e}")
+
+    def purge_expired(self) -> int:
+        """만료된 항목 일괄 정리 (정리된 개수 반환)"""
+        try:
+            cursor = self._connect().execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+            self.stats['expirations'] += cursor.rowcount
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 공유 캐시 정리 실패: {e}")
+            return 0
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        self._connect().execute("DELETE FROM cache_entries")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 사용 통계 (hits/misses는 현재 프로세스 기준)"""
+        try:
+            entries, total_bytes = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()
+        except sqlite3.Error:
+            entries, total_bytes = None, None
+
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'entries': entries,
+            'bytes': total_bytes,
+            'max_bytes': self.max_bytes,
+            'default_ttl': self.default_ttl,
+            'db_path': self.db_path,
+            'hit_rate': round(self.stats['hits'] / lookups, 4) if lookups else 0.0
+        }
+
+
+class TieredCache:
+    """L1(프로세스 내 LRU) + L2(공유 저장소) 2단계 캐시"""
+
+    def __init__(self, l1: LRUCache, l2: Any):
+        self.l1 = l1
+        self.l2 = l2
+        self.default_ttl = l2.default_ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """L1 → L2 순서로 조회 (L2 히트 시 남은 TTL로 L1 채움)"""
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """캐시 조회 - (값, 만료 시각) 반환"""
+        entry = self.l1.get_entry(key)
+        if entry is not None:
+            return entry
+
+        entry = self.l2.get_entry(key)
+        if entry is not None:
+            value, expires_at = entry
+            self.l1.set(key, value, ttl=max(expires_at - time.time(), 0))
+        return entry
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """양쪽 계층에 저장"""
+        stored = self.l2.set(key, value, ttl)
+        return self.l1.set(key, value, ttl) or stored
+
+    def delete(self, key: str) -> None:
+        self.l1.delete(key)
+        self.l2.delete(key)
+
+    def purge_expired(self) -> int:
+        return self.l1.purge_expired() + self.l2.purge_expired()
+
+    def clear(self) -> None:
+        self.l1.clear()
+        self.l2.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """전체 통계 (L1 히트 + L2 히트 / L2 미스) 및 계층별 통계"""
+        l1_stats = self.l1.get_stats()
+        l2_stats = self.l2.get_stats()
+        hits = l1_stats['hits'] + l2_stats['hits']
+        misses = l2_stats['misses']
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+            'default_ttl': self.default_ttl,
+            'tiers': {
+                'l1': l1_stats,
+                'l2': l2_stats
+            }
+        }
+
+
+class ExtractionCache:
+    """
+    기사 추출 결과 캐시 (정규화 URL 키)
+
+    같은 기사를 standard → blog → x 순서로 요청해도 다운로드/파싱은 한 번만 수행.
+    fresh_ttl 이내에는 그대로 재사용하고, 그 이후에는 ETag/Last-Modified로
+    조건부 요청을 보내 304 응답이면 재사용, 아니면 새로 추출한다.
+    archive(ArticleArchive)를 주면 프로세스 내 캐시에 없을 때 기사 아카이브에서 불러온다
+    (다른 워커가 추출했거나 재시작 전에 추출한 기사). 아카이브 기록은 WebExtractor(save_to_file) 가 담당한다.
+    """
+
+    def __init__(self, fresh_ttl: float = 600, max_stale: float = 6 * 3600,
+                 max_entries: int = 300, max_bytes: int = 32 * 1024 * 1024, archive: Any = None):
+        """
+        Args:
+            fresh_ttl: 재검증 없이 재사용하는 시간 (초)
+            max_stale: 재검증 후 재사용 가능한 최대 보관 시간 (초)
+            max_entries: 최대 항목 수
+            max_bytes: 전체 값 크기 예산 (바이트)
+            archive: 2차 저장소 (ArticleArchive, 읽기 전용, 없으면 프로세스 내 캐시만 사용)
+        """
+        self.fresh_ttl = fresh_ttl
+        self.max_stale = max_stale
+        self.archive = archive
+        self._cache = LRUCache(max_entries=max_entries, max_bytes=max_bytes, default_ttl=max_stale)
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            'hits': 0,
+            'revalidated_hits': 0,
+            'misses': 0,
+            'stale_refetches': 0,
+            'archive_loads': 0
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def lookup(self, url: str, revalidate: Optional[Callable[[str, Dict[str, str]], bool]] = None) -> Optional[Dict[str, Any]]:
+        """
+        추출 결과 조회
+
+        Args:
+            url: 기사 URL
+            revalidate: (url, validators) → 변경 없음(304) 여부를 반환하는 함수
+
+        Returns:
+            추출 결과 사본 또는 None
+        """
+        key = normalize_url(url)
+        entry = self._cache.get(key)
+        if entry is None:
+            entry = self._load_archived(url, key)
+        if entry is None:
+            self._count('misses')
+            return None
+
+        if time.time() - entry['stored_at'] < self.fresh_ttl:
+            self._count('hits')
+            return copy.deepcopy(entry['data'])
+
+        validators = entry.get('validators') or {}
+        if validators and revalidate is not None:
+            try:
+                not_modified = revalidate(url, validators)
+            except Exception as e:
+                logger.warning(f"⚠️ 추출 캐시 재검증 실패: {e}")
+                not_modified = False
+
+            if not_modified:
+                entry['stored_at'] = time.time()
+                self._cache.set(key, entry)
+                self._count('revalidated_hits')
+                return copy.deepcopy(entry['data'])
+
+        self._cache.delete(key)
+        self._count('stale_refetches')
+        return None
+
+    def _load_archived(self, url: str, key: str) -> Optional[Dict[str, Any]]:
+        """아카이브에서 max_stale 이내 항목을 불러와 프로세스 내 캐시에 채움"""
+        if self.archive is None:
+            return None
+        archived = self.archive.get_by_url(url)
+        if archived is None:
+            return None
+        age = time.time() - archived['fetched_at']
+        if age >= self.max_stale:
+            return None
+
+        entry = {
+            'data': archived['data'],
+            'validators': archived['data'].get('http_validators') or {},
+            'stored_at': archived['fetched_at']
+        }
+        self._cache.set(key, entry, ttl=self.max_stale - age)
+        self._count('archive_loads')
+        return entry
+
+    def store(self, url: str, data: Dict[str, Any]) -> None:
+        """성공한 추출 결과 저장 (프로세스 내 캐시만, 아카이브 기록은 추출기에서 save_intermediate 설정에 따라 수행)"""
+        if not data.get('success'):
+            return
+        self._cache.set(normalize_url(url), {
+            'data': copy.deepcopy(data),
+            'validators': data.get('http_validators') or {},
+            'stored_at': time.time()
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """추출 캐시 통계 (재검증 히트 포함 적중률)"""
+        with self._lock:
+            stats = dict(self.stats)
+        hits = stats['hits'] + stats['revalidated_hits']
+        lookups = hits + stats['misses'] + stats['stale_refetches']
+        cache_stats = self._cache.get_stats()
+        return {
+            **stats,
+            'entries': cache_stats['entries'],
+            'bytes': cache_stats['bytes'],
+            'evictions': cache_stats['evictions'],
+            'fresh_ttl': self.fresh_ttl,
+            'archive': self.archive.get_stats() if self.archive is not None else None,
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class GenerationDedupIndex:
+    """
+    본문 지문 → 생성 결과 색인
+
+    URL이 달라도 추출된 본문이 같으면 이미 생성된 파일을 재사용하여
+    AI 변환 호출을 생략한다. 생성 콘텐츠 캐시(워커 공유 저장소)에
+    'fp:' 접두사 키로 저장하므로 워커 간에도 공유된다.
+    """
+
+    def __init__(self, cache: Any, ttl: Optional[float] = None, min_chars: int = 200):
+        """
+        Args:
+            cache: 저장소 (LRUCache / TieredCache)
+            ttl: 색인 항목 보관 시간 (초, None이면 저장소 기본값)
+            min_chars: 지문을 계산할 최소 정규화 본문 길이
+        """
+        self.cache = cache
+        self.ttl = ttl
+        self.min_chars = min_chars
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            'hits': 0,
+            'misses': 0,
+            'stale': 0,
+            'stored': 0,
+            'skipped': 0
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def fingerprint(self, extracted: Dict[str, Any]) -> Optional[str]:
+        fingerprint = content_fingerprint(extracted, self.min_chars)
+        if fingerprint is None:
+            self._count('skipped')
+        return fingerprint
+
+    @staticmethod
+    def _key(fingerprint: str, variant: str) -> str:
+        return f"fp:{fingerprint}:{variant}"
+
+    def lookup(self, fingerprint: Optional[str], variant: str) -> Optional[Dict[str, Any]]:
+        """
+        같은 본문·같은 생성 옵션의 이전 결과 조회
+
+        Returns:
+            저장된 결과 (output_file 등 경로는 문자열) 또는 None
+            생성 파일이 삭제된 경우에도 None
+        """
+        if not fingerprint:
+            return None
+        key = self._key(fingerprint, variant)
+        entry = self.cache.get(key)
+        if entry is None:
+            self._count('misses')
+            return None
+
+        paths = [entry.get('output_file')] + list((entry.get('saved_files') or {}).values())
+        if not all(path and Path(path).exists() for path in paths):
+            self.cache.delete(key)
+            self._count('stale')
+            return None
+
+        self._count('hits')
+        return entry
+
+    def store(self, fingerprint: Optional[str], variant: str, result: Dict[str, Any]) -> None:
+        """성공한 생성 결과의 파일 위치 저장"""
+        if not fingerprint or not result.get('success') or not result.get('output_file'):
+            return
+        entry = {
+            'url': result.get('url'),
+            'title': result.get('title'),
+            'output_file': str(result['output_file']),
+            'saved_files': {fmt: str(path) for fmt, path in (result.get('saved_files') or {}).items()},
+            'timestamp': result.get('timestamp')
+        }
+        if self.cache.set(self._key(fingerprint, variant), entry, ttl=self.ttl):
+            self._count('stored')
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses'] + stats['stale']
+        return {
+            **stats,
+            'min_chars': self.min_chars,
+            'hit_rate': round(stats['hits'] / lookups, 4) if lookups else 0.0
+        }
+
+
+# 싱글톤 인스턴스
+content_cache_instance = None
+extraction_cache_instance = None
+generation_dedup_instance = None
+_singleton_lock = threading.Lock()
+
+def get_content_cache():
+    """
+    생성 콘텐츠 캐시 인스턴스 가져오기
+
+    CACHE_BACKEND 환경변수로 백엔드 선택:
+    - sqlite (기본값): 프로세스 내 LRU(L1) + 워커 공유 SQLite(L2)
+    - memory: 프로세스 내 LRU만 사용
+    """
+    global content_cache_instance
+    if content_cache_instance is None:
+        with _singleton_lock:
+            if content_cache_instance is None:
+                ttl = float(os.getenv('CACHE_TTL_SECONDS', 1800))  # 30분
+                l1 = LRUCache(
+                    max_entries=int(os.getenv('CACHE_MAX_ENTRIES', 500)),
+                    max_bytes=int(os.getenv('CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+                    default_ttl=ttl
+                )
+
+                backend = os.getenv('CACHE_BACKEND', 'sqlite').lower()
+                if backend == 'sqlite':
+                    try:
+                        l2 = SQLiteCache(
+                            db_path=os.getenv('CACHE_DB_PATH', 'cache/content_cache.db'),
+                            max_bytes=int(os.getenv('CACHE_DB_MAX_BYTES', 512 * 1024 * 1024)),
+                            default_ttl=ttl
+                        )
+                        content_cache_instance = TieredCache(l1, l2)
+                        logger.info(f"💾 공유 캐시 사용: {l2.db_path}")
+                    except sqlite3.Error as e:
+                        logger.warning(f"⚠️ 공유 캐시 초기화 실패, 메모리 캐시만 사용: {e}")
+                        content_cache_instance = l1
+                else:
+                    content_cache_instance = l1
+    return content_cache_instance
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """기사 추출 캐시 인스턴스 가져오기 (ARTICLE_ARCHIVE=true 이면 기사 아카이브를 2차 저장소로 사용)"""
+    global extraction_cache_instance
+    if extraction_cache_instance is None:
+        archive = None
+        if os.getenv('ARTICLE_ARCHIVE', 'true').lower() == 'true':
+            # article_archive 가 이 모듈을 import 하므로 여기서 지연 import
+            from article_archive import get_article_archive
+            try:
+                archive = get_article_archive()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ 기사 아카이브 초기화 실패, 프로세스 내 추출 캐시만 사용: {e}")
+        with _singleton_lock:
+            if extraction_cache_instance is None:
+                extraction_cache_instance = ExtractionCache(
+                    fresh_ttl=float(os.getenv('EXTRACTION_CACHE_FRESH_SECONDS', 600)),
+                    max_stale=float(os.getenv('EXTRACTION_CACHE_MAX_STALE_SECONDS', 6 * 3600)),
+                    max_entries=int(os.getenv('EXTRACTION_CACHE_MAX_ENTRIES', 300)),
+                    max_bytes=int(os.getenv('EXTRACTION_CACHE_MAX_BYTES', 32 * 1024 * 1024)),
+                    archive=archive
+                )
+    return extraction_cache_instance
+
+
+def get_generation_dedup_index() -> GenerationDedupIndex:
+    """본문 지문 기반 생성 결과 색인 인스턴스 가져오기 (생성 콘텐츠 캐시 공유)"""
+    global generation_dedup_instance
+    if generation_dedup_instance is None:
+        cache = get_content_cache()
+        with _singleton_lock:
+            if generation_dedup_instance is None:
+                ttl = os.getenv('GENERATION_DEDUP_TTL_SECONDS')
+                generation_dedup_instance = GenerationDedupIndex(
+                    cache,
+                    ttl=float(ttl) if ttl else None,
+                    min_chars=int(os.getenv('GENERATION_DEDUP_MIN_CHARS', 200))
+                )
+    return generation_dedup_instance
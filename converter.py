@@ -1,10 +1,93 @@
 import os
 from datetime import datetime
 from pathlib import Path
-import anthropic
-from openai import OpenAI
 from dotenv import load_dotenv
 import re
+import threading
+from contextlib import contextmanager
+
+from completion_cache import get_completion_cache
+from llm_gateway import estimate_tokens, get_llm_gateway, response_usage
+
+# 제공자별 사용 모델 (LLM 응답 캐시 키에도 사용)
+PROVIDER_MODELS = {
+    'anthropic': 'claude-3-opus-20240229',
+    'openai': 'gpt-4o',
+    'perplexity': 'llama-3.1-sonar-large-128k-chat'
+}
+
+# 응답 정리 규칙 중 한 줄 안에서 끝나는 규칙 (clean_response 와 스트리밍 정리에서 공유)
+SECTION_RULES = [
+    (re.compile(r'([^(\n]+)\s*(\(출처:[^)]+\))'), r'\1\n\2'),  # 제목과 출처 분리
+    (re.compile(r'([^\n])\s*(▶)'), r'\1\n\n\2'),  # ▶ 앞에 2줄 줄바꿈 (섹션 간 구분)
+    (re.compile(r'(▶[^\n:]+:?)\s*\n*'), r'\1\n'),  # ▶ 제목 뒤에 정확히 1줄만
+    (re.compile(r'(•)([^•\n]+)(•)'), r'\1\2\n\3'),  # 불렛 사이 줄바꿈
+    (re.compile(r'(•[^•\n]+)(•)'), r'\1\n\2'),  # 추가 처리
+    (re.compile(r'([:\n])\s*(•)'), r'\1\n\2'),  # 콜론이나 줄바꿈 뒤 불렛포인트
+    (re.compile(r'(•[^•\n]+)(?=•)'), r'\1\n'),  # 불렛포인트 간 줄바꿈
+]
+# 이모지가 있는 제목 뒤 줄바꿈 추가
+EMOJI_TITLE_RULE = (re.compile(r'(^[^\n]*[📈📊🎯💡🚀🔍📌⚡️🌟💰📱🏆🎮🌍🛡️][^\n]*)', re.MULTILINE), r'\1\n')
+
+
+class StreamingCleaner:
+    """
+    스트리밍 응답 조각 정리
+
+    완성된 줄마다 한 줄 안에서 끝나는 정리 규칙(대괄호 제거, 출처/▶/불렛 줄바꿈, 이모지 제목)만 적용하고,
+    응답 앞의 따옴표/코드 펜스/'markdown'·'html' 표기를 제거한다.
+    전체 텍스트가 필요한 규칙(마지막 해시태그 섹션 등)은 적용하지 않으므로
+    최종 결과는 완성된 응답에 clean_response 를 적용한 값을 사용한다.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self._pending = ''
+        self._started = False
+
+    def feed(self, chunk):
+        """응답 조각 추가 → 새로 완성된 줄의 정리된 텍스트 (없으면 빈 문자열)"""
+        self.chunks.append(chunk)
+        text = self._pending + chunk
+        # 조각 경계에서 잘린 '\\n' 표기는 다음 조각과 합쳐서 변환
+        hold = ''
+        if text.endswith('\\'):
+            text, hold = text[:-1], '\\'
+        text = text.replace('\\n', '\n')
+        if '\n' not in text:
+            self._pending = text + hold
+            return ''
+        complete, rest = text.rsplit('\n', 1)
+        self._pending = rest + hold
+        return self._clean(complete + '\n')
+
+    def finish(self):
+        """남은 마지막 줄 정리"""
+        text, self._pending = self._pending.replace('\\n', '\n'), ''
+        return self._clean(text).rstrip('"\'`')
+
+    @property
+    def text(self):
+        """지금까지 받은 원본 응답 전체"""
+        return ''.join(self.chunks)
+
+    def _clean(self, block):
+        block = re.sub(r'\[.*?\]', '', block)
+        if not self._started:
+            block = block.lstrip('"\'\n')
+            if not block:
+                return ''
+            first, _, rest = block.partition('\n')
+            if first.strip().strip('`').strip().lower() in ('', 'markdown', 'html'):
+                block = rest
+            self._started = True
+        # 닫는 코드 펜스 줄 제거
+        block = re.sub(r'^```\s*$\n?', '', block, flags=re.MULTILINE)
+        for pattern, repl in SECTION_RULES:
+            block = pattern.sub(repl, block)
+        pattern, repl = EMOJI_TITLE_RULE
+        return pattern.sub(repl, block)
+
 
 class NewsConverter:
     def __init__(self, api_provider='anthropic', api_key=None):
@@ -13,24 +96,31 @@ class NewsConverter:
         self.anthropic_client = None
         self.openai_client = None
         self.perplexity_client = None
+        # 제공자별 사용 중인 API 키 (LLM 게이트웨이 레인 구분용)
+        self._api_keys = {}
         
         # 사용자 제공 API 키를 우선 사용, 없으면 환경변수에서 가져오기
         # 주 API 클라이언트 초기화
         if self.api_provider == 'anthropic':
             key = api_key if api_key else os.getenv('ANTHROPIC_API_KEY')
             if key:
+                import anthropic  # SDK는 사용하는 제공자만 로드
                 self.anthropic_client = anthropic.Anthropic(api_key=key)
+                self._api_keys['anthropic'] = key
                 
         elif self.api_provider == 'openai':
             key = api_key if api_key else os.getenv('OPENAI_API_KEY')
             if key:
+                from openai import OpenAI  # SDK는 사용하는 제공자만 로드
                 self.openai_client = OpenAI(api_key=key)
+                self._api_keys['openai'] = key
                 
         elif self.api_provider == 'perplexity':
             key = api_key if api_key else os.getenv('PERPLEXITY_API_KEY')
             if key:
                 # Perplexity API는 requests로 직접 호출
                 self.perplexity_api_key = key
+                self._api_keys['perplexity'] = key
         
         # 폴백을 위한 보조 API 클라이언트 초기화 (환경변수에서만)
         if self.api_provider == 'anthropic':
@@ -38,7 +128,9 @@ class NewsConverter:
             openai_fallback_key = os.getenv('OPENAI_API_KEY')
             if openai_fallback_key:
                 try:
+                    from openai import OpenAI
                     self.openai_client = OpenAI(api_key=openai_fallback_key)
+                    self._api_keys['openai'] = openai_fallback_key
                 except Exception as e:
                     print(f"[WARN] Failed to initialize OpenAI fallback client: {e}")
         elif self.api_provider == 'openai':
@@ -46,9 +138,18 @@ class NewsConverter:
             anthropic_fallback_key = os.getenv('ANTHROPIC_API_KEY')
             if anthropic_fallback_key:
                 try:
+                    import anthropic
                     self.anthropic_client = anthropic.Anthropic(api_key=anthropic_fallback_key)
+                    self._api_keys['anthropic'] = anthropic_fallback_key
                 except Exception as e:
                     print(f"[WARN] Failed to initialize Anthropic fallback client: {e}")
+        
+        # 모든 제공자 호출은 공유 게이트웨이를 거침 (제공자/API 키별 동시 실행 수, 분당 토큰 제한)
+        self.gateway = get_llm_gateway()
+        # temperature=0 응답 재사용 (COMPLETION_CACHE=false 이면 None)
+        self.completion_cache = get_completion_cache()
+        # streaming() 블록 안에서 호출한 스레드의 응답 조각 전달 함수
+        self._stream_local = threading.local()
                     
         self.output_dir = Path('converted_articles')
         self.output_dir.mkdir(exist_ok=True)
@@ -72,6 +173,21 @@ class NewsConverter:
             'content': main_content
         }
 
+    def read_archived_article(self, url):
+        """기사 아카이브에서 추출 결과 읽기 (TXT 파일 정규식 파싱 없이 구조화된 데이터 사용)"""
+        from article_archive import get_article_archive
+
+        entry = get_article_archive().get_by_url(url)
+        if entry is None:
+            return None
+        extracted_data = entry['data']
+        content = extracted_data.get('content', '')
+        return {
+            'title': extracted_data.get('title', ''),
+            'description': extracted_data.get('description', ''),
+            'content': content.get('text', '') if isinstance(content, dict) else content
+        }
+
     def clean_response(self, response):
         """Clean the API response text"""
         # Handle different API response formats
@@ -85,19 +201,9 @@ class NewsConverter:
         # 줄바꿈 처리 개선 - 모든 포맷팅 요소에 적절한 줄바꿈 추가
         text = text.replace('\\n', '\n')
         
-        # (출처: ...) 패턴을 찾아서 독립 라인으로 만들기
-        text = re.sub(r'([^(\n]+)\s*(\(출처:[^)]+\))', r'\1\n\2', text)  # 제목과 출처 분리
-        
-        # ▶ 섹션 구분자 앞뒤로 줄바꿈
-        text = re.sub(r'([^\n])\s*(▶)', r'\1\n\n\2', text)  # ▶ 앞에 2줄 줄바꿈 (섹션 간 구분)
-        text = re.sub(r'(▶[^\n:]+:?)\s*\n*', r'\1\n', text)  # ▶ 제목 뒤에 정확히 1줄만
-        
-        # 불렛 포인트 처리 - 더 강력하게
-        # 연속된 불렛포인트를 확실히 분리
-        text = re.sub(r'(•)([^•\n]+)(•)', r'\1\2\n\3', text)  # 불렛 사이 줄바꿈
-        text = re.sub(r'(•[^•\n]+)(•)', r'\1\n\2', text)  # 추가 처리
-        text = re.sub(r'([:\n])\s*(•)', r'\1\n\2', text)  # 콜론이나 줄바꿈 뒤 불렛포인트
-        text = re.sub(r'(•[^•\n]+)(?=•)', r'\1\n', text)  # 불렛포인트 간 줄바꿈
+        # (출처: ...) 독립 라인, ▶ 섹션 구분자 앞뒤 줄바꿈, 연속된 불렛포인트 분리
+        for pattern, repl in SECTION_RULES:
+            text = pattern.sub(repl, text)
         
         # 해시태그 처리 (마지막 해시태그 섹션 앞에 2줄 줄바꿈)
         text = re.sub(r'([^#\n])(\s*)(#[가-힣a-zA-Z0-9_]+(?:\s+#[가-힣a-zA-Z0-9_]+)*)\s*$', r'\1\n\n\3', text)
@@ -106,7 +212,8 @@ class NewsConverter:
         text = re.sub(r'(•[^#\n]+)\s*(#[가-힣a-zA-Z0-9_]+(?:\s+#[가-힣a-zA-Z0-9_]+)+)', r'\1\n\n\2', text)
         
         # 이모지가 있는 제목 뒤 줄바꿈 추가
-        text = re.sub(r'(^[^\n]*[📈📊🎯💡🚀🔍📌⚡️🌟💰📱🏆🎮🌍🛡️][^\n]*)', r'\1\n', text, flags=re.MULTILINE)
+        pattern, repl = EMOJI_TITLE_RULE
+        text = pattern.sub(repl, text)
         
         # Remove triple backticks that might be in the response
         text = text.strip()
@@ -181,13 +288,144 @@ class NewsConverter:
         
         return cleaned_text
 
+    @contextmanager
+    def streaming(self, on_delta):
+        """
+        이 스레드의 call_api 를 스트리밍 모드로 전환 (with 블록 안에서만)
+        
+        응답 조각이 도착하면 줄 단위로 정리한 텍스트를 on_delta(text) 로 전달하고,
+        call_api 반환값은 기존과 같은 전체 응답 텍스트다. 다른 스레드의 호출에는 영향이 없다.
+        """
+        previous = getattr(self._stream_local, 'on_delta', None)
+        self._stream_local.on_delta = on_delta
+        try:
+            yield
+        finally:
+            self._stream_local.on_delta = previous
+
+    def call_api_stream(self, prompt, max_tokens=2000, temperature=0, meta=None):
+        """
+        제공자 스트리밍 API로 응답 텍스트 조각을 도착 순서대로 반환 (제너레이터)
+        
+        Anthropic 이 첫 조각 전에 실패하면 OpenAI 로 폴백한다.
+        Perplexity 는 스트리밍을 사용하지 않고 전체 응답을 한 조각으로 반환한다.
+        게이트웨이 슬롯은 스트림이 끝날 때까지 유지한다.
+        meta 딕셔너리를 넘기면 응답한 provider / model / usage 를 기록한다.
+        """
+        meta = meta if meta is not None else {}
+        tokens = estimate_tokens(prompt, max_tokens)
+        messages = [{"role": "user", "content": prompt}]
+        
+        def openai_stream(label):
+            meta.update(provider='openai', model=PROVIDER_MODELS['openai'])
+            with self.gateway.slot('openai', self._api_keys.get('openai'), tokens) as ticket:
+                stream = self.openai_client.chat.completions.create(
+                    model=PROVIDER_MODELS['openai'],
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    messages=messages,
+                    stream=True,
+                    stream_options={"include_usage": True}
+                )
+                print(f"[INFO] Streaming {label}.")
+                for chunk in stream:
+                    if getattr(chunk, 'usage', None):
+                        ticket.used_tokens = meta['usage'] = response_usage(chunk)
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+        
+        if self.api_provider == 'anthropic' and self.anthropic_client:
+            started = False
+            try:
+                meta.update(provider='anthropic', model=PROVIDER_MODELS['anthropic'])
+                with self.gateway.slot('anthropic', self._api_keys.get('anthropic'), tokens) as ticket:
+                    with self.anthropic_client.messages.stream(
+                        model=PROVIDER_MODELS['anthropic'],
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        messages=messages
+                    ) as stream:
+                        print("[INFO] Streaming Anthropic API.")
+                        for text in stream.text_stream:
+                            started = True
+                            yield text
+                        ticket.used_tokens = meta['usage'] = response_usage(stream.get_final_message())
+            except Exception as e:
+                # 이미 일부를 전달했으면 폴백 결과와 섞이지 않도록 그대로 실패
+                if started:
+                    raise
+                print(f"[WARN] Anthropic API failed: {e}\nFalling back to OpenAI API...")
+                if not self.openai_client:
+                    raise RuntimeError("OpenAI API key not set. Cannot fallback.")
+                yield from openai_stream("OpenAI API (fallback)")
+        elif self.api_provider == 'openai' and self.openai_client:
+            yield from openai_stream("OpenAI API")
+        else:
+            # call_api 로 다시 들어가면 streaming() 안에서 이 함수를 재귀 호출하므로 제공자를 직접 호출
+            # (클라이언트가 없으면 "No valid API client available." 오류)
+            text, provider, model, usage = self._call_provider(prompt, max_tokens, temperature)
+            meta.update(provider=provider, model=model, usage=usage)
+            yield text
+
+    @staticmethod
+    def _emit_streaming(chunks, on_delta):
+        """응답 조각을 정리해 on_delta 로 전달하고 전체 응답 반환"""
+        cleaner = StreamingCleaner()
+        for chunk in chunks:
+            text = cleaner.feed(chunk)
+            if text:
+                on_delta(text)
+        text = cleaner.finish()
+        if text:
+            on_delta(text + '\n')
+        return cleaner.text
+
     def call_api(self, prompt, max_tokens=2000, temperature=0):
-        """Call the appropriate API based on provider, fallback to OpenAI if Anthropic fails"""
+        """
+        Call the appropriate API based on provider, fallback to OpenAI if Anthropic fails
+        
+        temperature=0 응답은 LLM 응답 캐시에서 먼저 찾고, 적중하면 제공자를 호출하지 않는다.
+        폴백 제공자가 응답하면 요청한 제공자 키로도 저장해, 같은 프롬프트가 다시 실패할 호출을 거치지 않게 한다.
+        """
+        on_delta = getattr(self._stream_local, 'on_delta', None)
+        cache = self.completion_cache
+        model = PROVIDER_MODELS.get(self.api_provider)
+        
+        cached = cache.lookup(self.api_provider, model, max_tokens, prompt, temperature) if cache and model else None
+        if cached is not None:
+            return self._emit_streaming([cached], on_delta) if on_delta is not None else cached
+        
+        if on_delta is not None and self.api_provider in ('anthropic', 'openai'):
+            meta = {}
+            text = self._emit_streaming(
+                self.call_api_stream(prompt, max_tokens=max_tokens, temperature=temperature, meta=meta),
+                on_delta
+            )
+            provider, model, usage = meta.get('provider'), meta.get('model'), meta.get('usage')
+        else:
+            text, provider, model, usage = self._call_provider(prompt, max_tokens, temperature)
+        
+        if cache and provider:
+            cache.store_completion(provider, model, max_tokens, prompt, text, usage, temperature)
+            if provider != self.api_provider and self.api_provider in PROVIDER_MODELS:
+                cache.store_completion(self.api_provider, PROVIDER_MODELS[self.api_provider], max_tokens,
+                                       prompt, text, usage, temperature)
+        return text
+
+    def _call_provider(self, prompt, max_tokens, temperature):
+        """
+        제공자 API 호출
+        
+        Returns:
+            tuple: (응답 텍스트, 응답한 제공자, 모델, 실제 사용 토큰 또는 None)
+        """
+        tokens = estimate_tokens(prompt, max_tokens)
+        
         # Try Anthropic first if selected
         if self.api_provider == 'anthropic' and self.anthropic_client:
             try:
-                message = self.anthropic_client.messages.create(
-                    model="claude-3-opus-20240229",
+                message = self.gateway.call('anthropic', self._api_keys.get('anthropic'), lambda: self.anthropic_client.messages.create(
+                    model=PROVIDER_MODELS['anthropic'],
                     max_tokens=max_tokens,
                     temperature=temperature,
                     messages=[
@@ -196,20 +434,21 @@ class NewsConverter:
                             "content": prompt
                         }
                     ]
-                )
+                ), tokens)
                 print("[INFO] Used Anthropic API.")
                 # TextBlock 객체에서 텍스트 추출
                 if hasattr(message.content[0], 'text'):
-                    return message.content[0].text
+                    text = message.content[0].text
                 else:
-                    return str(message.content[0])
+                    text = str(message.content[0])
+                return text, 'anthropic', PROVIDER_MODELS['anthropic'], response_usage(message)
             except Exception as e:
                 print(f"[WARN] Anthropic API failed: {e}\nFalling back to OpenAI API...")
                 if not self.openai_client:
                     raise RuntimeError("OpenAI API key not set. Cannot fallback.")
                 # Fallback to OpenAI
-                response = self.openai_client.chat.completions.create(
-                    model="gpt-4o",
+                response = self.gateway.call('openai', self._api_keys.get('openai'), lambda: self.openai_client.chat.completions.create(
+                    model=PROVIDER_MODELS['openai'],
                     max_tokens=max_tokens,
                     temperature=temperature,
                     messages=[
@@ -218,12 +457,12 @@ class NewsConverter:
                             "content": prompt
                         }
                     ]
-                )
+                ), tokens)
                 print("[INFO] Used OpenAI API (fallback).")
-                return response.choices[0].message.content
+                return response.choices[0].message.content, 'openai', PROVIDER_MODELS['openai'], response_usage(response)
         elif self.api_provider == 'openai' and self.openai_client:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",
+            response = self.gateway.call('openai', self._api_keys.get('openai'), lambda: self.openai_client.chat.completions.create(
+                model=PROVIDER_MODELS['openai'],
                 max_tokens=max_tokens,
                 temperature=temperature,
                 messages=[
@@ -232,9 +471,9 @@ class NewsConverter:
                         "content": prompt
                     }
                 ]
-            )
+            ), tokens)
             print("[INFO] Used OpenAI API.")
-            return response.choices[0].message.content
+            return response.choices[0].message.content, 'openai', PROVIDER_MODELS['openai'], response_usage(response)
             
         elif self.api_provider == 'perplexity' and hasattr(self, 'perplexity_api_key'):
             import requests
@@ -243,21 +482,21 @@ class NewsConverter:
                 'Content-Type': 'application/json'
             }
             data = {
-                'model': 'llama-3.1-sonar-large-128k-chat',
+                'model': PROVIDER_MODELS['perplexity'],
                 'messages': [{'role': 'user', 'content': prompt}],
                 'max_tokens': max_tokens,
                 'temperature': temperature
             }
-            response = requests.post(
+            response = self.gateway.call('perplexity', self.perplexity_api_key, lambda: requests.post(
                 'https://api.perplexity.ai/chat/completions',
                 headers=headers,
                 json=data,
                 timeout=60
-            )
+            ), tokens)
             if response.status_code == 200:
                 result = response.json()
                 print("[INFO] Used Perplexity API.")
-                return result['choices'][0]['message']['content']
+                return result['choices'][0]['message']['content'], 'perplexity', PROVIDER_MODELS['perplexity'], response_usage(result)
             else:
                 raise RuntimeError(f"Perplexity API error: {response.status_code} - {response.text}")
                 
@@ -1166,6 +1405,23 @@ Article: {content}"""
         
         print(f"Created {output_path}")
 
+    def process_archived(self, url):
+        """Process an article stored in the article archive"""
+        data = self.read_archived_article(url)
+        if data is None:
+            print(f"Error: {url} is not in the article archive")
+            return
+        print(f"Processing archived article {url} with {self.api_provider} API...")
+        markdown_content = self.convert_to_markdown(data)
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_path = self.output_dir / f"archived_{timestamp}.md"
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(markdown_content)
+        
+        print(f"Created {output_path}")
+
     def process_directory(self, directory_path):
         """Process all TXT files in a directory"""
         directory = Path(directory_path)
@@ -1176,7 +1432,7 @@ def main():
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python converter.py <txt_file_or_directory> [api_provider]")
+        print("Usage: python converter.py <txt_file_or_directory_or_archived_url> [api_provider]")
         print("api_provider options: anthropic (default), openai, or perplexity")
         print("\nExamples:")
         print("  python converter.py article.txt")
@@ -1184,6 +1440,7 @@ def main():
         print("  python converter.py article.txt perplexity")
         print("  python converter.py ./articles/")
         print("  python converter.py ./articles/ openai")
+        print("  python converter.py https://example.com/news/123   # 기사 아카이브에서 읽기")
         sys.exit(1)
     
     path = sys.argv[1]
@@ -1210,7 +1467,9 @@ def main():
     
     converter = NewsConverter(api_provider=api_provider)
     
-    if os.path.isfile(path):
+    if path.startswith(('http://', 'https://')):
+        converter.process_archived(path)
+    elif os.path.isfile(path):
         converter.process_file(path)
     elif os.path.isdir(path):
         converter.process_directory(path)
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+기사 다운로드 캐시 (HTTP 응답 캐시 + 실패 캐시)
+
+- ResponseCache: 응답 본문과 ETag/Last-Modified 를 저장하고 다음 요청에서
+  If-None-Match / If-Modified-Since 조건부 요청으로 재검증 (304 이면 저장된 본문 사용)
+- FetchBackoff: 최근 4xx/5xx/연결 실패를 기억하고 지수 백오프 기간 동안 같은 URL/호스트 요청을 즉시 실패 처리
+  (차단된 사이트를 배치마다 다시 요청하거나 타임아웃까지 기다리지 않도록)
+
+두 캐시는 같은 저장소(프로세스 내 LRU + 워커 공유 SQLite)를 'resp:' / 'neg:' 접두사 키로 나눠 쓴다.
+"""
+
+import base64
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from content_cache import LRUCache, SQLiteCache, TieredCache, normalize_url
+
+logger = logging.getLogger(__name__)
+
+# 호스트 전체를 막는 4xx 응답 (인증/봇 차단, 요청 제한) - 5xx 와 연결 실패도 호스트 단위, 나머지 4xx 는 해당 URL만 막음
+HOST_WIDE_STATUSES = {401, 403, 429, 451}
+
+
+class FetchBackoffError(Exception):
+    """최근 실패한 URL/호스트를 백오프 기간 동안 요청하지 않을 때 발생"""
+
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: float = 0):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+def _host(url: str) -> str:
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class ResponseCache:
+    """기사 응답 본문 캐시 (검증자가 있는 응답만 저장)"""
+
+    def __init__(self, store: Any, fresh_ttl: float = 60, ttl: float = 24 * 3600):
+        """
+        Args:
+            store: 저장소 (LRUCache / TieredCache)
+            fresh_ttl: 재검증 없이 저장된 본문을 쓰는 시간 (초, 직후 재요청 생략용)
+            ttl: 본문 보관 시간 (초)
+        """
+        self.store = store
+        self.fresh_ttl = fresh_ttl
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            'fresh_hits': 0,
+            'revalidated_hits': 0,
+            'misses': 0,
+            'stored': 0,
+            'bytes_saved': 0
+        }
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return f"resp:{normalize_url(url)}"
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """저장된 응답 (body 는 압축 해제된 바이트, 없거나 손상되면 None)"""
+        entry = self.store.get(self._key(url))
+        if entry is None:
+            return None
+        try:
+            body = zlib.decompress(base64.b64decode(entry['body']))
+        except (ValueError, zlib.error, KeyError):
+            self.store.delete(self._key(url))
+            return None
+        return {**entry, 'body': body}
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry.get('stored_at', 0) < self.fresh_ttl
+
+    def _write(self, url: str, body: bytes, encoding: str, validators: Dict[str, str],
+               truncated: Optional[str]) -> None:
+        self.store.set(self._key(url), {
+            'body': base64.b64encode(zlib.compress(body)).decode('ascii'),
+            'encoding': encoding,
+            'validators': validators,
+            'truncated': truncated,
+            'stored_at': time.time()
+        }, ttl=self.ttl)
+
+    def store_response(self, url: str, body: bytes, encoding: str, validators: Dict[str, str],
+                       truncated: Optional[str] = None) -> None:
+        """응답 저장 (ETag/Last-Modified 가 없으면 재검증할 수 없으므로 저장하지 않음)"""
+        if not validators:
+            return
+        self._write(url, body, encoding, validators, truncated)
+        self.count('stored')
+
+    def touch(self, url: str, entry: Dict[str, Any]) -> None:
+        """304 응답 후 저장 시각 갱신"""
+        self._write(url, entry['body'], entry['encoding'], entry['validators'], entry.get('truncated'))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        hits = stats['fresh_hits'] + stats['revalidated_hits']
+        lookups = hits + stats['misses']
+        return {
+            **stats,
+            'fresh_ttl': self.fresh_ttl,
+            'ttl': self.ttl,
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class FetchBackoff:
+    """최근 실패한 URL/호스트에 대한 지수 백오프 (실패 캐시)"""
+
+    def __init__(self, store: Any, base_delay: float = 60, max_delay: float = 3600):
+        """
+        Args:
+            store: 저장소 (LRUCache / TieredCache)
+            base_delay: 첫 실패 후 요청을 막는 시간 (초, 연속 실패마다 2배)
+            max_delay: 최대 백오프 시간 (초)
+        """
+        self.store = store
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            'blocked': 0,
+            'failures': 0,
+            'recoveries': 0
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    @staticmethod
+    def _keys(url: str) -> Tuple[str, str]:
+        return f"neg:url:{normalize_url(url)}", f"neg:host:{_host(url)}"
+
+    def _blocking_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        for key in self._keys(url):
+            entry = self.store.get(key)
+            if entry and entry['retry_at'] > now:
+                return entry
+        return None
+
+    def is_blocked(self, url: str) -> bool:
+        """백오프 중인 URL/호스트인지 확인 (통계에 집계하지 않음, 요청 전 사전 확인용)"""
+        return self._blocking_entry(url) is not None
+
+    def check(self, url: str) -> None:
+        """백오프 중인 URL/호스트이면 FetchBackoffError 발생"""
+        entry = self._blocking_entry(url)
+        if entry is not None:
+            self._count('blocked')
+            remaining = max(0.0, entry['retry_at'] - time.time())
+            raise FetchBackoffError(
+                f"{entry['error']} (최근 {entry['failures']}회 실패, {remaining:.0f}초 후 재시도)",
+                status=entry.get('status'), retry_after=remaining
+            )
+
+    def record_failure(self, url: str, status: Optional[int], error: str, retry_after: Optional[float] = None) -> float:
+        """
+        실패 기록 (백오프 시간 반환)
+
+        4xx 중 차단/요청 제한(401/403/429/451), 5xx, 연결 실패/타임아웃은 호스트 전체,
+        나머지 4xx(404 등)는 해당 URL만 백오프한다.
+        """
+        url_key, host_key = self._keys(url)
+        key = url_key if status is not None and 400 <= status < 500 and status not in HOST_WIDE_STATUSES else host_key
+        previous = self.store.get(key) or {}
+        failures = previous.get('failures', 0) + 1
+        delay = min(self.base_delay * (2 ** (failures - 1)), self.max_delay)
+        if retry_after:
+            delay = max(delay, min(retry_after, self.max_delay))
+
+        # 실패 횟수는 백오프가 끝난 뒤에도 max_delay 동안 유지 (연속 실패 시 대기 시간 증가)
+        self.store.set(key, {
+            'failures': failures,
+            'status': status,
+            'error': error[:300],
+            'retry_at': time.time() + delay
+        }, ttl=delay + self.max_delay)
+        self._count('failures')
+        logger.warning(f"🚫 다운로드 실패 기록: {key[4:]} ({status or error[:60]}), {delay:.0f}초 동안 요청 생략")
+        return delay
+
+    def record_success(self, url: str) -> None:
+        """성공 시 URL/호스트 실패 기록 삭제"""
+        for key in self._keys(url):
+            if self.store.get(key) is not None:
+                self.store.delete(key)
+                self._count('recoveries')
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        return {
+            **stats,
+            'base_delay': self.base_delay,
+            'max_delay': self.max_delay
+        }
+
+
+# 싱글톤 인스턴스
+fetch_store_instance = None
+response_cache_instance = None
+fetch_backoff_instance = None
+_singleton_lock = threading.Lock()
+
+
+def _get_fetch_store():
+    """응답/실패 캐시 공용 저장소 (CACHE_BACKEND=sqlite 이면 워커 간 공유)"""
+    global fetch_store_instance
+    if fetch_store_instance is None:
+        with _singleton_lock:
+            if fetch_store_instance is None:
+                ttl = float(os.getenv('RESPONSE_CACHE_TTL_SECONDS', 24 * 3600))
+                l1 = LRUCache(
+                    max_entries=int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', 300)),
+                    max_bytes=int(os.getenv('RESPONSE_CACHE_MAX_BYTES', 32 * 1024 * 1024)),
+                    default_ttl=ttl
+                )
+                if os.getenv('CACHE_BACKEND', 'sqlite').lower() == 'sqlite':
+                    try:
+                        l2 = SQLiteCache(
+                            db_path=os.getenv('RESPONSE_CACHE_DB_PATH', 'cache/http_cache.db'),
+                            max_bytes=int(os.getenv('RESPONSE_CACHE_DB_MAX_BYTES', 256 * 1024 * 1024)),
+                            default_ttl=ttl
+                        )
+                        fetch_store_instance = TieredCache(l1, l2)
+                    except sqlite3.Error as e:
+                        logger.warning(f"⚠️ 응답 캐시 공유 저장소 초기화 실패, 메모리 캐시만 사용: {e}")
+                        fetch_store_instance = l1
+                else:
+                    fetch_store_instance = l1
+    return fetch_store_instance
+
+
+def get_response_cache() -> ResponseCache:
+    """기사 응답 캐시 인스턴스 가져오기"""
+    global response_cache_instance
+    if response_cache_instance is None:
+        store = _get_fetch_store()
+        with _singleton_lock:
+            if response_cache_instance is None:
+                response_cache_instance = ResponseCache(
+                    store,
+                    fresh_ttl=float(os.getenv('RESPONSE_CACHE_FRESH_SECONDS', 60)),
+                    ttl=float(os.getenv('RESPONSE_CACHE_TTL_SECONDS', 24 * 3600))
+                )
+    return response_cache_instance
+
+
+def get_fetch_backoff() -> FetchBackoff:
+    """다운로드 실패 캐시 인스턴스 가져오기"""
+    global fetch_backoff_instance
+    if fetch_backoff_instance is None:
+        store = _get_fetch_store()
+        with _singleton_lock:
+            if fetch_backoff_instance is None:
+                fetch_backoff_instance = FetchBackoff(
+                    store,
+                    base_delay=float(os.getenv('FETCH_BACKOFF_BASE_SECONDS', 60)),
+                    max_delay=float(os.getenv('FETCH_BACKOFF_MAX_SECONDS', 3600))
+                )
+    return fetch_backoff_instance
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+배치 생성용 2단계 파이프라인 (기사 수집 → AI 변환)
+
+네트워크 대기가 대부분인 수집 단계는 LLM 호출 단계보다 훨씬 많이 동시에 실행할 수 있다.
+asyncio 이벤트 루프가 호스트별 동시 요청 수를 제한하면서 모든 URL을 한꺼번에 수집하고,
+수집이 끝난 기사는 asyncio.Queue 를 통해 변환 워커(기존 동시 처리 수)로 넘긴다.
+50개 URL 배치의 수집 시간이 8개씩 순차 라운드가 아니라 가장 느린 페이지 수준으로 줄어든다.
+
+수집 함수는 공유 연결 풀(http_client)과 추출 캐시를 쓰는 동기 함수이므로
+전용 스레드 풀에서 실행한다 (aiohttp/httpx 의존성 없이 기존 추출 경로 유지).
+
+호스트별 수집은 HostScheduler 가 조절한다.
+- 호스트별 동시 요청 수를 AIMD 로 조절 (성공 시 천천히 증가, 403/429/503·지연 급증 시 절반으로 감소)
+- 호스트별 요청 속도 제한 (토큰 버킷, 차단 응답 시 속도도 절반)
+- 수집 시작 순서를 호스트 간 번갈아 배치 (한 호스트 URL이 앞쪽 슬롯을 독점하지 않도록)
+- 실패 캐시(백오프) 중인 URL은 precheck_fn 으로 슬롯/요청 간격을 쓰지 않고 바로 처리
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+# 호스트가 요청을 제한하거나 차단할 때의 응답 (동시성/속도 감소 신호)
+THROTTLE_STATUSES = {403, 429, 503}
+
+
+def classify_fetch_result(result: Any) -> Optional[str]:
+    """
+    수집 결과 분류: 'ok' / 'throttled' (차단·요청 제한) / 'error'
+
+    실패 캐시로 요청하지 않은 결과(backed_off)는 네트워크 결과가 아니므로 None (한도/속도 조정 안 함)
+    """
+    if not isinstance(result, dict):
+        return 'ok'
+    if result.get('backed_off'):
+        return None
+    if result.get('http_status') in THROTTLE_STATUSES:
+        return 'throttled'
+    return 'ok' if result.get('success', True) else 'error'
+
+
+def interleave_by_host(urls: List[str]) -> List[int]:
+    """호스트별로 번갈아 가며 URL 인덱스 나열 (호스트 안에서는 원래 순서 유지)"""
+    by_host: Dict[str, List[int]] = defaultdict(list)
+    for index, url in enumerate(urls):
+        by_host[urlparse(url).netloc.lower()].append(index)
+    order = []
+    queues = list(by_host.values())
+    depth = 0
+    while len(order) < len(urls):
+        for indices in queues:
+            if depth < len(indices):
+                order.append(indices[depth])
+        depth += 1
+    return order
+
+
+class HostScheduler:
+    """
+    호스트별 적응형 동시성 + 요청 속도 제한 (이벤트 루프 안에서만 사용)
+
+    동시 요청 한도는 initial 에서 시작해 성공할 때마다 1/한도 씩 늘어나고 (한도만큼 성공하면 +1),
+    차단/요청 제한 응답이나 지연 급증(평균의 spike_factor 배 이상) 시 절반으로 줄어든다.
+    감소 이전에 시작된 요청의 결과로는 다시 줄이지 않는다 (동시에 돌아온 429 여러 개에 한 번만 반응).
+    요청 간격은 호스트별 토큰 버킷(rate 회/초, burst)으로 제한한다. (rate 가 0 이하이면 간격 제한 없음)
+    """
+
+    def __init__(self, initial: int = 8, maximum: int = 10, rate: float = 10.0, burst: int = 10,
+                 spike_factor: float = 3.0, min_spike_seconds: float = 2.0):
+        """
+        Args:
+            initial: 호스트별 시작 동시 요청 수
+            maximum: 호스트별 최대 동시 요청 수
+            rate: 호스트별 초당 최대 요청 수 (0 이하이면 제한 없음)
+            burst: 쉬고 있던 호스트에 한꺼번에 보낼 수 있는 요청 수
+            spike_factor: 지연 급증 판단 배수 (호스트 평균 응답 시간 대비)
+            min_spike_seconds: 이보다 빠른 응답은 급증으로 보지 않음 (초)
+        """
+        self.initial = max(1, initial)
+        self.maximum = max(self.initial, maximum)
+        self.rate = rate if rate > 0 else 0.0
+        self.burst = max(1, burst)
+        self.spike_factor = spike_factor
+        self.min_spike_seconds = min_spike_seconds
+        self._hosts: Dict[str, Dict[str, Any]] = {}
+
+    def _host(self, host: str) -> Dict[str, Any]:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = {
+                'limit': float(self.initial),
+                'rate': self.rate,
+                'in_flight': 0,
+                'next_slot': 0.0,
+                'decreased_at': 0.0,
+                'latency_ewma': None,
+                'condition': asyncio.Condition(),
+                'requests': 0,
+                'errors': 0,
+                'throttled': 0,
+                'decreases': 0,
+                'max_in_flight': 0,
+                'wait_seconds': 0.0
+            }
+        return state
+
+    async def acquire(self, host: str) -> None:
+        """동시 요청 한도와 요청 간격을 지킬 때까지 대기"""
+        state = self._host(host)
+        started = time.monotonic()
+        async with state['condition']:
+            await state['condition'].wait_for(lambda: state['in_flight'] < int(state['limit']))
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+
+            # 토큰 버킷: 쉬던 호스트는 burst 만큼 바로 보내고, 이후에는 1/rate 초 간격
+            now = time.monotonic()
+            slot = now
+            if state['rate'] > 0:
+                interval = 1.0 / state['rate']
+                slot = max(state['next_slot'], now - (self.burst - 1) * interval)
+                state['next_slot'] = slot + interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+        state['wait_seconds'] += time.monotonic() - started
+
+    async def release(self, host: str, started: float, outcome: Optional[str]) -> None:
+        """
+        요청 완료 기록 및 한도 조정
+
+        Args:
+            started: 요청 시작 시각 (time.monotonic)
+            outcome: classify_fetch_result 결과 ('ok' / 'throttled' / 'error'), 요청하지 않았으면 None
+        """
+        state = self._host(host)
+        async with state['condition']:
+            state['in_flight'] -= 1
+            state['condition'].notify_all()
+            if outcome is None:
+                return
+            state['requests'] += 1
+            latency = time.monotonic() - started
+            average = state['latency_ewma']
+            spike = (average is not None and latency >= self.min_spike_seconds
+                     and latency > average * self.spike_factor)
+
+            if outcome == 'throttled':
+                state['throttled'] += 1
+            if (outcome == 'throttled' or spike) and started >= state['decreased_at']:
+                state['limit'] = max(1.0, state['limit'] / 2)
+                state['decreases'] += 1
+                state['decreased_at'] = time.monotonic()
+                if outcome == 'throttled' and self.rate > 0:
+                    state['rate'] = max(self.rate / 16, state['rate'] / 2)
+                logger.warning(
+                    f"🐢 {host} 수집 속도 감소 ({'차단/요청 제한' if outcome == 'throttled' else f'지연 {latency:.1f}초'}): "
+                    f"동시 {int(state['limit'])}개" + (f", 초당 {state['rate']:.1f}회" if self.rate > 0 else '')
+                )
+            elif outcome == 'ok' and not spike:
+                state['limit'] = min(float(self.maximum), state['limit'] + 1 / state['limit'])
+                state['rate'] = min(self.rate, state['rate'] * 1.1)
+            elif outcome == 'error':
+                state['errors'] += 1
+
+            # 캐시 히트처럼 네트워크를 거치지 않은 결과는 평균 응답 시간에서 제외
+            if outcome != 'throttled' and latency >= 0.05:
+                state['latency_ewma'] = latency if average is None else average * 0.8 + latency * 0.2
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """호스트별 요청 수, 차단 수, 현재 동시 한도/속도, 평균 응답 시간"""
+        return {
+            host: {
+                'requests': state['requests'],
+                'errors': state['errors'],
+                'throttled': state['throttled'],
+                'decreases': state['decreases'],
+                'concurrency_limit': int(state['limit']),
+                'max_in_flight': state['max_in_flight'],
+                'rate_per_second': round(state['rate'], 2),
+                'avg_latency_ms': round(state['latency_ewma'] * 1000, 1) if state['latency_ewma'] is not None else None,
+                'wait_seconds': round(state['wait_seconds'], 3)
+            }
+            for host, state in self._hosts.items()
+        }
+
+
+class BatchPipeline:
+    """수집(높은 동시성, 호스트별 제한) → 변환(제한된 동시성) 파이프라인"""
+
+    def __init__(self, fetch_fn: Callable[[str], Any],
+                 convert_fn: Callable[[int, str, Any], Dict[str, Any]],
+                 fetch_concurrency: int = 32, per_host_limit: int = 8, convert_workers: int = 8,
+                 per_host_max: Optional[int] = None, per_host_rate: float = 10.0,
+                 classify_fn: Callable[[Any], Optional[str]] = classify_fetch_result,
+                 precheck_fn: Optional[Callable[[str], Optional[Any]]] = None):
+        """
+        Args:
+            fetch_fn: url → 수집 결과 (동기 함수)
+            convert_fn: (index, url, 수집 결과) → 최종 결과 딕셔너리 (동기 함수)
+            fetch_concurrency: 전체 동시 수집 수
+            per_host_limit: 같은 호스트로의 시작 동시 수집 수
+            convert_workers: 동시 변환 수 (LLM 호출 동시성)
+            per_host_max: 응답이 좋은 호스트의 최대 동시 수집 수 (기본값: per_host_limit)
+            per_host_rate: 같은 호스트로의 초당 최대 요청 수 (0 이하이면 제한 없음)
+            classify_fn: 수집 결과 → 'ok' / 'throttled' / 'error' (요청하지 않은 결과는 None)
+            precheck_fn: url → 호스트 슬롯 없이 바로 쓸 수집 결과 또는 None (동기 함수, 백오프 중인 URL용)
+        """
+        self.fetch_fn = fetch_fn
+        self.convert_fn = convert_fn
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.per_host_max = max(self.per_host_limit, per_host_max or self.per_host_limit)
+        self.per_host_rate = per_host_rate
+        self.classify_fn = classify_fn
+        self.precheck_fn = precheck_fn
+        self.convert_workers = max(1, convert_workers)
+        self._stop = threading.Event()
+        self.stats: Dict[str, Any] = {
+            'fetched': 0,
+            'fetch_errors': 0,
+            'prechecked': 0,
+            'converted': 0,
+            'fetch_seconds': 0.0,
+            'hosts': {}
+        }
+
+    def run(self, urls: List[str]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        변환이 끝나는 순서대로 (원래 인덱스, 결과) 반환
+
+        제너레이터가 중간에 닫히면 아직 시작하지 않은 수집/변환은 건너뛰고
+        실행 중인 작업이 끝날 때까지 기다린다.
+        """
+        urls = list(urls)
+        results: 'queue.Queue[Any]' = queue.Queue()
+        self._stop.clear()
+        thread = threading.Thread(
+            target=self._run_loop, args=(urls, results),
+            name='nongbuxx-batch-pipeline', daemon=True
+        )
+        thread.start()
+
+        pending = set(range(len(urls)))
+        try:
+            while pending:
+                item = results.get()
+                if item is _DONE:
+                    break
+                index, result = item
+                pending.discard(index)
+                yield index, result
+
+            # 파이프라인이 비정상 종료된 경우 남은 URL은 실패로 처리
+            for index in sorted(pending):
+                yield index, {'success': False, 'error': 'Batch pipeline stopped', 'url': urls[index]}
+        finally:
+            self._stop.set()
+            thread.join()
+
+    def _run_loop(self, urls, results):
+        try:
+            asyncio.run(self._pipeline(urls, results))
+        except Exception as e:
+            logger.error(f"❌ 배치 파이프라인 오류: {e}")
+        finally:
+            results.put(_DONE)
+
+    async def _pipeline(self, urls, results):
+        loop = asyncio.get_running_loop()
+        fetch_executor = ThreadPoolExecutor(max_workers=self.fetch_concurrency, thread_name_prefix='nongbuxx-fetch')
+        convert_executor = ThreadPoolExecutor(max_workers=self.convert_workers, thread_name_prefix='nongbuxx-convert')
+        fetch_limit = asyncio.Semaphore(self.fetch_concurrency)
+        scheduler = HostScheduler(
+            initial=self.per_host_limit, maximum=self.per_host_max,
+            rate=self.per_host_rate, burst=self.per_host_limit
+        )
+        fetched: 'asyncio.Queue[Any]' = asyncio.Queue()
+        started_at = time.time()
+
+        async def fetch(index, url):
+            host = urlparse(url).netloc.lower()
+            if self.precheck_fn is not None and not self._stop.is_set():
+                try:
+                    article = await loop.run_in_executor(fetch_executor, self.precheck_fn, url)
+                except Exception as e:
+                    logger.warning(f"⚠️ 수집 사전 확인 실패, 일반 수집 진행: {e}")
+                    article = None
+                if article is not None:
+                    # 실패 캐시 결과는 호스트 슬롯/요청 간격을 쓰지 않고 바로 변환 단계로 전달
+                    self.stats['prechecked'] += 1
+                    self.stats['fetched'] += 1
+                    await fetched.put((index, url, article))
+                    return
+
+            # 호스트 제한을 먼저 잡아 한 호스트의 대기 작업이 전체 슬롯을 점유하지 않도록 함
+            await scheduler.acquire(host)
+            fetch_start = time.monotonic()
+            outcome = None
+            try:
+                async with fetch_limit:
+                    if self._stop.is_set():
+                        return
+                    outcome = 'error'
+                    fetch_start = time.monotonic()
+                    try:
+                        article = await loop.run_in_executor(fetch_executor, self.fetch_fn, url)
+                    except Exception as e:
+                        self.stats['fetch_errors'] += 1
+                        results.put((index, {'success': False, 'error': str(e), 'url': url}))
+                        return
+                    outcome = self.classify_fn(article)
+            finally:
+                await scheduler.release(host, fetch_start, outcome)
+                self.stats['hosts'] = scheduler.get_stats()
+            self.stats['fetched'] += 1
+            await fetched.put((index, url, article))
+
+        async def convert_worker():
+            while True:
+                item = await fetched.get()
+                if item is None:
+                    return
+                index, url, article = item
+                if self._stop.is_set():
+                    continue
+                try:
+                    result = await loop.run_in_executor(convert_executor, self.convert_fn, index, url, article)
+                except Exception as e:
+                    result = {'success': False, 'error': str(e), 'url': url}
+                self.stats['converted'] += 1
+                results.put((index, result))
+
+        workers = [asyncio.create_task(convert_worker()) for _ in range(self.convert_workers)]
+        try:
+            await asyncio.gather(*(fetch(index, urls[index]) for index in interleave_by_host(urls)))
+            self.stats['fetch_seconds'] = round(time.time() - started_at, 3)
+            logger.info(f"📥 배치 수집 완료: {self.stats['fetched']}/{len(urls)}개 ({self.stats['fetch_seconds']}초)")
+            for _ in workers:
+                await fetched.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            fetch_executor.shutdown(wait=True, cancel_futures=True)
+            convert_executor.shutdown(wait=True, cancel_futures=True)
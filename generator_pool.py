@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+NongbuxxGenerator 인스턴스 풀
+
+요청마다 WebExtractor / NewsConverter / BlogContentGenerator 와 LLM SDK 클라이언트를
+새로 만들지 않고, (API 제공자, API 키 해시, 중간 파일 저장 여부) 단위로 초기화된
+생성기를 재사용한다. 생성기는 실행 중 상태(진행 콜백, 병렬 통계)를 가지므로
+한 번에 하나의 요청만 빌려 쓴다.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Tuple
+
+from nongbuxx_generator import NongbuxxGenerator
+
+logger = logging.getLogger(__name__)
+
+
+def _pool_key(api_provider, api_key, save_intermediate) -> Tuple[str, str, bool]:
+    """풀 키 생성 (API 키 원문 대신 해시 사용)"""
+    key_hash = hashlib.sha256((api_key or '').encode('utf-8')).hexdigest()
+    return (api_provider, key_hash, bool(save_intermediate))
+
+
+class GeneratorPool:
+    """API 키별 생성기 재사용 풀 (유휴 만료 + 전체 크기 제한)"""
+
+    def __init__(self, max_idle: int = 16, idle_ttl: float = 600):
+        """
+        Args:
+            max_idle: 풀에 보관할 최대 유휴 생성기 수 (초과 시 가장 오래된 것부터 제거)
+            idle_ttl: 유휴 생성기 보관 시간 (초)
+        """
+        self.max_idle = max_idle
+        self.idle_ttl = idle_ttl
+        # 반납 순서대로 보관: token -> (풀 키, 생성기, 반납 시각)
+        self._idle: 'OrderedDict[int, Tuple[Tuple[str, str, bool], NongbuxxGenerator, float]]' = OrderedDict()
+        self._next_token = 0
+        self._lock = threading.Lock()
+
+        self.stats: Dict[str, int] = {
+            'created': 0,
+            'reused': 0,
+            'released': 0,
+            'evictions': 0,
+            'expirations': 0
+        }
+
+    def acquire(self, api_provider='anthropic', api_key=None, save_intermediate=False) -> NongbuxxGenerator:
+        """같은 키의 유휴 생성기를 꺼내거나 새로 생성"""
+        key = _pool_key(api_provider, api_key, save_intermediate)
+        with self._lock:
+            self._purge_expired_locked()
+            # 가장 최근에 반납된 인스턴스 우선 (연결이 살아있을 가능성이 높음)
+            for token in reversed(self._idle):
+                entry_key, generator, _ = self._idle[token]
+                if entry_key == key:
+                    del self._idle[token]
+                    self.stats['reused'] += 1
+                    return generator
+
+        generator = NongbuxxGenerator(
+            api_provider=api_provider,
+            api_key=api_key,
+            save_intermediate=save_intermediate
+        )
+        with self._lock:
+            self.stats['created'] += 1
+        return generator
+
+    def release(self, generator: NongbuxxGenerator):
+        """사용이 끝난 생성기 반납 (실행 상태 초기화 후 보관)"""
+        if not generator.is_ready():
+            self._discard(generator)
+            return
+
+        generator.reset_run_state()
+        key = _pool_key(generator.api_provider, generator.api_key, generator.save_intermediate)
+        evicted = []
+        with self._lock:
+            self._idle[self._next_token] = (key, generator, time.time())
+            self._next_token += 1
+            self.stats['released'] += 1
+            while len(self._idle) > self.max_idle:
+                _, (_, old_generator, _) = self._idle.popitem(last=False)
+                evicted.append(old_generator)
+                self.stats['evictions'] += 1
+
+        for old_generator in evicted:
+            self._discard(old_generator)
+
+    @contextmanager
+    def lease(self, api_provider='anthropic', api_key=None, save_intermediate=False):
+        """with 블록 동안 생성기를 빌려 쓰고 자동 반납"""
+        generator = self.acquire(api_provider, api_key, save_intermediate)
+        try:
+            yield generator
+        finally:
+            self.release(generator)
+
+    def _purge_expired_locked(self):
+        now = time.time()
+        expired = [token for token, (_, _, released_at) in self._idle.items()
+                   if now - released_at >= self.idle_ttl]
+        for token in expired:
+            del self._idle[token]
+            self.stats['expirations'] += 1
+
+    @staticmethod
+    def _discard(generator: NongbuxxGenerator):
+        try:
+            generator.cleanup()
+        except Exception as e:
+            logger.warning(f"⚠️ 생성기 정리 실패: {e}")
+
+    def clear(self):
+        with self._lock:
+            generators = [generator for _, generator, _ in self._idle.values()]
+            self._idle.clear()
+        for generator in generators:
+            self._discard(generator)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._purge_expired_locked()
+            requests_served = self.stats['created'] + self.stats['reused']
+            return {
+                **self.stats,
+                'idle': len(self._idle),
+                'idle_keys': len({key for key, _, _ in self._idle.values()}),
+                'max_idle': self.max_idle,
+                'idle_ttl': self.idle_ttl,
+                'reuse_rate': round(self.stats['reused'] / requests_served, 4) if requests_served else 0.0
+            }
+
+
+# 싱글톤 인스턴스
+generator_pool_instance = None
+_generator_pool_lock = threading.Lock()
+
+
+def get_generator_pool() -> GeneratorPool:
+    """생성기 풀 인스턴스 가져오기"""
+    global generator_pool_instance
+    if generator_pool_instance is None:
+        with _generator_pool_lock:
+            if generator_pool_instance is None:
+                generator_pool_instance = GeneratorPool(
+                    max_idle=int(os.getenv('GENERATOR_POOL_SIZE', 16)),
+                    idle_ttl=float(os.getenv('GENERATOR_POOL_IDLE_SECONDS', 600))
+                )
+    return generator_pool_instance
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+공유 HTTP 클라이언트
+
+WebExtractor / OptimizedNewsExtractor / NaverNewsExtractor 가 함께 쓰는
+연결 풀 기반 HTTP 클라이언트. 같은 호스트로의 요청은 keep-alive 연결을 재사용하여
+DNS 조회, TCP 연결, TLS 핸드셰이크를 반복하지 않는다.
+- 호스트별 연결 풀 (배치 생성 동시 처리 수에 맞춘 크기)
+- 요청별 연결(connect, DNS+TCP+TLS) / 응답 대기 / 전체 시간 측정
+- 호스트별 누적 통계 (연결 재사용률 포함)
+- 본문 스트리밍 다운로드 (크기 상한 / 기사 영역 종료 시 중단, charset 판별)
+- 기사 다운로드용 응답 캐시(조건부 요청) + 실패 캐시(백오프) 연동 (fetch_page)
+
+requests/urllib3 는 HTTP/2 를 지원하지 않으므로 HTTP/1.1 keep-alive 재사용으로 처리한다.
+공유 세션의 헤더는 변경하지 않고 요청마다 headers 인자로 전달한다.
+"""
+
+import codecs
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from fetch_cache import FetchBackoff, ResponseCache, get_fetch_backoff, get_response_cache
+
+logger = logging.getLogger(__name__)
+
+# 현재 스레드에서 진행 중인 요청의 연결 수립 시간 누적
+_connect_timing = threading.local()
+
+# 스트리밍 다운로드 설정
+STREAM_CHUNK_SIZE = 16 * 1024
+CHARSET_SNIFF_BYTES = 4096
+_HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+_ARTICLE_TAG = re.compile(rb'<(/?)article[\s>]', re.I)
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def _record_connect(elapsed: float) -> None:
+    _connect_timing.seconds = getattr(_connect_timing, 'seconds', 0.0) + elapsed
+    _connect_timing.count = getattr(_connect_timing, 'count', 0) + 1
+
+
+def _valid_charset(name: Optional[str]) -> Optional[str]:
+    """인코딩 이름을 파이썬 표준 이름으로 변환 (ks_c_5601-1987 → euc_kr 등, 모르는 이름은 None)"""
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def detect_charset(content_type: Optional[str], head: bytes) -> str:
+    """
+    응답 본문 인코딩 판별 (본문을 디코딩하지 않음)
+
+    Content-Type 헤더의 charset → BOM → 문서 앞부분의 <meta charset> → UTF-8 순서.
+    """
+    match = _HEADER_CHARSET.search(content_type or '')
+    charset = _valid_charset(match.group(1)) if match else None
+    if charset:
+        return charset
+    for bom, name in _BOMS:
+        if head.startswith(bom):
+            return name
+    match = _META_CHARSET.search(head[:CHARSET_SNIFF_BYTES])
+    charset = _valid_charset(match.group(1).decode('ascii', errors='ignore')) if match else None
+    return charset or 'utf-8'
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _record_connect(time.perf_counter() - start)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        # TCP 연결 + TLS 핸드셰이크 포함
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _record_connect(time.perf_counter() - start)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """새 연결 수립 시간을 측정하는 연결 풀 어댑터"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool
+        }
+
+
+class HttpClient:
+    """스레드 간 공유되는 연결 풀 HTTP 클라이언트"""
+
+    def __init__(self, pool_connections: int = 32, pool_maxsize: int = 10, default_timeout: float = 30,
+                 response_cache: Optional[ResponseCache] = None, backoff: Optional[FetchBackoff] = None):
+        """
+        Args:
+            pool_connections: 연결 풀을 유지할 최대 호스트 수
+            pool_maxsize: 호스트별로 유지할 keep-alive 연결 수 (배치 동시 처리 수 이상 권장)
+            default_timeout: 요청별 timeout 미지정 시 기본값 (초)
+            response_cache: fetch_page 응답 캐시 (없으면 항상 전체 다운로드)
+            backoff: fetch_page 실패 캐시 (없으면 실패를 기억하지 않음)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.default_timeout = default_timeout
+        self.response_cache = response_cache
+        self.backoff = backoff
+
+        self.session = requests.Session()
+        adapter = _TimedHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._lock = threading.Lock()
+        self._host_stats: Dict[str, Dict[str, Any]] = {}
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """
+        HTTP 요청 (연결 재사용)
+
+        응답 객체에 timing 속성으로 요청별 시간 정보를 붙인다.
+        - connect: 새 연결 수립 시간 (재사용 시 0)
+        - ttfb: 요청 전송 후 응답 헤더 수신까지
+        - total: 본문 수신 포함 전체 시간
+        - reused_connection: keep-alive 연결 재사용 여부
+        """
+        _connect_timing.seconds = 0.0
+        _connect_timing.count = 0
+        host = urlparse(url).netloc.lower()
+        start = time.perf_counter()
+        try:
+            response = self.session.request(
+                method, url, headers=headers,
+                timeout=timeout if timeout is not None else self.default_timeout,
+                **kwargs
+            )
+        except requests.RequestException:
+            self._record(host, time.perf_counter() - start, _connect_timing.seconds, _connect_timing.count, error=True)
+            raise
+
+        total = time.perf_counter() - start
+        connect = _connect_timing.seconds
+        new_connections = _connect_timing.count
+        response.timing = {
+            'connect': round(connect, 4),
+            'ttfb': round(response.elapsed.total_seconds(), 4),
+            'total': round(total, 4),
+            'reused_connection': new_connections == 0
+        }
+        self._record(host, total, connect, new_connections)
+        return response
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        return self.request('GET', url, headers=headers, timeout=timeout, **kwargs)
+
+    def get_limited(self, url: str, headers: Optional[Dict[str, str]] = None,
+                    timeout: Optional[float] = None, max_bytes: int = 3 * 1024 * 1024,
+                    stop_at_article_end: bool = False) -> Tuple[requests.Response, bytes, Dict[str, Any]]:
+        """
+        본문을 스트리밍으로 받아 상한까지만 읽는 GET 요청
+
+        Args:
+            max_bytes: 읽을 최대 바이트 수 (압축 해제 후 기준)
+            stop_at_article_end: 최상위 <article> 요소가 닫히면 읽기 중단
+
+        Returns:
+            (응답, 본문 바이트, 다운로드 정보)
+            다운로드 정보: bytes_read, encoding, truncated (None / 'max_bytes' / 'article_end')
+            response.timing['total'] 은 본문 수신까지 포함한다.
+        """
+        start = time.perf_counter()
+        response = self.request('GET', url, headers=headers, timeout=timeout, stream=True)
+        chunks = []
+        bytes_read = 0
+        truncated = None
+        depth = 0
+        tail = b''
+        try:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                if bytes_read + len(chunk) > max_bytes:
+                    chunk = chunk[:max_bytes - bytes_read]
+                    truncated = 'max_bytes'
+                chunks.append(chunk)
+                bytes_read += len(chunk)
+                if truncated:
+                    break
+                if stop_at_article_end:
+                    # 청크 경계에 걸친 태그도 찾도록 직전 청크 끝부분을 이어 붙여 검사
+                    window = tail + chunk
+                    for match in _ARTICLE_TAG.finditer(window):
+                        if match.end() <= len(tail):
+                            continue
+                        if match.group(1):
+                            if depth == 0:
+                                continue
+                            depth -= 1
+                            if depth == 0:
+                                truncated = 'article_end'
+                                break
+                        else:
+                            depth += 1
+                    if truncated:
+                        break
+                    tail = window[-16:]
+        finally:
+            # 중간에 멈춘 연결은 풀에 돌려보내지 않고 닫힘
+            response.close()
+
+        body = b''.join(chunks)
+        response.timing['total'] = round(time.perf_counter() - start, 4)
+        info = {
+            'bytes_read': bytes_read,
+            'encoding': detect_charset(response.headers.get('Content-Type'), body[:CHARSET_SNIFF_BYTES]),
+            'truncated': truncated
+        }
+        return response, body, info
+
+    def fetch_page(self, url: str, headers: Optional[Dict[str, str]] = None,
+                   timeout: Optional[float] = None, max_bytes: int = 3 * 1024 * 1024,
+                   stop_at_article_end: bool = False) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        기사 페이지 다운로드 (실패 캐시 확인 → 응답 캐시 조건부 요청 → get_limited)
+
+        Returns:
+            (본문 바이트, 다운로드 정보)
+            다운로드 정보: get_limited 정보 + cache ('miss' / 'fresh' / 'revalidated'),
+            validators (ETag/Last-Modified), timing (캐시에서 바로 반환하면 None)
+
+        Raises:
+            FetchBackoffError: 최근 실패한 URL/호스트 (요청하지 않음)
+            requests.RequestException: 다운로드 실패 (실패 캐시에 기록됨)
+        """
+        if self.backoff is not None:
+            self.backoff.check(url)
+
+        cached = self.response_cache.lookup(url) if self.response_cache is not None else None
+        if cached is not None and self.response_cache.is_fresh(cached):
+            self.response_cache.count('fresh_hits')
+            self.response_cache.count('bytes_saved', len(cached['body']))
+            return cached['body'], self._cached_info(cached, 'fresh')
+
+        headers = dict(headers or {})
+        if cached is not None:
+            if cached['validators'].get('etag'):
+                headers['If-None-Match'] = cached['validators']['etag']
+            if cached['validators'].get('last_modified'):
+                headers['If-Modified-Since'] = cached['validators']['last_modified']
+
+        try:
+            response, body, info = self.get_limited(
+                url, headers=headers, timeout=timeout,
+                max_bytes=max_bytes, stop_at_article_end=stop_at_article_end
+            )
+        except requests.HTTPError as e:
+            if self.backoff is not None:
+                status = e.response.status_code if e.response is not None else None
+                retry_after = e.response.headers.get('Retry-After') if e.response is not None else None
+                self.backoff.record_failure(
+                    url, status, str(e),
+                    retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None
+                )
+            raise
+        except requests.RequestException as e:
+            if self.backoff is not None:
+                self.backoff.record_failure(url, None, str(e))
+            raise
+
+        if self.backoff is not None:
+            self.backoff.record_success(url)
+
+        if response.status_code == 304 and cached is not None:
+            self.response_cache.touch(url, cached)
+            self.response_cache.count('revalidated_hits')
+            self.response_cache.count('bytes_saved', len(cached['body']))
+            return cached['body'], {**self._cached_info(cached, 'revalidated'), 'timing': response.timing}
+
+        validators = {
+            key: value for key, value in (
+                ('etag', response.headers.get('ETag')),
+                ('last_modified', response.headers.get('Last-Modified'))
+            ) if value
+        }
+        if self.response_cache is not None:
+            self.response_cache.count('misses')
+            self.response_cache.store_response(url, body, info['encoding'], validators, info['truncated'])
+        return body, {**info, 'cache': 'miss', 'validators': validators, 'timing': response.timing}
+
+    @staticmethod
+    def _cached_info(cached: Dict[str, Any], cache: str) -> Dict[str, Any]:
+        return {
+            'bytes_read': 0,
+            'encoding': cached['encoding'],
+            'truncated': cached.get('truncated'),
+            'cache': cache,
+            'validators': cached['validators'],
+            'timing': None
+        }
+
+    def _record(self, host: str, total: float, connect: float, new_connections: int, error: bool = False) -> None:
+        with self._lock:
+            stats = self._host_stats.setdefault(host, {
+                'requests': 0,
+                'errors': 0,
+                'new_connections': 0,
+                'reused_connections': 0,
+                'connect_seconds': 0.0,
+                'total_seconds': 0.0
+            })
+            stats['requests'] += 1
+            stats['errors'] += int(error)
+            stats['new_connections'] += new_connections
+            stats['reused_connections'] += int(new_connections == 0 and not error)
+            stats['connect_seconds'] += connect
+            stats['total_seconds'] += total
+
+    def get_stats(self) -> Dict[str, Any]:
+        """호스트별 요청 수, 연결 재사용률, 평균 연결/전체 시간"""
+        with self._lock:
+            hosts = {}
+            for host, stats in self._host_stats.items():
+                requests_count = stats['requests']
+                hosts[host] = {
+                    'requests': requests_count,
+                    'errors': stats['errors'],
+                    'new_connections': stats['new_connections'],
+                    'reuse_rate': round(stats['reused_connections'] / requests_count, 4) if requests_count else 0.0,
+                    'avg_connect_ms': round(stats['connect_seconds'] / max(stats['new_connections'], 1) * 1000, 1),
+                    'avg_total_ms': round(stats['total_seconds'] / requests_count * 1000, 1) if requests_count else 0.0
+                }
+        return {
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'hosts': hosts,
+            'response_cache': self.response_cache.get_stats() if self.response_cache is not None else None,
+            'backoff': self.backoff.get_stats() if self.backoff is not None else None
+        }
+
+    def close(self) -> None:
+        self.session.close()
+
+
+# 싱글톤 인스턴스
+http_client_instance = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """공유 HTTP 클라이언트 인스턴스 가져오기"""
+    global http_client_instance
+    if http_client_instance is None:
+        with _http_client_lock:
+            if http_client_instance is None:
+                http_client_instance = HttpClient(
+                    pool_connections=int(os.getenv('HTTP_POOL_CONNECTIONS', 32)),
+                    pool_maxsize=int(os.getenv('HTTP_POOL_MAXSIZE', 10)),
+                    default_timeout=float(os.getenv('HTTP_DEFAULT_TIMEOUT', 30)),
+                    response_cache=get_response_cache(),
+                    backoff=get_fetch_backoff()
+                )
+    return http_client_instance
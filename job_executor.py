@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+백그라운드 작업 실행기
+
+/api/generate, /api/batch-generate 요청을 요청 스레드 밖에서 처리하기 위한
+제한된 크기의 워커 풀. 대기열이 가득 차면 즉시 거절하여
+gunicorn 워커가 장시간 묶이지 않도록 한다.
+"""
+
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFullError(Exception):
+    """실행 대기 중인 작업 수가 한도를 넘었을 때 발생"""
+    pass
+
+
+class JobExecutor:
+    """제한된 워커 풀 + 대기열 한도를 가진 작업 실행기"""
+
+    def __init__(self, max_workers=2, max_pending=20):
+        self.max_workers = max(1, int(max_workers))
+        self.max_pending = max(1, int(max_pending))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='nongbuxx-job'
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'rejected': 0}
+
+    def submit(self, job_id, fn, *args, **kwargs):
+        """작업 제출 (대기 + 실행 중 작업이 한도를 넘으면 JobQueueFullError)"""
+        with self._lock:
+            if self._pending + self._running >= self.max_pending:
+                self._stats['rejected'] += 1
+                raise JobQueueFullError(
+                    f"작업 대기열이 가득 찼습니다 ({self.max_pending}개). 잠시 후 다시 시도해주세요."
+                )
+            self._pending += 1
+            self._stats['submitted'] += 1
+
+        try:
+            return self._executor.submit(self._run, job_id, fn, *args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+    def _run(self, job_id, fn, *args, **kwargs):
+        with self._lock:
+            self._pending -= 1
+            self._running += 1
+
+        logger.info(f"🚀 백그라운드 작업 시작: {job_id}")
+        try:
+            result = fn(job_id, *args, **kwargs)
+            with self._lock:
+                self._stats['completed'] += 1
+            logger.info(f"✅ 백그라운드 작업 종료: {job_id}")
+            return result
+        except Exception as e:
+            with self._lock:
+                self._stats['failed'] += 1
+            logger.error(f"❌ 백그라운드 작업 오류 ({job_id}): {str(e)}")
+            raise
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                **self._stats,
+                'pending': self._pending,
+                'running': self._running,
+                'max_workers': self.max_workers,
+                'max_pending': self.max_pending
+            }
+
+
+_job_executor = None
+_job_executor_lock = threading.Lock()
+
+
+def get_job_executor():
+    """작업 실행기 싱글톤 반환"""
+    global _job_executor
+    if _job_executor is None:
+        with _job_executor_lock:
+            if _job_executor is None:
+                _job_executor = JobExecutor(
+                    max_workers=int(os.getenv('JOB_WORKERS', '2')),
+                    max_pending=int(os.getenv('JOB_MAX_PENDING', '20'))
+                )
+    return _job_executor
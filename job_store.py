@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+작업 상태 저장소
+- MemoryJobStore: 프로세스 내 저장소 (단일 워커/개발용)
+- SQLiteJobStore: 같은 호스트의 모든 gunicorn 워커가 공유하는 저장소
+
+생성된 본문(content)은 저장하지 않고 output_file 경로로 참조하며,
+조회 시점에 파일에서 다시 읽어 채운다. 완료된 작업은 보존 기간이 지나면
+백그라운드 정리 스레드가 삭제한다.
+"""
+
+import copy
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ('completed', 'failed')
+
+# 본문을 파일 참조로 대체한 결과 항목 표시
+CONTENT_REF_KEY = 'content_ref'
+
+
+def _dehydrate(value: Any) -> Any:
+    """output_file 이 있는 결과 항목에서 본문(content)을 제거하고 파일 참조만 남김"""
+    if isinstance(value, dict):
+        if 'content' in value and value.get('output_file'):
+            return {
+                **{k: _dehydrate(v) for k, v in value.items() if k != 'content'},
+                CONTENT_REF_KEY: 'output_file'
+            }
+        return {k: _dehydrate(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_dehydrate(v) for v in value]
+    return value
+
+
+def _hydrate(value: Any) -> Any:
+    """파일 참조로 저장된 결과 항목의 본문을 output_file 에서 다시 읽어 채움"""
+    if isinstance(value, dict):
+        hydrated = {k: _hydrate(v) for k, v in value.items() if k != CONTENT_REF_KEY}
+        if value.get(CONTENT_REF_KEY):
+            try:
+                with open(value['output_file'], 'r', encoding='utf-8') as f:
+                    hydrated['content'] = f.read()
+            except OSError as e:
+                logger.warning(f"⚠️ 작업 결과 파일을 읽을 수 없습니다: {value['output_file']} ({e})")
+                hydrated['content'] = ''
+        return hydrated
+    if isinstance(value, list):
+        return [_hydrate(v) for v in value]
+    return value
+
+
+class MemoryJobStore:
+    """프로세스 내 작업 저장소 (보존 기간 지난 작업은 정리 시 삭제)"""
+
+    def __init__(self, retention_seconds: float = 3600, max_age_seconds: float = 6 * 3600):
+        """
+        Args:
+            retention_seconds: 완료/실패 후 작업 보존 시간 (초)
+            max_age_seconds: 상태와 무관한 최대 보존 시간 (초, 중단된 작업 정리용)
+        """
+        self.retention_seconds = retention_seconds
+        self.max_age_seconds = max_age_seconds
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._times: Dict[str, list] = {}  # job_id -> [created_at, finished_at]
+        self._lock = threading.RLock()
+        self.stats: Dict[str, int] = {'created': 0, 'purged': 0}
+
+    def _is_expired(self, job_id: str, now: float) -> bool:
+        created_at, finished_at = self._times[job_id]
+        if finished_at is not None and now - finished_at >= self.retention_seconds:
+            return True
+        return now - created_at >= self.max_age_seconds
+
+    def _touch_finished(self, job_id: str):
+        """완료/실패로 바뀐 시각 기록 (이미 기록된 경우 유지)"""
+        times = self._times[job_id]
+        if self._jobs[job_id].get('status') not in FINISHED_STATUSES:
+            times[1] = None
+        elif times[1] is None:
+            times[1] = time.time()
+
+    def create(self, job_id: str, job: Dict[str, Any]):
+        """작업 등록"""
+        _ensure_compactor(self)
+        with self._lock:
+            self._jobs[job_id] = _dehydrate(job)
+            self._times[job_id] = [time.time(), None]
+            self._touch_finished(job_id)
+            self.stats['created'] += 1
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (본문은 파일에서 채운 복사본 반환)"""
+        with self._lock:
+            if job_id not in self._jobs or self._is_expired(job_id, time.time()):
+                return None
+            job = copy.deepcopy(self._jobs[job_id])
+        return _hydrate(job)
+
+    def update(self, job_id: str, **fields) -> bool:
+        """작업 필드 갱신"""
+        return self.mutate(job_id, lambda job: job.update(fields))
+
+    def mutate(self, job_id: str, fn: Callable[[Dict[str, Any]], None]) -> bool:
+        """작업 정보를 원자적으로 읽고-수정-저장 (fn이 job dict를 직접 수정)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            fn(job)
+            self._jobs[job_id] = _dehydrate(job)
+            self._touch_finished(job_id)
+            return True
+
+    def delete(self, job_id: str):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+            self._times.pop(job_id, None)
+
+    def purge_expired(self) -> int:
+        """보존 기간이 지난 작업 삭제"""
+        now = time.time()
+        with self._lock:
+            expired = [job_id for job_id in self._jobs if self._is_expired(job_id, now)]
+            for job_id in expired:
+                self.delete(job_id)
+            self.stats['purged'] += len(expired)
+        return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            by_status: Dict[str, int] = {}
+            for job in self._jobs.values():
+                by_status[job.get('status')] = by_status.get(job.get('status'), 0) + 1
+            return {
+                **self.stats,
+                'backend': 'memory',
+                'jobs': len(self._jobs),
+                'by_status': by_status,
+                'retention_seconds': self.retention_seconds
+            }
+
+
+class SQLiteJobStore:
+    """SQLite 기반 작업 저장소 (워커 간 공유, 재시작 후에도 유지)"""
+
+    def __init__(self, db_path: str, retention_seconds: float = 3600, max_age_seconds: float = 6 * 3600):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            retention_seconds: 완료/실패 후 작업 보존 시간 (초)
+            max_age_seconds: 상태와 무관한 최대 보존 시간 (초, 중단된 작업 정리용)
+        """
+        self.db_path = db_path
+        self.retention_seconds = retention_seconds
+        self.max_age_seconds = max_age_seconds
+        self._local = threading.local()
+        self.stats: Dict[str, int] = {'created': 0, 'purged': 0, 'errors': 0}
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                status TEXT,
+                created_at REAL NOT NULL,
+                finished_at REAL
+            )"""
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_finished ON jobs(finished_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드/프로세스별 연결 (fork 이후 연결 재사용 방지)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def _finished_at(job: Dict[str, Any]) -> Optional[float]:
+        return time.time() if job.get('status') in FINISHED_STATUSES else None
+
+    def create(self, job_id: str, job: Dict[str, Any]):
+        """작업 등록"""
+        _ensure_compactor(self)
+        job = _dehydrate(job)
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO jobs (job_id, data, status, created_at, finished_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, json.dumps(job, ensure_ascii=False, default=str), job.get('status'),
+                 time.time(), self._finished_at(job))
+            )
+            self.stats['created'] += 1
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 작업 저장 실패 ({job_id}): {e}")
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (본문은 파일에서 채운 복사본 반환)"""
+        now = time.time()
+        try:
+            row = self._connect().execute(
+                "SELECT data, created_at, finished_at FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 작업 조회 실패 ({job_id}): {e}")
+            return None
+
+        if row is None:
+            return None
+        data, created_at, finished_at = row
+        if now - created_at >= self.max_age_seconds:
+            return None
+        if finished_at is not None and now - finished_at >= self.retention_seconds:
+            return None
+        return _hydrate(json.loads(data))
+
+    def update(self, job_id: str, **fields) -> bool:
+        """작업 필드 갱신"""
+        return self.mutate(job_id, lambda job: job.update(fields))
+
+    def mutate(self, job_id: str, fn: Callable[[Dict[str, Any]], None]) -> bool:
+        """작업 정보를 원자적으로 읽고-수정-저장 (워커 간에도 쓰기 잠금으로 직렬화)"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+                if row is None:
+                    conn.execute("ROLLBACK")
+                    return False
+
+                job = json.loads(row[0])
+                fn(job)
+                job = _dehydrate(job)
+                conn.execute(
+                    """UPDATE jobs SET data = ?, status = ?,
+                       finished_at = CASE WHEN ? IS NULL THEN NULL ELSE COALESCE(finished_at, ?) END
+                       WHERE job_id = ?""",
+                    (json.dumps(job, ensure_ascii=False, default=str), job.get('status'),
+                     self._finished_at(job), self._finished_at(job), job_id)
+                )
+                conn.execute("COMMIT")
+                return True
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 작업 갱신 실패 ({job_id}): {e}")
+            return False
+
+    def delete(self, job_id: str):
+        try:
+            self._connect().execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 작업 삭제 실패 ({job_id}): {e}")
+
+    def purge_expired(self) -> int:
+        """보존 기간이 지난 작업 삭제"""
+        now = time.time()
+        try:
+            cursor = self._connect().execute(
+                "DELETE FROM jobs WHERE (finished_at IS NOT NULL AND finished_at <= ?) OR created_at <= ?",
+                (now - self.retention_seconds, now - self.max_age_seconds)
+            )
+            purged = cursor.rowcount or 0
+            self.stats['purged'] += purged
+            return purged
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 작업 정리 실패: {e}")
+            return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        by_status: Dict[str, int] = {}
+        try:
+            for status, count in self._connect().execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ):
+                by_status[status] = count
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 작업 통계 조회 실패: {e}")
+        return {
+            **self.stats,
+            'backend': 'sqlite',
+            'jobs': sum(by_status.values()),
+            'by_status': by_status,
+            'retention_seconds': self.retention_seconds,
+            'db_path': self.db_path
+        }
+
+
+# 싱글톤 인스턴스
+job_store_instance = None
+_job_store_lock = threading.Lock()
+_compactor_pid = None
+_compactor_lock = threading.Lock()
+
+
+def _compaction_loop(store, interval: float):
+    """완료된 작업을 주기적으로 정리하는 백그라운드 루프"""
+    while True:
+        time.sleep(interval)
+        try:
+            purged = store.purge_expired()
+            if purged:
+                logger.info(f"🧹 보존 기간이 지난 작업 {purged}개 정리 완료")
+        except Exception as e:
+            logger.warning(f"⚠️ 작업 정리 중 오류: {e}")
+
+
+def _ensure_compactor(store):
+    """정리 스레드를 프로세스당 하나만 시작 (gunicorn --preload 로 fork된 워커에서도 다시 시작)"""
+    global _compactor_pid
+    if _compactor_pid == os.getpid():
+        return
+    with _compactor_lock:
+        if _compactor_pid == os.getpid():
+            return
+        interval = float(os.getenv('JOB_COMPACTION_INTERVAL_SECONDS', 300))
+        threading.Thread(
+            target=_compaction_loop,
+            args=(store, interval),
+            name='job-store-compactor',
+            daemon=True
+        ).start()
+        _compactor_pid = os.getpid()
+
+
+def get_job_store():
+    """
+    작업 저장소 인스턴스 가져오기
+
+    JOB_STORE_BACKEND 환경변수로 백엔드 선택:
+    - sqlite (기본값): 워커 공유 SQLite 저장소
+    - memory: 프로세스 내 저장소
+    """
+    global job_store_instance
+    if job_store_instance is None:
+        with _job_store_lock:
+            if job_store_instance is None:
+                retention = float(os.getenv('JOB_RETENTION_SECONDS', 3600))  # 1시간
+                max_age = float(os.getenv('JOB_MAX_AGE_SECONDS', 6 * 3600))  # 6시간
+
+                backend = os.getenv('JOB_STORE_BACKEND', 'sqlite').lower()
+                if backend == 'sqlite':
+                    try:
+                        job_store_instance = SQLiteJobStore(
+                            db_path=os.getenv('JOB_DB_PATH', 'cache/jobs.db'),
+                            retention_seconds=retention,
+                            max_age_seconds=max_age
+                        )
+                        logger.info(f"💾 공유 작업 저장소 사용: {job_store_instance.db_path}")
+                    except sqlite3.Error as e:
+                        logger.warning(f"⚠️ 공유 작업 저장소 초기화 실패, 메모리 저장소 사용: {e}")
+                        job_store_instance = MemoryJobStore(retention, max_age)
+                else:
+                    job_store_instance = MemoryJobStore(retention, max_age)
+
+    # 정리 스레드는 첫 create() 에서 시작 (import 시점에 만들면 --preload 마스터에서 시작되어 fork됨)
+    return job_store_instance
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+LLM 호출 게이트웨이 (제공자/API 키별 동시 실행 수 + 분당 토큰 예산)
+
+NewsConverter.call_api 는 batch_generate 변환 스레드, 동시 요청, 블로그 조각 병렬 호출,
+XCrawler 코루틴에서 제한 없이 호출되어 한꺼번에 몰리면 제공자 요청 제한(429)에 걸리고
+폴백 또는 실패로 이어졌다. 모든 호출을 (제공자, API 키 해시) 단위 레인으로 통과시킨다.
+- 레인별 최대 동시 호출 수, 분당 토큰 예산 (요청 전 예상 토큰 예약, 응답 후 실제 사용량으로 정산)
+- 초과 요청은 도착 순서대로 대기 (먼저 온 요청을 뒤에 온 요청이 추월하지 않음)
+- 대기열 길이, 대기 시간, 사용 토큰을 통계로 제공 (/api/cache-stats)
+
+동기 코드는 slot()/call(), asyncio 코드는 acall() 을 사용한다 (이벤트 루프를 막지 않도록 스레드에서 호출).
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 토큰 수 추정용 (한국어/영어 혼합 기준 대략 3자당 1토큰)
+CHARS_PER_TOKEN = 3
+
+
+class LLMQueueTimeout(RuntimeError):
+    """게이트웨이 대기 시간 초과"""
+
+
+def estimate_tokens(prompt: str, max_tokens: int = 0) -> int:
+    """요청 예상 토큰 (프롬프트 추정치 + 최대 출력 토큰)"""
+    return len(prompt or '') // CHARS_PER_TOKEN + 1 + max_tokens
+
+
+def response_usage(response: Any) -> Optional[int]:
+    """SDK 응답의 실제 사용 토큰 (Anthropic usage.input/output_tokens, OpenAI usage.total_tokens)"""
+    usage = getattr(response, 'usage', None)
+    if usage is None and isinstance(response, dict):
+        usage = response.get('usage')
+    if usage is None:
+        return None
+    if isinstance(usage, dict):
+        total = usage.get('total_tokens')
+        if total is None and 'input_tokens' in usage:
+            total = usage.get('input_tokens', 0) + usage.get('output_tokens', 0)
+        return total
+    total = getattr(usage, 'total_tokens', None)
+    if total is None and hasattr(usage, 'input_tokens'):
+        total = (usage.input_tokens or 0) + (getattr(usage, 'output_tokens', 0) or 0)
+    return total
+
+
+class Ticket:
+    """대여한 호출 슬롯 (used_tokens 를 설정하면 반납 시 예약 토큰과 차이를 정산)"""
+
+    def __init__(self, reserved: int, waited: float):
+        self.reserved = reserved
+        self.waited = waited
+        self.used_tokens: Optional[int] = None
+
+
+class _Lane:
+    """(제공자, API 키) 단위 동시 실행 제한 + 토큰 버킷 + FIFO 대기열"""
+
+    def __init__(self, max_concurrency: int, tokens_per_minute: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = tokens_per_minute
+        self.tokens = float(tokens_per_minute)
+        self.refilled_at = time.monotonic()
+        self.in_flight = 0
+        self.waiters: Deque[object] = deque()
+        self.condition = threading.Condition()
+        self.stats: Dict[str, Any] = {
+            'calls': 0,
+            'errors': 0,
+            'timeouts': 0,
+            'queued': 0,
+            'max_queue_depth': 0,
+            'wait_seconds': 0.0,
+            'max_wait_seconds': 0.0,
+            'tokens_reserved': 0,
+            'tokens_used': 0
+        }
+
+    def _refill(self) -> None:
+        if not self.tokens_per_minute:
+            return
+        now = time.monotonic()
+        self.tokens = min(
+            float(self.tokens_per_minute),
+            self.tokens + (now - self.refilled_at) * self.tokens_per_minute / 60
+        )
+        self.refilled_at = now
+
+    def _token_wait(self, needed: int) -> float:
+        """needed 토큰을 쓸 수 있을 때까지 남은 시간 (초, 0이면 바로 사용 가능)"""
+        if not self.tokens_per_minute:
+            return 0.0
+        self._refill()
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) * 60 / self.tokens_per_minute
+
+    def acquire(self, tokens: int, timeout: float) -> Ticket:
+        # 예산보다 큰 요청은 예산 전체를 예약 (영원히 대기하지 않도록)
+        needed = min(tokens, self.tokens_per_minute) if self.tokens_per_minute else tokens
+        start = time.monotonic()
+        deadline = start + timeout
+        marker = object()
+        with self.condition:
+            self.waiters.append(marker)
+            queued = len(self.waiters) > 1 or self.in_flight >= self.max_concurrency
+            if queued:
+                self.stats['queued'] += 1
+                self.stats['max_queue_depth'] = max(self.stats['max_queue_depth'], len(self.waiters))
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if self.waiters[0] is marker and self.in_flight < self.max_concurrency:
+                        token_wait = self._token_wait(needed)
+                        if token_wait == 0:
+                            break
+                        wait = min(token_wait, remaining)
+                    else:
+                        wait = remaining
+                    if remaining <= 0:
+                        self.stats['timeouts'] += 1
+                        raise LLMQueueTimeout(f"LLM 호출 대기 시간 초과 ({timeout:g}초)")
+                    self.condition.wait(wait)
+            except BaseException:
+                self.waiters.remove(marker)
+                self.condition.notify_all()
+                raise
+
+            self.waiters.popleft()
+            self.in_flight += 1
+            if self.tokens_per_minute:
+                self.tokens -= needed
+            waited = time.monotonic() - start
+            self.stats['calls'] += 1
+            self.stats['tokens_reserved'] += needed
+            self.stats['wait_seconds'] += waited
+            self.stats['max_wait_seconds'] = max(self.stats['max_wait_seconds'], waited)
+            # 다음 대기자가 남은 슬롯을 확인하도록
+            self.condition.notify_all()
+        return Ticket(needed, waited)
+
+    def release(self, ticket: Ticket, failed: bool) -> None:
+        with self.condition:
+            self.in_flight -= 1
+            if failed:
+                self.stats['errors'] += 1
+            used = ticket.used_tokens if ticket.used_tokens is not None else ticket.reserved
+            self.stats['tokens_used'] += used
+            if self.tokens_per_minute:
+                # 예약보다 적게 쓰면 돌려주고, 많이 쓰면 예산에서 추가로 차감
+                self.tokens = min(float(self.tokens_per_minute), self.tokens + ticket.reserved - used)
+            self.condition.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.condition:
+            self._refill()
+            stats = dict(self.stats)
+            stats.update({
+                'in_flight': self.in_flight,
+                'queue_depth': len(self.waiters),
+                'max_concurrency': self.max_concurrency,
+                'tokens_per_minute': self.tokens_per_minute,
+                'tokens_available': round(self.tokens) if self.tokens_per_minute else None
+            })
+        stats['avg_wait_seconds'] = round(stats['wait_seconds'] / stats['calls'], 3) if stats['calls'] else 0.0
+        stats['wait_seconds'] = round(stats['wait_seconds'], 3)
+        stats['max_wait_seconds'] = round(stats['max_wait_seconds'], 3)
+        return stats
+
+
+class LLMGateway:
+    """제공자/API 키별 LLM 호출 제한 게이트웨이"""
+
+    def __init__(self, max_concurrency: int = 8, tokens_per_minute: int = 0, queue_timeout: float = 300,
+                 provider_limits: Optional[Dict[str, Tuple[int, int]]] = None):
+        """
+        Args:
+            max_concurrency: 레인(제공자 + API 키)별 최대 동시 호출 수
+            tokens_per_minute: 레인별 분당 토큰 예산 (0이면 제한 없음)
+            queue_timeout: 대기 최대 시간 (초, 초과 시 LLMQueueTimeout)
+            provider_limits: 제공자별 (max_concurrency, tokens_per_minute) 재정의
+        """
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self.queue_timeout = queue_timeout
+        self.provider_limits = provider_limits or {}
+        self._lanes: Dict[Tuple[str, str], _Lane] = {}
+        self._lock = threading.Lock()
+
+    def _lane(self, provider: str, api_key: Optional[str]) -> _Lane:
+        # API 키 원문 대신 해시로 구분
+        key = (provider, hashlib.sha256((api_key or '').encode('utf-8')).hexdigest()[:12])
+        lane = self._lanes.get(key)
+        if lane is None:
+            with self._lock:
+                lane = self._lanes.get(key)
+                if lane is None:
+                    concurrency, tpm = self.provider_limits.get(provider, (self.max_concurrency, self.tokens_per_minute))
+                    lane = self._lanes[key] = _Lane(concurrency, tpm)
+        return lane
+
+    @contextmanager
+    def slot(self, provider: str, api_key: Optional[str], tokens: int = 0,
+             timeout: Optional[float] = None) -> Iterator[Ticket]:
+        """
+        호출 슬롯 대여 (with 블록 안에서 제공자 API 호출)
+
+        Args:
+            provider: 'anthropic' / 'openai' / 'perplexity'
+            api_key: 호출에 쓰는 API 키 (레인 구분용, 해시로만 보관)
+            tokens: 예상 토큰 (estimate_tokens)
+            timeout: 대기 최대 시간 (없으면 queue_timeout)
+        """
+        lane = self._lane(provider, api_key)
+        ticket = lane.acquire(tokens, self.queue_timeout if timeout is None else timeout)
+        if ticket.waited >= 1:
+            logger.info(f"⏳ LLM 호출 대기 {ticket.waited:.1f}초 ({provider})")
+        failed = True
+        try:
+            yield ticket
+            failed = False
+        finally:
+            lane.release(ticket, failed)
+
+    def call(self, provider: str, api_key: Optional[str], fn: Callable[[], Any], tokens: int = 0) -> Any:
+        """슬롯을 빌려 fn() 실행 (응답에 usage 가 있으면 실제 토큰으로 정산)"""
+        with self.slot(provider, api_key, tokens) as ticket:
+            response = fn()
+            ticket.used_tokens = response_usage(response)
+            return response
+
+    async def acall(self, provider: str, api_key: Optional[str], fn: Callable[[], Any], tokens: int = 0) -> Any:
+        """call() 의 코루틴 버전 (대기와 동기 SDK 호출을 스레드에서 실행해 이벤트 루프를 막지 않음)"""
+        return await asyncio.to_thread(self.call, provider, api_key, fn, tokens)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """레인별 통계 및 전체 대기열 길이"""
+        with self._lock:
+            lanes = dict(self._lanes)
+        lane_stats = {f"{provider}:{key_hash}": lane.get_stats() for (provider, key_hash), lane in lanes.items()}
+        return {
+            'queue_depth': sum(stats['queue_depth'] for stats in lane_stats.values()),
+            'in_flight': sum(stats['in_flight'] for stats in lane_stats.values()),
+            'queue_timeout': self.queue_timeout,
+            'lanes': lane_stats
+        }
+
+
+# 싱글톤 인스턴스
+llm_gateway_instance = None
+_llm_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """
+    LLM 게이트웨이 인스턴스 가져오기
+
+    LLM_MAX_CONCURRENCY / LLM_TOKENS_PER_MINUTE 가 기본값이고,
+    LLM_MAX_CONCURRENCY_ANTHROPIC, LLM_TOKENS_PER_MINUTE_OPENAI 처럼 제공자별로 재정의할 수 있다.
+    """
+    global llm_gateway_instance
+    if llm_gateway_instance is None:
+        with _llm_gateway_lock:
+            if llm_gateway_instance is None:
+                concurrency = int(os.getenv('LLM_MAX_CONCURRENCY', 8))
+                tpm = int(os.getenv('LLM_TOKENS_PER_MINUTE', 0))
+                provider_limits = {
+                    provider: (
+                        int(os.getenv(f'LLM_MAX_CONCURRENCY_{provider.upper()}', concurrency)),
+                        int(os.getenv(f'LLM_TOKENS_PER_MINUTE_{provider.upper()}', tpm))
+                    )
+                    for provider in ('anthropic', 'openai', 'perplexity')
+                }
+                llm_gateway_instance = LLMGateway(
+                    max_concurrency=concurrency,
+                    tokens_per_minute=tpm,
+                    queue_timeout=float(os.getenv('LLM_QUEUE_TIMEOUT', 300)),
+                    provider_limits=provider_limits
+                )
+    return llm_gateway_instance
@@ -4,7 +4,6 @@
 기존 시스템에 영향을 주지 않는 독립적인 파서
 """
 
-import requests
 from bs4 import BeautifulSoup
 import time
 import random
@@ -14,6 +13,8 @@ from fake_useragent import UserAgent
 import re
 from urllib.parse import urljoin, urlparse
 
+from http_client import get_http_client
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -24,17 +25,17 @@ class NaverNewsExtractor:
         self.base_url = base_url
         self.search_keywords = search_keywords
         self.max_news = max_news
-        self.session = requests.Session()
+        self.http = get_http_client()  # 프로세스 공유 연결 풀 (keep-alive 재사용)
         self.ua = UserAgent()
         
-        # 네이버 뉴스 최적화 헤더
-        self.session.headers.update({
+        # 네이버 뉴스 최적화 헤더 (공유 세션은 변경하지 않고 요청마다 전달)
+        self.default_headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
             'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
-        })
+        }
         
         # 타임아웃 설정
         self.timeout = 15
@@ -422,7 +423,7 @@ class NaverNewsExtractor:
                 'Referer': 'https://news.naver.com/',
             }
             
-            response = self.session.get(self.base_url, headers=headers, timeout=self.timeout)
+            response = self.http.get(self.base_url, headers={**self.default_headers, **headers}, timeout=self.timeout)
             response.raise_for_status()
             
             print(f"[NAVER] 요청 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}")
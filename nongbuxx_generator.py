@@ -1,19 +1,23 @@
 #!/usr/bin/env python3
 
 import os
+import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import threading
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable
 
 # Import our existing modules
 from web_extractor import WebExtractor
 from converter import NewsConverter
 from blog_content_generator import BlogContentGenerator
+from content_cache import get_extraction_cache, get_generation_dedup_index
+from browser_pool import needs_js_rendering
+from fetch_cache import get_fetch_backoff
+from fetch_pipeline import BatchPipeline
 
 class NongbuxxGenerator:
     def __init__(self, api_provider='anthropic', api_key=None, save_intermediate=True):
@@ -34,11 +38,21 @@ class NongbuxxGenerator:
         self.converter: Optional[NewsConverter] = None
         self.blog_generator: Optional[BlogContentGenerator] = None
         
+        # 콘텐츠 타입과 무관한 기사 추출 결과 캐시 (프로세스 공유)
+        self.extraction_cache = get_extraction_cache()
+        # 본문 지문 기반 생성 결과 색인 (URL이 달라도 같은 기사면 생성 결과 재사용)
+        self.dedup_index = get_generation_dedup_index()
+        
+        # 진행 상황 콜백: callback(event, url, **info)
+        # event: 'start' | 'progress' | 'complete', info의 stage로 단계 전달
+        self.progress_callback: Optional[Callable[..., None]] = None
+        
         # 초기화 상태 추적
         self._initialization_errors: List[str] = []
         self._is_properly_initialized = False
         
-        # 병렬처리 모니터링을 위한 변수들
+        # 병렬처리 모니터링을 위한 변수들 (여러 스레드에서 갱신하므로 잠금 사용)
+        self._activity_lock = threading.Lock()
         self.parallel_stats: Dict[str, Any] = {
             'active_threads': set(),
             'completed_tasks': 0,
@@ -49,13 +63,11 @@ class NongbuxxGenerator:
         
         try:
             # 출력 디렉토리 설정
+            # (중간 추출 결과는 기사 아카이브 cache/article_archive.db 에 저장)
             self.generated_dir = Path('generated_content')
-            self.extracted_dir = Path('extracted_articles')
             
             # 디렉토리 생성
             self.generated_dir.mkdir(exist_ok=True)
-            if save_intermediate:
-                self.extracted_dir.mkdir(exist_ok=True)
             
             # 🛡️ 안전한 모듈 초기화 (각각 개별적으로 검증)
             self._initialize_components()
@@ -75,28 +87,43 @@ class NongbuxxGenerator:
         thread_id = threading.current_thread().ident
         timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
         
+        # 배치 파이프라인에서는 수집/변환 스레드가 다르므로 작업(URL) 단위로 기록
         if action == 'start':
-            self.parallel_stats['active_threads'].add(thread_id)
-            self.parallel_stats['thread_timings'][thread_id] = {
-                'start_time': time.time(),
-                'url': url
-            }
+            with self._activity_lock:
+                self.parallel_stats['active_threads'].add(thread_id)
+                self.parallel_stats['thread_timings'][url] = {
+                    'start_time': time.time(),
+                    'thread_id': thread_id
+                }
             print(f"🔄 [{timestamp}] 스레드-{thread_id} 시작: {url[:50]}...")
         elif action == 'complete':
-            if thread_id in self.parallel_stats['active_threads']:
-                self.parallel_stats['active_threads'].remove(thread_id)
-            if thread_id in self.parallel_stats['thread_timings']:
-                elapsed = time.time() - self.parallel_stats['thread_timings'][thread_id]['start_time']
+            with self._activity_lock:
+                timing = self.parallel_stats['thread_timings'].pop(url, None)
+                self.parallel_stats['active_threads'] = {
+                    info['thread_id'] for info in self.parallel_stats['thread_timings'].values()
+                }
                 success = kwargs.get('success', False)
+                if timing is not None:
+                    self.parallel_stats['completed_tasks' if success else 'failed_tasks'] += 1
+            if timing is not None:
+                elapsed = time.time() - timing['start_time']
                 if success:
-                    self.parallel_stats['completed_tasks'] += 1
                     print(f"✅ [{timestamp}] 스레드-{thread_id} 완료: {elapsed:.2f}초 - {url[:50]}...")
                 else:
-                    self.parallel_stats['failed_tasks'] += 1
                     print(f"❌ [{timestamp}] 스레드-{thread_id} 실패: {elapsed:.2f}초 - {url[:50]}...")
-                del self.parallel_stats['thread_timings'][thread_id]
         elif action == 'progress':
             print(f"📊 [{timestamp}] 스레드-{thread_id}: {kwargs.get('message', '')} - {url[:50]}...")
+        
+        self._notify_progress(action, url, **kwargs)
+    
+    def _notify_progress(self, event, url, **info):
+        """등록된 진행 상황 콜백 호출 (콜백 오류는 생성 작업에 영향 없음)"""
+        if self.progress_callback is None:
+            return
+        try:
+            self.progress_callback(event, url, **info)
+        except Exception as e:
+            print(f"⚠️ 진행 상황 콜백 오류: {str(e)}")
             
     def get_parallel_stats(self):
         """현재 병렬처리 통계 반환"""
@@ -105,7 +132,10 @@ class NongbuxxGenerator:
             'active_thread_ids': list(self.parallel_stats['active_threads']),
             'completed_tasks': self.parallel_stats['completed_tasks'],
             'failed_tasks': self.parallel_stats['failed_tasks'],
-            'total_elapsed': time.time() - self.parallel_stats['start_time'] if self.parallel_stats['start_time'] else 0
+            'total_elapsed': time.time() - self.parallel_stats['start_time'] if self.parallel_stats['start_time'] else 0,
+            'pipeline': dict(self.parallel_stats.get('pipeline', {})),
+            # 호스트별 수집 통계 (동시 한도, 요청 속도, 차단 횟수, 평균 응답 시간)
+            'hosts': dict(self.parallel_stats.get('pipeline', {}).get('hosts', {}))
         }
     
     def _initialize_components(self):
@@ -141,7 +171,12 @@ class NongbuxxGenerator:
         
         # BlogContentGenerator 초기화
         try:
-            self.blog_generator = BlogContentGenerator(api_provider=self.api_provider, api_key=self.api_key)
+            # NewsConverter(SDK 클라이언트)를 공유하여 중복 초기화 방지
+            self.blog_generator = BlogContentGenerator(
+                api_provider=self.api_provider,
+                api_key=self.api_key,
+                converter=self.converter
+            )
             if self.blog_generator is None:
                 raise ValueError("BlogContentGenerator 초기화 결과가 None입니다")
             print("✅ BlogContentGenerator 초기화 성공")
@@ -284,6 +319,56 @@ class NongbuxxGenerator:
         except:
             return 'article'
     
+    def _extract_with_cache(self, url):
+        """추출 캐시를 먼저 확인하고 없을 때만 웹 추출 (콘텐츠 타입 간 재사용)"""
+        cached = self.extraction_cache.lookup(url, self.extractor.revalidate)
+        if cached is not None:
+            print("⚡ 추출 캐시 히트 (다운로드/파싱 생략)")
+            return cached
+        
+        extracted_content = self.extractor.extract_data(url)
+        self.extraction_cache.store(url, extracted_content)
+        return extracted_content
+    
+    @staticmethod
+    def _dedup_variant(content_type, selected_formats=None, wordpress_type='text'):
+        """생성 결과를 좌우하는 옵션 (본문 지문과 함께 색인 키로 사용)"""
+        if content_type == 'enhanced_blog':
+            formats = ','.join(sorted(selected_formats)) if selected_formats else 'all'
+            return f"{content_type}:{formats}:{wordpress_type}"
+        return content_type
+    
+    def _reuse_deduplicated(self, fingerprint, variant, url, content_type):
+        """같은 본문으로 이미 생성된 결과가 있으면 해당 파일을 가리키는 결과 반환"""
+        entry = self.dedup_index.lookup(fingerprint, variant)
+        if entry is None:
+            return None
+        
+        print(f"♻️ 동일 기사 생성 결과 재사용 (AI 변환 생략): {entry.get('url')}")
+        result = {
+            'success': True,
+            'output_file': Path(entry['output_file']),
+            'title': entry.get('title') or '제목 없음',
+            'content_type': content_type,
+            'url': url,
+            'timestamp': datetime.now().isoformat(),
+            'deduplicated_from': entry.get('url')
+        }
+        if entry.get('saved_files'):
+            result['saved_files'] = entry['saved_files']
+        return result
+    
+    @staticmethod
+    def _copy_reused_output(reused, output_file):
+        """재사용한 결과 파일을 사용자 지정 파일명으로 복사 (실패하면 None 을 반환해 새로 생성)"""
+        try:
+            shutil.copyfile(reused['output_file'], output_file)
+        except OSError as e:
+            print(f"⚠️ 재사용 결과 복사 실패, 새로 생성합니다: {e}")
+            return None
+        reused['output_file'] = output_file
+        return reused
+    
     def generate_content(self, url, custom_filename=None, content_type='standard', selected_formats=None, wordpress_type='text'):
         """
         URL에서 콘텐츠를 추출하고 마크다운으로 변환 (최적화된 버전)
@@ -312,12 +397,13 @@ class NongbuxxGenerator:
         
         # Step 1: 웹에서 콘텐츠 추출
         print("📄 웹 콘텐츠 추출 중...")
+        self._notify_progress('progress', url, stage='extracting')
         start_time = time.time()
         
         # 웹 추출 (None 체크로 린터 오류 해결)
         if self.extractor is None:
             return {'success': False, 'error': 'Extractor not initialized', 'url': url}
-        extracted_content = self.extractor.extract_data(url)
+        extracted_content = self._extract_with_cache(url)
         
         if not extracted_content.get('success', False):
             return {
@@ -331,27 +417,37 @@ class NongbuxxGenerator:
         
         # Step 2: AI 변환
         print("🤖 AI 변환 중...")
+        self._notify_progress('progress', url, stage='converting')
         conversion_start = time.time()
         
         # 🚨 Zacks/Automated Insights 관련 메시지 제거
         extracted_content = self._remove_zacks_automated_insights(extracted_content)
         
+        # ♻️ 다른 URL로 이미 생성한 같은 기사인지 본문 지문으로 확인
+        fingerprint = self.dedup_index.fingerprint(extracted_content)
+        dedup_variant = self._dedup_variant(content_type, selected_formats, wordpress_type)
+        reused = self._reuse_deduplicated(fingerprint, dedup_variant, url, content_type)
+        if reused is not None and custom_filename and content_type != 'enhanced_blog':
+            # 사용자 지정 파일명은 다른 요청의 파일 경로 대신 그 이름으로 받아야 한다
+            reused = self._copy_reused_output(reused, self.generated_dir / f"{custom_filename}_{content_type}.md")
+        if reused is not None:
+            reused['processing_time'] = time.time() - start_time
+            return reused
+        
         # 콘텐츠 타입에 따른 변환
         if content_type == 'enhanced_blog':
             # 새로운 완성형 블로그 콘텐츠 생성 (None 체크로 린터 오류 해결)
             if self.blog_generator is None:
                 return {'success': False, 'error': 'Blog generator not initialized', 'url': url}
-            rich_content = self.blog_generator.generate_rich_text_blog_content(extracted_content, wordpress_type)
+            # 저장할 형식을 먼저 정하고 그 형식에 필요한 조각만 생성
+            formats = self.blog_generator.resolve_formats(extracted_content, selected_formats, wordpress_type)
+            rich_content = self.blog_generator.generate_rich_text_blog_content(extracted_content, wordpress_type, formats)
             
-            # rich_content가 딕셔너리인지 확인하고 markdown 키가 있는지 확인
-            if isinstance(rich_content, dict) and 'markdown' in rich_content:
-                converted_content = rich_content['markdown']
-            elif isinstance(rich_content, str):
-                converted_content = rich_content
-            else:
+            # rich_content가 딕셔너리인지 확인
+            if not isinstance(rich_content, dict):
                 return {
                     'success': False,
-                    'error': f'Invalid blog content format: expected dict with markdown key or string, got {type(rich_content)}',
+                    'error': f'Invalid blog content format: expected dict, got {type(rich_content)}',
                     'url': url
                 }
             
@@ -361,8 +457,8 @@ class NongbuxxGenerator:
             filename_prefix = f"{domain}_{timestamp}_enhanced_blog"
             
             # 선택된 형식만 저장 (extracted_content 전달하여 출처별 최적화)
-            saved_files = self.blog_generator.save_blog_content(rich_content, filename_prefix, selected_formats, extracted_content, wordpress_type)
-            print(f"✅ 완성형 블로그 콘텐츠 생성 완료 (선택된 형식: {selected_formats or 'all'})")
+            saved_files = self.blog_generator.save_blog_content(rich_content, filename_prefix, formats, extracted_content, wordpress_type)
+            print(f"✅ 완성형 블로그 콘텐츠 생성 완료 (형식: {formats})")
             
             # 생성된 파일 정보 반환에 추가
             # 메인 파일 경로 결정
@@ -379,7 +475,7 @@ class NongbuxxGenerator:
                     'url': url
                 }
             
-            return {
+            result = {
                 'success': True,
                 'output_file': Path(main_file),  # 메인 파일 경로
                 'saved_files': saved_files,  # 생성된 모든 파일 정보
@@ -389,6 +485,8 @@ class NongbuxxGenerator:
                 'timestamp': datetime.now().isoformat(),
                 'processing_time': time.time() - start_time
             }
+            self.dedup_index.store(fingerprint, dedup_variant, result)
+            return result
             
         elif content_type == 'blog':
             if self.converter is None:
@@ -429,6 +527,7 @@ class NongbuxxGenerator:
         print(f"✅ AI 변환 완료 ({conversion_time:.2f}초)")
         
         # Step 3: 파일명 생성 및 저장 (일반 콘텐츠만 해당)
+        self._notify_progress('progress', url, stage='saving')
         if custom_filename:
             filename = f"{custom_filename}_{content_type}.md"
         else:
@@ -448,7 +547,7 @@ class NongbuxxGenerator:
             # 제목 추출 (마크다운 첫 번째 줄에서)
             title = extracted_content.get('title', '제목 없음')
             
-            return {
+            result = {
                 'success': True,
                 'output_file': output_file,
                 'title': title,
@@ -457,6 +556,8 @@ class NongbuxxGenerator:
                 'timestamp': datetime.now().isoformat(),
                 'processing_time': total_time
             }
+            self.dedup_index.store(fingerprint, dedup_variant, result)
+            return result
             
         except Exception as e:
             return {
@@ -465,7 +566,7 @@ class NongbuxxGenerator:
                 'url': url
             }
     
-    def batch_generate(self, urls, content_type='standard', selected_formats=None, max_workers=8, wordpress_type='text'):
+    def batch_generate(self, urls, content_type='standard', selected_formats=None, max_workers=8, wordpress_type='text', on_result=None):
         """
         다중 URL에서 콘텐츠를 병렬로 생성 (성능 최적화)
         
@@ -475,6 +576,7 @@ class NongbuxxGenerator:
             selected_formats: 선택된 파일 형식 목록 (완성형 블로그 전용)
             max_workers: 최대 병렬 처리 수 (기본값: 8 - 성능 최적화)
             wordpress_type: 워드프레스 형식 ('text' 또는 'html')
+            on_result: URL별 결과가 나올 때마다 호출되는 콜백 on_result(index, result)
             
         Returns:
             list: 각 URL의 결과 목록
@@ -488,50 +590,16 @@ class NongbuxxGenerator:
         print(f"⚡ 최대 병렬 처리 수: {max_workers}")
         print(f"🎯 실제 병렬처리 확인: 각 스레드의 시작/완료 시간을 실시간으로 표시합니다")
         
-        # 병렬처리 통계 초기화
-        self.parallel_stats = {
-            'active_threads': set(),
-            'completed_tasks': 0,
-            'failed_tasks': 0,
-            'start_time': time.time(),
-            'thread_timings': {}
-        }
-        
         start_time = time.time()
         
-        # 🔧 순서 보장을 위한 개선된 병렬 처리
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # URL에 인덱스를 추가하여 순서 보장
-            indexed_urls = [(i, url) for i, url in enumerate(urls)]
-            
-            # 각 URL에 대한 future 생성 (인덱스와 함께)
-            future_to_index_url = {
-                executor.submit(self._generate_with_index, index, url, content_type, selected_formats, wordpress_type): (index, url)
-                for index, url in indexed_urls
-            }
-            
-            # 결과를 인덱스 순서대로 정렬하기 위한 딕셔너리
-            indexed_results = {}
-            
-            # 결과 수집
-            for future in as_completed(future_to_index_url):
-                index, url = future_to_index_url[future]
-                try:
-                    result = future.result()
-                    indexed_results[index] = result
-                    
-                    if result['success']:
-                        print(f"✅ 성공: {url}")
-                    else:
-                        print(f"❌ 실패: {url} - {result.get('error', 'Unknown error')}")
-                        
-                except Exception as e:
-                    print(f"❌ 예외 발생: {url} - {str(e)}")
-                    indexed_results[index] = {
-                        'success': False,
-                        'error': str(e),
-                        'url': url
-                    }
+        # 결과를 인덱스 순서대로 정렬하기 위한 딕셔너리
+        indexed_results = {}
+        
+        # 결과 수집 (완료되는 순서대로)
+        for index, result in self.iter_batch_generate(urls, content_type, selected_formats, max_workers, wordpress_type):
+            indexed_results[index] = result
+            if on_result is not None:
+                on_result(index, result)
         
         # 🔧 인덱스 순서대로 결과 정렬
         results = [indexed_results[i] for i in sorted(indexed_results.keys())]
@@ -548,6 +616,7 @@ class NongbuxxGenerator:
         print(f"   • 성공: {success_count}/{len(urls)}")
         print(f"   • 실패: {final_stats['failed_tasks']}")
         print(f"   • 총 소요 시간: {total_time:.2f}초")
+        print(f"   • 기사 수집 소요 시간: {final_stats['pipeline'].get('fetch_seconds', 0):.2f}초")
         print(f"   • 평균 시간: {total_time/len(urls):.2f}초/URL")
         print(f"   • 병렬 효율성: {parallel_efficiency:.1f}% (최대 {max_workers}개 동시 처리)")
         print(f"   • 완료된 스레드: {final_stats['completed_tasks'] + final_stats['failed_tasks']}개")
@@ -558,26 +627,77 @@ class NongbuxxGenerator:
         
         return results
     
-    def _generate_with_index(self, index, url, content_type='standard', selected_formats=None, wordpress_type='text'):
+    def iter_batch_generate(self, urls, content_type='standard', selected_formats=None, max_workers=8, wordpress_type='text'):
         """
-        인덱스가 포함된 콘텐츠 생성 (파일명 중복 방지)
+        다중 URL을 병렬로 생성하면서 완료되는 순서대로 결과를 반환하는 제너레이터
+        
+        Yields:
+            tuple: (원래 URL 인덱스, 결과 딕셔너리)
+        
+        제너레이터가 중간에 닫히면(스트리밍 클라이언트 연결 종료 등)
+        아직 시작하지 않은 작업은 취소된다.
+        """
+        # 병렬처리 통계 초기화
+        self.parallel_stats = {
+            'active_threads': set(),
+            'completed_tasks': 0,
+            'failed_tasks': 0,
+            'start_time': time.time(),
+            'thread_timings': {}
+        }
+        
+        # 수집은 호스트별 제한 하에 전체 URL 동시 진행, 변환은 max_workers 개씩
+        pipeline = BatchPipeline(
+            fetch_fn=self._extract_for_batch,
+            convert_fn=lambda index, url, extracted_content: self._generate_with_index(
+                index, url, content_type, selected_formats, wordpress_type, extracted_content=extracted_content
+            ),
+            fetch_concurrency=int(os.getenv('BATCH_FETCH_CONCURRENCY', 32)),
+            per_host_limit=int(os.getenv('BATCH_FETCH_PER_HOST', 8)),
+            per_host_max=int(os.getenv('BATCH_FETCH_PER_HOST_MAX', os.getenv('HTTP_POOL_MAXSIZE', 10))),
+            per_host_rate=float(os.getenv('BATCH_FETCH_HOST_RATE', 10)),
+            convert_workers=max_workers,
+            precheck_fn=self._precheck_for_batch
+        )
+        self.parallel_stats['pipeline'] = pipeline.stats
+        
+        results = pipeline.run(urls)
+        try:
+            for index, result in results:
+                if result['success']:
+                    print(f"✅ 성공: {result.get('url')}")
+                else:
+                    print(f"❌ 실패: {result.get('url')} - {result.get('error', 'Unknown error')}")
+                
+                yield index, result
+        finally:
+            results.close()
+    
+    def _precheck_for_batch(self, url):
+        """
+        배치 수집 사전 확인: 실패 캐시(백오프) 중인 URL은 호스트 슬롯을 잡지 않고 바로 처리
+        
+        추출 캐시에 있으면 그 결과를, 없으면 요청 없이 실패 결과(backed_off)를 반환한다.
+        백오프 중이 아니거나 브라우저 렌더링 대상(실패 캐시를 쓰지 않음)이면 None (일반 수집 진행).
+        """
+        if self.extractor is None or self.extractor.use_selenium or needs_js_rendering(url):
+            return None
+        if not get_fetch_backoff().is_blocked(url):
+            return None
+        return self._extract_for_batch(url)
+    
+    def _extract_for_batch(self, url):
+        """
+        배치 수집 단계: URL 검증 + 웹 추출
         
-        Args:
-            index: URL 순서 인덱스
-            url: 추출할 뉴스 기사 URL
-            content_type: 콘텐츠 타입
-            selected_formats: 선택된 파일 형식 목록
-            wordpress_type: 워드프레스 형식 ('text' 또는 'html')
-            
         Returns:
-            dict: 결과 정보
+            dict: 추출 결과 (실패 시 success=False 인 오류 결과, 완료 로깅까지 처리됨)
         """
         # 🎯 병렬처리 시작 로깅
         self._log_thread_activity('start', url)
         
         try:
             print(f"\n🔗 URL 분석 중: {url}")
-            print(f"📝 콘텐츠 타입: {content_type}")
             
             # URL 유효성 검사
             if not self.validate_url(url):
@@ -587,9 +707,9 @@ class NongbuxxGenerator:
                     'error': 'Invalid URL format',
                     'url': url
                 }
-        
+            
             # Step 1: 웹에서 콘텐츠 추출
-            self._log_thread_activity('progress', url, message="웹 콘텐츠 추출 시작")
+            self._log_thread_activity('progress', url, message="웹 콘텐츠 추출 시작", stage='extracting')
             print("📄 웹 콘텐츠 추출 중...")
             extraction_start = time.time()
             
@@ -597,35 +717,84 @@ class NongbuxxGenerator:
             if self.extractor is None:
                 self._log_thread_activity('complete', url, success=False)
                 return {'success': False, 'error': 'Extractor not initialized', 'url': url}
-            extracted_content = self.extractor.extract_data(url)
+            extracted_content = self._extract_with_cache(url)
             
             if not extracted_content.get('success', False):
                 self._log_thread_activity('complete', url, success=False)
                 return {
                     'success': False,
                     'error': f'Content extraction failed: {extracted_content.get("error", "Unknown error")}',
-                    'url': url
+                    'url': url,
+                    'http_status': extracted_content.get('http_status'),
+                    'backed_off': extracted_content.get('backed_off', False)
                 }
             
             extraction_time = time.time() - extraction_start
             self._log_thread_activity('progress', url, message=f"웹 추출 완료 ({extraction_time:.2f}초)")
             print(f"✅ 웹 추출 완료 ({extraction_time:.2f}초)")
+            return extracted_content
             
-                        # Step 2: AI 변환
-            self._log_thread_activity('progress', url, message="AI 변환 시작")
+        except Exception as e:
+            self._log_thread_activity('complete', url, success=False)
+            return {
+                'success': False,
+                'error': f"Unexpected error during content extraction: {str(e)}",
+                'url': url
+            }
+    
+    def _generate_with_index(self, index, url, content_type='standard', selected_formats=None, wordpress_type='text', extracted_content=None):
+        """
+        인덱스가 포함된 콘텐츠 생성 (파일명 중복 방지)
+        
+        Args:
+            index: URL 순서 인덱스
+            url: 추출할 뉴스 기사 URL
+            content_type: 콘텐츠 타입
+            selected_formats: 선택된 파일 형식 목록
+            wordpress_type: 워드프레스 형식 ('text' 또는 'html')
+            extracted_content: 배치 수집 단계에서 이미 추출한 결과 (없으면 여기서 추출)
+            
+        Returns:
+            dict: 결과 정보
+        """
+        extraction_start = time.time()
+        if extracted_content is None:
+            extracted_content = self._extract_for_batch(url)
+        if not extracted_content.get('success', False):
+            # 수집 단계에서 실패 처리 및 완료 로깅됨
+            return extracted_content
+        
+        try:
+            print(f"📝 콘텐츠 타입: {content_type} ({url})")
+            
+            # Step 2: AI 변환
+            self._log_thread_activity('progress', url, message="AI 변환 시작", stage='converting')
             print("🤖 AI 변환 중...")
             conversion_start = time.time()
             
             # 🚨 Zacks/Automated Insights 관련 메시지 제거
             extracted_content = self._remove_zacks_automated_insights(extracted_content)
             
+            # ♻️ 다른 URL로 이미 생성한 같은 기사인지 본문 지문으로 확인
+            fingerprint = self.dedup_index.fingerprint(extracted_content)
+            dedup_variant = self._dedup_variant(content_type, selected_formats, wordpress_type)
+            reused = self._reuse_deduplicated(fingerprint, dedup_variant, url, content_type)
+            if reused is not None:
+                if content_type == 'enhanced_blog':
+                    reused['all_files'] = reused.pop('saved_files', {})
+                    reused['selected_formats'] = selected_formats
+                self._log_thread_activity('complete', url, success=True)
+                return reused
+            
             # 완성형 블로그인 경우
             if content_type == 'enhanced_blog':
                 self._log_thread_activity('progress', url, message="완성형 블로그 생성 시작")
                 if self.blog_generator is None:
                     self._log_thread_activity('complete', url, success=False)
                     return {'success': False, 'error': 'Blog generator not initialized', 'url': url}
-                blog_result = self.blog_generator.generate_rich_text_blog_content(extracted_content, wordpress_type)
+                # 저장할 형식을 먼저 정하고 그 형식에 필요한 조각만 생성
+                formats = self.blog_generator.resolve_formats(extracted_content, selected_formats, wordpress_type)
+                blog_result = self.blog_generator.generate_rich_text_blog_content(extracted_content, wordpress_type, formats)
                 
                 if blog_result and isinstance(blog_result, dict):
                     # 🔧 고유한 파일명 생성 (마이크로초 + 인덱스 포함)
@@ -638,7 +807,7 @@ class NongbuxxGenerator:
                     saved_files = self.blog_generator.save_blog_content(
                         blog_result, 
                         filename_prefix, 
-                        selected_formats,
+                        formats,
                         extracted_content,
                         wordpress_type
                     )
@@ -668,6 +837,7 @@ class NongbuxxGenerator:
                         'content_type': content_type,
                         'selected_formats': selected_formats
                     }
+                    self.dedup_index.store(fingerprint, dedup_variant, {**result, 'saved_files': saved_files})
                     self._log_thread_activity('complete', url, success=True)
                     return result
                 else:
@@ -809,6 +979,7 @@ class NongbuxxGenerator:
                         'timestamp': datetime.now().isoformat(),
                         'content_type': content_type
                     }
+                    self.dedup_index.store(fingerprint, dedup_variant, result)
                     self._log_thread_activity('complete', url, success=True)
                     return result
                 else:
@@ -829,6 +1000,17 @@ class NongbuxxGenerator:
                 'url': url
             }
     
+    def reset_run_state(self):
+        """요청별 실행 상태 초기화 (생성기 풀에 반납 시 호출)"""
+        self.progress_callback = None
+        self.parallel_stats = {
+            'active_threads': set(),
+            'completed_tasks': 0,
+            'failed_tasks': 0,
+            'start_time': None,
+            'thread_timings': {}
+        }
+    
     def cleanup(self):
         """리소스 정리"""
         if self.extractor is not None and hasattr(self.extractor, 'cleanup'):
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+동일 요청 병합 (single-flight)
+
+같은 캐시 키로 생성 작업이 진행 중이면 뒤이어 들어온 요청은 새로 생성하지 않고
+진행 중인 작업의 결과를 기다린다.
+- 같은 워커 안: 진행 중 작업의 Future를 함께 대기
+- 워커 간: 공유 SQLite 파일의 lease 테이블로 한 워커만 생성하고,
+  나머지 워커는 공유 캐시에 결과가 저장될 때까지 폴링
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from content_cache import get_content_cache
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """키 단위 요청 병합기"""
+
+    def __init__(self, db_path: Optional[str] = None, lease_seconds: float = 600, poll_interval: float = 1.0):
+        """
+        Args:
+            db_path: 워커 간 lease 저장용 SQLite 파일 (None이면 워커 내 병합만 수행)
+            lease_seconds: 워커 간 lease 유효 시간 (생성 최대 소요 시간 이상으로 설정)
+            poll_interval: 다른 워커의 결과를 기다릴 때 공유 캐시 조회 간격 (초)
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self.stats: Dict[str, int] = {
+            'leaders': 0,
+            'coalesced_waiters': 0,
+            'remote_waiters': 0,
+            'remote_hits': 0,
+            'takeovers': 0,
+            'retried_waiters': 0,
+            'errors': 0
+        }
+
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._connect().execute(
+                """CREATE TABLE IF NOT EXISTS flight_leases (
+                    key TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )"""
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드/프로세스별 연결 (fork 이후 연결 재사용 방지)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _acquire_lease(self, key: str, owner: str) -> bool:
+        """워커 간 lease 획득 (없거나 만료된 경우에만 성공)"""
+        if not self.db_path:
+            return True
+        now = time.time()
+        try:
+            cursor = self._connect().execute(
+                """INSERT INTO flight_leases (key, owner, expires_at) VALUES (?, ?, ?)
+                   ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+                   WHERE flight_leases.expires_at <= ?""",
+                (key, owner, now + self.lease_seconds, now)
+            )
+            return cursor.rowcount == 1
+        except sqlite3.Error as e:
+            # lease 저장소 오류 시 병합 없이 직접 생성
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 요청 병합 lease 획득 실패: {e}")
+            return True
+
+    def _lease_active(self, key: str) -> bool:
+        try:
+            row = self._connect().execute(
+                "SELECT expires_at FROM flight_leases WHERE key = ?", (key,)
+            ).fetchone()
+            return row is not None and row[0] > time.time()
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 요청 병합 lease 조회 실패: {e}")
+            return False
+
+    def _release_lease(self, key: str, owner: str):
+        if not self.db_path:
+            return
+        try:
+            self._connect().execute(
+                "DELETE FROM flight_leases WHERE key = ? AND owner = ?", (key, owner)
+            )
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ 요청 병합 lease 해제 실패: {e}")
+
+    def do(self, key: str, fn: Callable[[], Any],
+           lookup: Optional[Callable[[], Any]] = None,
+           on_wait: Optional[Callable[[], None]] = None,
+           is_shareable: Optional[Callable[[Any], bool]] = None) -> Tuple[Any, bool]:
+        """
+        키 단위로 병합하여 fn 실행
+
+        Args:
+            key: 병합 키 (생성 캐시 키)
+            fn: 실제 생성 함수 (대표 요청에서만 실행)
+            lookup: 공유 저장소에서 결과를 찾는 함수 (다른 워커 결과 확인용, 없으면 None 반환)
+            on_wait: 다른 요청의 결과를 기다리기 시작할 때 호출
+            is_shareable: 대표 요청 결과를 대기 중인 요청에 넘길지 판단 (없으면 항상 공유)
+                          공유하지 않는 결과(실패 등)나 예외이면 대기 요청은 자신의 fn 으로 다시 시도한다
+                          (남은 대기 요청 중 하나가 새 대표가 되므로 요청마다 최대 한 번 실행)
+
+        Returns:
+            tuple: (결과, 다른 요청의 결과를 공유받았는지 여부)
+        """
+        while True:
+            with self._lock:
+                future = self._inflight.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = Future()
+                    self._inflight[key] = future
+                else:
+                    self.stats['coalesced_waiters'] += 1
+
+            if is_leader:
+                break
+
+            logger.info(f"🔗 진행 중인 동일 요청 결과 대기: {key}")
+            if on_wait:
+                on_wait()
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.info(f"🔁 대표 요청 실패, 직접 다시 시도: {key} ({e})")
+            else:
+                if is_shareable is None or is_shareable(result):
+                    return result, True
+                logger.info(f"🔁 대표 요청 결과를 공유하지 않음, 직접 다시 시도: {key}")
+            with self._lock:
+                self.stats['retried_waiters'] += 1
+
+        try:
+            result, shared = self._lead(key, fn, lookup, on_wait)
+            future.set_result(result)
+            return result, shared
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _lead(self, key, fn, lookup, on_wait):
+        """워커 내 대표 요청: 워커 간 lease를 확인한 뒤 직접 생성하거나 다른 워커 결과 대기"""
+        owner = f"{os.getpid()}:{uuid.uuid4().hex}"
+        waiting_remote = False
+
+        while not self._acquire_lease(key, owner):
+            # 다른 워커가 생성 중 - 공유 캐시에 결과가 저장될 때까지 대기
+            if not waiting_remote:
+                waiting_remote = True
+                self.stats['remote_waiters'] += 1
+                logger.info(f"🔗 다른 워커의 동일 요청 결과 대기: {key}")
+                if on_wait:
+                    on_wait()
+            time.sleep(self.poll_interval)
+
+            result = lookup() if lookup else None
+            if result is not None:
+                self.stats['remote_hits'] += 1
+                return result, True
+            if not self._lease_active(key):
+                # 다른 워커가 결과 없이 종료(실패/중단) - 직접 생성 시도
+                self.stats['takeovers'] += 1
+
+        try:
+            # lease 획득 직전에 다른 워커가 완료했을 수 있으므로 한 번 더 확인
+            result = lookup() if lookup else None
+            if result is not None:
+                self.stats['remote_hits'] += 1
+                return result, True
+
+            self.stats['leaders'] += 1
+            return fn(), False
+        finally:
+            self._release_lease(key, owner)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight = len(self._inflight)
+        return {
+            **self.stats,
+            'in_flight': in_flight,
+            'cross_worker': bool(self.db_path)
+        }
+
+
+# 싱글톤 인스턴스
+generation_flight_instance = None
+_generation_flight_lock = threading.Lock()
+
+
+def get_generation_flight() -> SingleFlight:
+    """
+    생성 요청 병합기 인스턴스 가져오기
+
+    생성 캐시가 공유 SQLite 저장소를 사용하면 같은 파일로 워커 간 병합도 수행한다.
+    """
+    global generation_flight_instance
+    if generation_flight_instance is None:
+        with _generation_flight_lock:
+            if generation_flight_instance is None:
+                l2 = getattr(get_content_cache(), 'l2', None)
+                db_path = getattr(l2, 'db_path', None)
+                try:
+                    generation_flight_instance = SingleFlight(
+                        db_path=db_path,
+                        lease_seconds=float(os.getenv('SINGLE_FLIGHT_LEASE_SECONDS', 600)),
+                        poll_interval=float(os.getenv('SINGLE_FLIGHT_POLL_SECONDS', 1.0))
+                    )
+                except sqlite3.Error as e:
+                    logger.warning(f"⚠️ 워커 간 요청 병합 초기화 실패, 워커 내 병합만 사용: {e}")
+                    generation_flight_instance = SingleFlight()
+    return generation_flight_instance
@@ -1,4 +1,3 @@
-import requests
 from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
@@ -10,6 +9,8 @@ import re
 from urllib.parse import urljoin, urlparse
 import hashlib
 
+from http_client import get_http_client
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -21,17 +22,17 @@ class OptimizedNewsExtractor:
         self.base_url = base_url
         self.search_keywords = search_keywords
         self.max_news = max_news
-        self.session = requests.Session()
+        self.http = get_http_client()  # 프로세스 공유 연결 풀 (keep-alive 재사용)
         self.ua = UserAgent()
         
-        # 성능 최적화를 위한 설정
-        self.session.headers.update({
+        # 성능 최적화를 위한 설정 (공유 세션은 변경하지 않고 요청마다 전달)
+        self.default_headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
-        })
+        }
         
         # 요청 타임아웃 설정 (성능 최적화) - 빠른 응답을 위한 단축
         self.timeout = 12
@@ -648,7 +649,7 @@ class OptimizedNewsExtractor:
                 'Connection': 'keep-alive',
             }
             
-            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            response = self.http.get(url, headers={**self.default_headers, **headers}, timeout=self.timeout)
             response.raise_for_status()
             
             print(f"[OPTIMIZED] 요청 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}")
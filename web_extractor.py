@@ -1,13 +1,4 @@
-import requests
 from bs4 import BeautifulSoup, Tag
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 from fake_useragent import UserAgent
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union, cast
@@ -16,19 +7,35 @@ import time
 import os
 import re # Added for regex operations
 
+from fetch_cache import FetchBackoffError
+from http_client import get_http_client
+from browser_pool import BrowserPool, get_browser_pool, needs_js_rendering
+from article_archive import get_article_archive
+from article_parser import (
+    DOMAIN_TO_PUBLISHER, GENERIC_SITE, ParsedArticle, SiteProfile,
+    extract_paragraphs, extract_paragraphs_from_html, get_site_profile, strip_title_suffix
+)
+
 class WebExtractor:
     def __init__(self, use_selenium: bool = False, save_to_file: bool = True):
         """
         웹 콘텐츠 추출기 초기화
         
         Args:
-            use_selenium: Selenium 사용 여부
-            save_to_file: 결과를 파일로 저장할지 여부
+            use_selenium: 모든 URL을 헤드리스 브라우저로 렌더링할지 여부
+                (False 여도 data/sources.json 에서 render_js 가 켜진 출처는 브라우저로 렌더링)
+            save_to_file: 결과를 기사 아카이브에 저장할지 여부
         """
         self.use_selenium = use_selenium
         self.save_to_file = save_to_file
-        self.driver: Optional[webdriver.Chrome] = None
-        self.session = requests.Session()
+        self.browser_pool: Optional[BrowserPool] = None  # JS 렌더링이 처음 필요할 때 연결
+        self.http = get_http_client()  # 프로세스 공유 연결 풀 (keep-alive 재사용)
+        # 파싱 엔진: lxml (기본, 단일 순회 추출 계획) 또는 html.parser (기존 BeautifulSoup 경로)
+        self.parser_engine = os.getenv('ARTICLE_PARSER', 'lxml').lower()
+        # 스트리밍 다운로드 상한: 최대 바이트 수, 최상위 <article> 종료 시 중단 여부
+        # (첫 <article> 이 본문 앞의 티저/관련 기사 카드인 페이지에서는 본문을 받지 못하므로 기본 비활성)
+        self.max_html_bytes = int(os.getenv('HTML_MAX_BYTES', 3 * 1024 * 1024))
+        self.stop_at_article_end = os.getenv('HTML_STOP_AT_ARTICLE_END', 'False').lower() == 'true'
         self.ua = UserAgent()
         self.setup_logging()
         
@@ -134,15 +141,9 @@ class WebExtractor:
         self.logger = logging.getLogger(__name__)
     
     def setup_selenium(self) -> None:
-        """Selenium 웹드라이버 설정"""
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument(f'user-agent={self.ua.random}')
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        """공유 헤드리스 브라우저 풀 연결 (브라우저는 풀에서 처음 대여할 때 실행)"""
+        if self.browser_pool is None:
+            self.browser_pool = get_browser_pool(user_agent=self.ua.random)
     
     def extract_data(self, url: str) -> Dict[str, Any]:
         """
@@ -157,7 +158,7 @@ class WebExtractor:
         try:
             self.logger.info(f"페이지 로딩 중: {url}")
             
-            if self.use_selenium:
+            if self.use_selenium or needs_js_rendering(url):
                 data = self._extract_with_selenium(url)
             else:
                 data = self._extract_with_requests(url)
@@ -167,65 +168,175 @@ class WebExtractor:
             
             return data
             
-        except TimeoutException:
-            self.logger.error("페이지 로딩 시간 초과")
-            return self._error_response(url, "페이지 로딩 시간 초과")
-        except WebDriverException as e:
-            self.logger.error(f"웹드라이버 오류: {str(e)}")
-            return self._error_response(url, f"웹드라이버 오류: {str(e)}")
         except Exception as e:
             self.logger.error(f"데이터 추출 중 오류 발생: {str(e)}")
             
             # 403 Forbidden 에러에 대한 사용자 친화적 메시지 제공
             error_str = str(e)
             if '403' in error_str and 'Forbidden' in error_str:
-                return self._error_response(url, "이 사이트는 자동 콘텐츠 수집을 차단하고 있습니다. 다른 뉴스 사이트를 이용해 주세요.")
+                error = self._error_response(url, "이 사이트는 자동 콘텐츠 수집을 차단하고 있습니다. 다른 뉴스 사이트를 이용해 주세요.")
             elif '404' in error_str:
-                return self._error_response(url, "페이지를 찾을 수 없습니다. URL을 확인해 주세요.")
+                error = self._error_response(url, "페이지를 찾을 수 없습니다. URL을 확인해 주세요.")
             elif '500' in error_str:
-                return self._error_response(url, "웹사이트 서버에 일시적인 문제가 발생했습니다. 잠시 후 다시 시도해 주세요.")
+                error = self._error_response(url, "웹사이트 서버에 일시적인 문제가 발생했습니다. 잠시 후 다시 시도해 주세요.")
             elif 'timeout' in error_str.lower():
-                return self._error_response(url, "페이지 로딩 시간이 초과되었습니다. 다시 시도해 주세요.")
+                error = self._error_response(url, "페이지 로딩 시간이 초과되었습니다. 다시 시도해 주세요.")
             elif 'connection' in error_str.lower():
-                return self._error_response(url, "네트워크 연결에 문제가 있습니다. 인터넷 연결을 확인해 주세요.")
+                error = self._error_response(url, "네트워크 연결에 문제가 있습니다. 인터넷 연결을 확인해 주세요.")
             else:
-                return self._error_response(url, error_str)
+                error = self._error_response(url, error_str)
+            
+            # 실패 캐시로 요청하지 않은 경우는 HTTP 상태 코드 대신 표시만 남김
+            # (저장된 403/429 를 새 차단 응답으로 보고 배치 수집 속도를 줄이지 않도록)
+            if isinstance(e, FetchBackoffError):
+                error['backed_off'] = True
+                return error
+            
+            # 배치 수집 스케줄러가 차단/요청 제한을 판단할 수 있도록 HTTP 상태 코드 포함
+            status = getattr(getattr(e, 'response', None), 'status_code', None) or getattr(e, 'status', None)
+            if status:
+                error['http_status'] = status
+            return error
     
     def _extract_with_requests(self, url: str) -> Dict[str, Any]:
-        """requests를 사용한 데이터 추출"""
+        """requests를 사용한 데이터 추출 (본문 스트리밍, 크기 상한, 응답/실패 캐시 적용)"""
         headers = {'User-Agent': self.ua.random}
-        response = requests.get(url, headers=headers, timeout=60)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        return self._parse_content(soup, url)
+        body, download = self.http.fetch_page(
+            url, headers=headers, timeout=60,
+            max_bytes=self.max_html_bytes, stop_at_article_end=self.stop_at_article_end
+        )
+        timing = download.pop('timing')
+        validators = download.pop('validators')
+        if download['cache'] == 'fresh':
+            self.logger.info(f"⚡ 응답 캐시 사용: {len(body) / 1024:.1f}KB")
+        else:
+            self.logger.info(
+                f"🌐 다운로드 완료{' (304, 응답 캐시 사용)' if download['cache'] == 'revalidated' else ''}: "
+                f"{download['bytes_read'] / 1024:.1f}KB ({download['encoding']}"
+                f"{', ' + download['truncated'] + ' 에서 중단' if download['truncated'] else ''}), "
+                f"연결 {timing['connect']:.3f}초"
+                f"{' (재사용)' if timing['reused_connection'] else ''}, "
+                f"응답 대기 {timing['ttfb']:.3f}초, 전체 {timing['total']:.3f}초"
+            )
+        
+        # 응답 본문은 한 번만 디코딩 (lxml 경로는 바이트와 인코딩을 그대로 전달)
+        data = self._parse_html(body, url, encoding=download['encoding'])
+        
+        # 추출 캐시 재검증용 응답 검증자 (ETag/Last-Modified)
+        data['http_validators'] = validators
+        data['fetch_timing'] = timing
+        data['download'] = download
+        return data
     
-    def _extract_with_selenium(self, url: str) -> Dict[str, Any]:
-        """Selenium을 사용한 데이터 추출"""
-        if self.driver is None:
-            raise RuntimeError("Selenium driver not initialized")
+    def revalidate(self, url: str, validators: Dict[str, str]) -> bool:
+        """
+        조건부 요청으로 페이지 변경 여부 확인
+        
+        응답 캐시를 거쳐 요청하므로, 변경된 경우 받은 본문은 응답 캐시에 남아
+        이어지는 extract_data 는 다시 다운로드하지 않는다.
+        
+        Args:
+            url: 확인할 웹 페이지 URL
+            validators: 이전 응답의 검증자 ('etag', 'last_modified')
             
-        self.driver.get(url)
-        WebDriverWait(self.driver, 20).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        Returns:
+            변경되지 않았으면 True (304 또는 같은 검증자의 캐시 응답)
+        """
+        _, download = self.http.fetch_page(
+            url, headers={'User-Agent': self.ua.random}, timeout=15,
+            max_bytes=self.max_html_bytes, stop_at_article_end=self.stop_at_article_end
         )
+        return download['cache'] != 'miss' and download['validators'] == validators
+    
+    def _extract_with_selenium(self, url: str) -> Dict[str, Any]:
+        """브라우저 풀을 사용한 데이터 추출 (기사 본문 요소가 나타나면 로딩 중단)"""
+        from selenium.common.exceptions import WebDriverException
         
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        return self._parse_content(soup, url)
+        self.setup_selenium()
+        try:
+            html = self.browser_pool.render(url, wait_selectors=get_site_profile(url).article_selectors)
+        except TimeoutError as e:
+            self.logger.error(f"브라우저 대기 시간 초과: {str(e)}")
+            return self._error_response(url, "페이지 로딩 시간 초과")
+        except WebDriverException as e:
+            self.logger.error(f"웹드라이버 오류: {str(e)}")
+            return self._error_response(url, f"웹드라이버 오류: {str(e)}")
+        
+        data = self._parse_html(html, url)
+        data['rendered_js'] = True
+        return data
+    
+    def _parse_html(self, html: Union[str, bytes], url: str, encoding: Optional[str] = None) -> Dict[str, Any]:
+        """
+        설정된 파싱 엔진으로 HTML 파싱 (사이트 전략은 URL 호스트로 한 번 결정)
+        
+        html 이 바이트이면 encoding 으로 해석한다 (미지정 시 UTF-8).
+        """
+        site = get_site_profile(url)
+        if self.parser_engine == 'html.parser':
+            if isinstance(html, bytes):
+                html = html.decode(encoding or 'utf-8', errors='replace')
+            return self._parse_content(BeautifulSoup(html, 'html.parser'), url, site)
+        return self._parse_content_lxml(html, url, site, encoding)
+    
+    def _parse_content_lxml(self, html: Union[str, bytes], url: str, site: SiteProfile = GENERIC_SITE,
+                            encoding: Optional[str] = None) -> Dict[str, Any]:
+        """HTML 콘텐츠 파싱 (lxml 트리 1회 생성 + 선택자 1회 순회)"""
+        page = ParsedArticle(html, url, site, encoding)
+        article = page.find_article()
+        if article is None:
+            return self._error_response(url, "기사 본문을 찾을 수 없습니다")
+        
+        # 🚨 홍보성 콘텐츠 필터링 적용
+        title = page.title()
+        if self._is_promotional_content(title):
+            return self._error_response(url, "홍보성 콘텐츠로 판단되어 제외되었습니다")
+        
+        paragraphs = extract_paragraphs(article)
+        content = self._clean_content({
+            'text': '\n\n'.join(paragraphs),
+            'paragraphs': paragraphs
+        })
+        
+        return {
+            'success': True,
+            'url': url,
+            'timestamp': datetime.now().isoformat(),
+            'title': title,
+            'metadata': page.metadata(),
+            'content': content,
+            'author': page.author(),
+            'publish_date': page.publish_date(),
+            'publisher': page.publisher()
+        }
     
-    def _parse_content(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
-        """HTML 콘텐츠 파싱"""
-        article = self._find_article(soup)
+    def _parse_content(self, soup: BeautifulSoup, url: str, site: SiteProfile = GENERIC_SITE) -> Dict[str, Any]:
+        """HTML 콘텐츠 파싱 (BeautifulSoup html.parser 경로)"""
+        article = self._find_article(soup, site)
         if not article:
             return self._error_response(url, "기사 본문을 찾을 수 없습니다")
         
         # 🚨 홍보성 콘텐츠 필터링 적용
-        title = self._get_title(soup)
+        title = self._get_title(soup, site)
         if self._is_promotional_content(title):
             return self._error_response(url, "홍보성 콘텐츠로 판단되어 제외되었습니다")
         
-        # 🚨 Zacks/Automated Insights 관련 메시지 제거
-        content = self._get_content(article)
+        content = self._clean_content(self._get_content(article))
+        
+        return {
+            'success': True,
+            'url': url,
+            'timestamp': datetime.now().isoformat(),
+            'title': title,
+            'metadata': self._get_metadata(soup),
+            'content': content,
+            'author': self._get_author(soup),
+            'publish_date': self._get_publish_date(soup),
+            'publisher': self._get_publisher(soup, url, site)
+        }
+    
+    def _clean_content(self, content: Any) -> Any:
+        """🚨 Zacks/Automated Insights 관련 메시지 제거"""
         # content가 딕셔너리인 경우 text 필드 추출
         if isinstance(content, dict):
             content_text = content.get('text', '')
@@ -238,18 +349,7 @@ class WebExtractor:
         else:
             # 문자열인 경우 그대로 처리
             content = self._remove_zacks_automated_insights(content)
-        
-        return {
-            'success': True,
-            'url': url,
-            'timestamp': datetime.now().isoformat(),
-            'title': title,
-            'metadata': self._get_metadata(soup),
-            'content': content,
-            'author': self._get_author(soup),
-            'publish_date': self._get_publish_date(soup),
-            'publisher': self._get_publisher(soup, url)
-        }
+        return content
     
     def _is_promotional_content(self, title: str) -> bool:
         """홍보성 콘텐츠인지 판단"""
@@ -318,21 +418,10 @@ class WebExtractor:
         
         return cleaned_content
     
-    def _find_article(self, soup: BeautifulSoup) -> Optional[Tag]:
+    def _find_article(self, soup: BeautifulSoup, site: SiteProfile = GENERIC_SITE) -> Optional[Tag]:
         """기사 본문 요소 찾기"""
-        # Try different selectors for article content
-        selectors = [
-            'article',
-            '.article',
-            '.articlePage',
-            '.story-body',
-            '.content',
-            '.post-content',
-            '[class*="article"]',
-            '[class*="content"]'
-        ]
-        
-        for selector in selectors:
+        # Try different selectors for article content (사이트 전략 우선)
+        for selector in site.article_selectors:
             element = soup.select_one(selector)
             if element and isinstance(element, Tag):
                 return element
@@ -344,42 +433,20 @@ class WebExtractor:
             
         return None
     
-    def _get_title(self, soup: BeautifulSoup) -> str:
+    def _get_title(self, soup: BeautifulSoup, site: SiteProfile = GENERIC_SITE) -> str:
         """제목 추출"""
         
-        # Yahoo Finance 특수 처리 (먼저 시도)
-        if 'finance.yahoo.com' in str(soup):
-            yahoo_selectors = [
-                '.cover-title',  # Yahoo Finance 실제 기사 제목
-                'title',         # Page title (정확함)
-            ]
-            
-            for selector in yahoo_selectors:
-                title = soup.select_one(selector)
-                if title and isinstance(title, Tag):
-                    text = title.get_text().strip()
-                    # Yahoo Finance 사이트 이름 제거
-                    if ' - Yahoo Finance' in text:
-                        text = text.replace(' - Yahoo Finance', '')
-                    elif ' | Yahoo Finance' in text:
-                        text = text.replace(' | Yahoo Finance', '')
-                    # 유효한 제목인지 확인
-                    if text and 10 <= len(text) <= 200:
-                        return text.strip()
-        
-        # 일반적인 제목 선택자들
-        title_selectors = [
-            'h1',
-            '#title_area h2',  # 네이버 뉴스
-            '.media_end_head_headline h2',  # 네이버 뉴스
-            '#articleTitle',  # 구 네이버 뉴스 
-            '.headline',
-            '.title',
-            '[class*="title"]',
-            '[class*="headline"]',
-        ]
+        # 사이트 제목 (Yahoo Finance 등, 먼저 시도)
+        for selector in site.lead_title_selectors:
+            title = soup.select_one(selector)
+            if title and isinstance(title, Tag):
+                text = strip_title_suffix(title.get_text().strip(), site)
+                # 유효한 제목인지 확인
+                if text and 10 <= len(text) <= 200:
+                    return text.strip()
         
-        for selector in title_selectors:
+        # 일반적인 제목 선택자들 (사이트 전략 우선)
+        for selector in site.title_selectors:
             title = soup.select_one(selector)
             if title and isinstance(title, Tag):
                 text = title.get_text().strip()
@@ -422,28 +489,8 @@ class WebExtractor:
         return metadata
     
     def _get_content(self, article: Tag) -> Dict[str, Any]:
-        """본문 내용 추출"""
-        paragraphs = []
-        
-        # Find all text content elements
-        content_elements = article.find_all(['p', 'h2', 'h3', 'h4', 'blockquote', 'div'])
-        
-        for element in content_elements:
-            if not isinstance(element, Tag):
-                continue
-                
-            text = element.get_text().strip()
-            
-            # Skip promotional content
-            skip_keywords = [
-                'recommended', 'related', 'subscribe', 'follow', 'download',
-                'sign up', 'newsletter', 'advertisement', 'sponsored'
-            ]
-            
-            if (text and 
-                len(text) > 10 and 
-                not any(keyword in text.lower() for keyword in skip_keywords)):
-                paragraphs.append(text)
+        """본문 내용 추출 (블록 단위 단일 순회, 텍스트 노드당 한 번)"""
+        paragraphs = extract_paragraphs_from_html(str(article))
         
         return {
             'text': '\n\n'.join(paragraphs),
@@ -504,7 +551,7 @@ class WebExtractor:
         
         return ''
     
-    def _get_publisher(self, soup: BeautifulSoup, url: str) -> str:
+    def _get_publisher(self, soup: BeautifulSoup, url: str, site: SiteProfile = GENERIC_SITE) -> str:
         """출처/발행사 정보 추출"""
         # 1. Meta 태그에서 publisher 정보 찾기
         publisher_meta = (
@@ -517,24 +564,16 @@ class WebExtractor:
             if isinstance(content, str) and content:
                 return content.strip()
         
-        # 2. 도메인별 하드코딩된 출처 매핑
-        domain_to_publisher = {
-            'bloomberg.com': 'Bloomberg',
-            'wsj.com': 'WSJ',
-            'reuters.com': 'Reuters',
-            'ft.com': 'Financial Times',
-            'cnbc.com': 'CNBC',
-            'finance.yahoo.com': 'Yahoo Finance',
-            'naver.com': '네이버뉴스',
-            'news.naver.com': '네이버뉴스',
-            'yna.co.kr': '연합뉴스',
-            'bbc.com': 'BBC',
-            'cnn.com': 'CNN',
-            'forbes.com': 'Forbes',
-            'economist.com': 'The Economist',
-            'techcrunch.com': 'TechCrunch',
-            'theverge.com': 'The Verge'
-        }
+        # 2. 사이트별 언론사 로고 (네이버 뉴스 등 포털은 원 언론사 이름 사용)
+        for selector in site.press_selectors:
+            logo = soup.select_one(selector)
+            if logo and isinstance(logo, Tag):
+                alt = logo.get('alt', '')
+                if isinstance(alt, str) and alt.strip():
+                    return alt.strip()
+        
+        # 3. 도메인별 하드코딩된 출처 매핑
+        domain_to_publisher = DOMAIN_TO_PUBLISHER
         
         # URL에서 도메인 추출
         from urllib.parse import urlparse
@@ -550,7 +589,7 @@ class WebExtractor:
             if key in domain:
                 return value
         
-        # 3. HTML에서 publisher 정보 찾기
+        # 4. HTML에서 publisher 정보 찾기
         publisher_selectors = [
             '.publisher',
             '.source',
@@ -573,7 +612,7 @@ class WebExtractor:
                     if text and len(text) < 50:
                         return text
         
-        # 4. 도메인명을 출처로 사용 (fallback)
+        # 5. 도메인명을 출처로 사용 (fallback)
         return domain.split('.')[0].title()
     
     def _error_response(self, url: str, error_message: str) -> Dict[str, Any]:
@@ -586,28 +625,11 @@ class WebExtractor:
         }
     
     def _save_to_file(self, data: Dict[str, Any]) -> None:
-        """결과를 파일로 저장"""
-        os.makedirs('extracted_articles', exist_ok=True)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        txt_path = f'extracted_articles/article_{timestamp}.txt'
-        
-        with open(txt_path, 'w', encoding='utf-8') as f:
-            f.write(f"제목: {data['title']}\n")
-            f.write("="*80 + "\n\n")
-            
-            if data['metadata']:
-                f.write("메타 정보:\n")
-                for key, value in data['metadata'].items():
-                    f.write(f"{key}: {value}\n")
-                f.write("-"*80 + "\n\n")
-            
-            f.write("본문:\n")
-            f.write(data['content']['text'])
-        
-        self.logger.info(f"텍스트 파일 저장됨: {txt_path}")
+        """결과를 기사 아카이브에 저장 (URL/본문 해시 색인, 백그라운드 기록)"""
+        if get_article_archive().archive(data):
+            self.logger.info(f"기사 아카이브 저장 요청: {data['url']}")
     
     def close(self) -> None:
         """리소스 정리"""
-        if self.driver:
-            self.driver.quit()
-        self.session.close() 
\ No newline at end of file
+        # 공유 HTTP 클라이언트와 브라우저 풀은 다른 추출기도 사용하므로 닫지 않음
+        # (브라우저 풀은 프로세스 종료 시 정리) 
\ No newline at end of file
@@ -15,6 +15,8 @@ import tweepy
 from openai import OpenAI
 import anthropic
 
+from llm_gateway import estimate_tokens, get_llm_gateway
+
 # 로거 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('x_crawler')
@@ -31,6 +33,8 @@ class XCrawler:
         self.x_client = None
         self.ai_client = None
         self.ai_provider = None
+        self.ai_api_key = None
+        self.llm_gateway = get_llm_gateway()  # NewsConverter 와 같은 제공자/API 키별 호출 제한 공유
         self.influencers = []
         self.collected_posts = []
         self.collection_history = []  # 수집 기록
@@ -113,6 +117,7 @@ class XCrawler:
                 self.perplexity_api_key = api_key
             else:
                 raise ValueError(f"지원하지 않는 AI 제공자: {provider}")
+            self.ai_api_key = api_key
             
             logger.info(f"✅ {provider} AI API 설정 완료")
             return True
@@ -444,8 +449,10 @@ class XCrawler:
             
             logger.info(f"🤖 AI 프롬프트 확인:\n{prompt[:500]}...")
             
+            # 동기 SDK 호출은 게이트웨이에서 스레드로 실행 (이벤트 루프를 막지 않음)
+            tokens = estimate_tokens(prompt, 1000)
             if self.ai_provider == 'openai':
-                response = self.ai_client.chat.completions.create(
+                response = await self.llm_gateway.acall('openai', self.ai_api_key, lambda: self.ai_client.chat.completions.create(
                     model="gpt-4o-mini",
                     messages=[
                         {"role": "system", "content": "X(트위터) 포스팅 요약 전문가임. 영어는 한국어로 번역하고, 짧고 간결한 반말체로 작성. '~했음', '~하는 중', '~될 듯' 같은 X스타일 어미 사용."},
@@ -453,11 +460,11 @@ class XCrawler:
                     ],
                     max_tokens=1000,
                     temperature=0.3
-                )
+                ), tokens)
                 ai_response = response.choices[0].message.content
                 
             elif self.ai_provider == 'anthropic':
-                response = self.ai_client.messages.create(
+                response = await self.llm_gateway.acall('anthropic', self.ai_api_key, lambda: self.ai_client.messages.create(
                     model="claude-3-5-haiku-20241022",
                     max_tokens=1000,
                     temperature=0.3,
@@ -465,7 +472,7 @@ class XCrawler:
                     messages=[
                         {"role": "user", "content": prompt}
                     ]
-                )
+                ), tokens)
                 ai_response = response.content[0].text
                 
             elif self.ai_provider == 'perplexity':
@@ -483,12 +490,12 @@ class XCrawler:
                     'max_tokens': 1000,
                     'temperature': 0.3
                 }
-                response = requests.post(
+                response = await self.llm_gateway.acall('perplexity', self.ai_api_key, lambda: requests.post(
                     'https://api.perplexity.ai/chat/completions',
                     headers=headers,
                     json=data,
                     timeout=60
-                )
+                ), tokens)
                 if response.status_code == 200:
                     result = response.json()
                     ai_response = result['choices'][0]['message']['content']